@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# Time every endpoint script and the run_all orchestrator against the local
+# mock DropsTab server (benchmarks/mock_dropstab.py), under several
+# concurrency settings. No real API calls, no quota used; output goes to a
+# temporary data directory, not data/raw/.
+#
+# Usage:
+#     python benchmarks/bench_fetchers.py
+#     python benchmarks/bench_fetchers.py --items 20000 --latency-ms 80 --workers 1 4 8 --jobs 1 4
+#     python benchmarks/bench_fetchers.py --error-rate 0.02 --throttle-rate 0.01 --output bench.json
+#     python benchmarks/bench_fetchers.py --only coins funding_rounds --skip-orchestrator
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make project root importable so we can use dropstab_base.py
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import dropstab_base
+import dropstab_timeseries
+import run_all_dropstab
+from dropstab_base import DropsTabClient, RateLimiter, RetryPolicy, set_client
+from mock_dropstab import MockDropsTab
+
+
+def _scripts() -> list[tuple[str, str]]:
+    """(key, relative path) of every endpoint script."""
+    paths = sorted((ROOT / "endpoints").glob("*/fetch_*.py"))
+    return [(p.stem.removeprefix("fetch_"), str(p.relative_to(ROOT))) for p in paths]
+
+
+def _isolate(data_dir: Path) -> None:
+    """Point every output directory the scripts use at a fresh `data_dir`."""
+    shutil.rmtree(data_dir, ignore_errors=True)
+    dropstab_base.RAW_DIR = data_dir / "raw"
+    dropstab_base.CHECKPOINT_DIR = data_dir / "raw" / "checkpoints"
+    dropstab_timeseries.TIMESERIES_DIR = data_dir / "timeseries"
+    run_all_dropstab.REPORTS_DIR = data_dir / "reports"
+    dropstab_base.RAW_DIR.mkdir(parents=True)
+
+
+def _measure(label: str, run, mock: MockDropsTab, args, workers: int, jobs: int | None, data_dir: Path) -> dict:
+    _isolate(data_dir)
+    dropstab_base.MAX_WORKERS = workers
+    client = DropsTabClient(
+        base_url=mock.base_url,
+        pool_size=max(dropstab_base.POOL_SIZE, workers * (jobs or 1)),
+        limiter=RateLimiter(rate=args.rate, burst=max(1, int(args.rate))),
+        retry=RetryPolicy(backoff_base=args.backoff),
+    )
+    set_client(client)
+    mock.reset_counts()
+
+    out = io.StringIO()
+    error = None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(sys.stdout if args.verbose else out):
+            run()
+    except BaseException as e:  # keep benchmarking the other targets
+        error = repr(e)
+    seconds = time.perf_counter() - start
+
+    statuses = mock.reset_counts()
+    retries = client.retry_stats.as_dict()
+    set_client(None)
+    return {
+        "target": label,
+        "workers": workers,
+        "jobs": jobs,
+        "seconds": round(seconds, 4),
+        "requests": sum(statuses.values()),
+        "req_per_sec": round(sum(statuses.values()) / seconds, 1) if seconds else None,
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "retries": retries["retries"],
+        "retry_wait_sec": retries["retry_wait_sec"],
+        "error": error,
+    }
+
+
+def _print_row(r: dict) -> None:
+    jobs = "-" if r["jobs"] is None else r["jobs"]
+    line = (
+        f"{r['target']:<66} w={r['workers']:<3} j={jobs:<3} {r['seconds']:8.3f}s "
+        f"{r['requests']:6d} req {r['req_per_sec'] or 0:8.1f} req/s  retries {r['retries']}"
+    )
+    print(line + (f"  ERROR {r['error']}" if r["error"] else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fetch scripts against a mock DropsTab API.")
+    parser.add_argument("--items", type=int, default=2000, help="Items per list endpoint.")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Mock latency per response.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra random latency per response.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of injected 503s.")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of injected 429s.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for injected failures and jitter.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8], help="Page workers to try.")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 4], help="Orchestrator --jobs to try.")
+    parser.add_argument("--rate", type=float, default=0.0, help="Client rate limit, req/s (0 = unlimited).")
+    parser.add_argument("--backoff", type=float, default=0.05, help="Retry backoff base in seconds.")
+    parser.add_argument("--only", nargs="+", default=None, help="Only scripts whose key contains one of these.")
+    parser.add_argument("--skip-orchestrator", action="store_true")
+    parser.add_argument("--output", type=Path, default=None, help="Also write results as JSON.")
+    parser.add_argument("--verbose", action="store_true", help="Show the scripts' own output.")
+    args = parser.parse_args()
+
+    scripts = [
+        (key, rel) for key, rel in _scripts()
+        if not args.only or any(o in key for o in args.only)
+    ]
+    data_dir = Path(tempfile.mkdtemp(prefix="dropstab_bench_"))
+    results = []
+
+    mock = MockDropsTab(
+        items=args.items,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed,
+    )
+    print(
+        f"Mock API on {mock.base_url}: {args.items} items/endpoint, latency {args.latency_ms} ms, "
+        f"503 rate {args.error_rate}, 429 rate {args.throttle_rate}, client rate {args.rate or 'unlimited'}"
+    )
+    try:
+        with mock:
+            for workers in args.workers:
+                for key, rel in scripts:
+                    r = _measure(rel, lambda: run_all_dropstab.load_main(rel)(), mock, args, workers, None, data_dir)
+                    results.append(r)
+                    _print_row(r)
+
+            if not args.skip_orchestrator:
+                for workers in args.workers:
+                    for jobs in args.jobs:
+                        def run(jobs=jobs):
+                            job_list = run_all_dropstab.build_jobs(set(), delta=False, index=False)
+                            failed = [
+                                r for r in run_all_dropstab.run_jobs(job_list, max_parallel=jobs)
+                                if r.status != "ok"
+                            ]
+                            if failed:
+                                raise RuntimeError(f"{len(failed)} job(s) failed")
+
+                        r = _measure("run_all_dropstab.py", run, mock, args, workers, jobs, data_dir)
+                        results.append(r)
+                        _print_row(r)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    if args.output:
+        args.output.write_text(json.dumps({"settings": vars(args) | {"output": str(args.output)},
+                                           "results": results}, indent=2, default=str))
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# Compare the JSON backends (stdlib json, orjson, msgspec) on snapshot-sized
+# payloads: decoding from bytes (as GET and the snapshot readers do), compact
+# encoding (checkpoints, delta state) and indented encoding (snapshot files).
+# Backends that are not installed are skipped.
+#
+# By default synthetic snapshots shaped like the largest real ones are built
+# (exchange pairs, token unlocks with nested schedules, hourly chart points);
+# pass existing snapshot files to measure those instead.
+#
+# Usage:
+#     python benchmarks/bench_json.py
+#     python benchmarks/bench_json.py --items 50000 --repeat 5 --output bench_json.json
+#     python benchmarks/bench_json.py --snapshots data/raw/exchange_pairs_binance_*.json
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Make project root importable so we can use dropstab_base.py
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from dropstab_base import JSON_BACKENDS, _json_backend
+
+
+def _envelope(endpoint: str, items: list) -> dict:
+    return {"data_ts_utc": "2025-01-01T00:00:00Z", "status": "ok", "endpoint": endpoint, "items": items}
+
+
+def synthetic_snapshots(n: int) -> dict[str, bytes]:
+    """`{name: snapshot bytes}` of `n` items each, written by the stdlib as snapshots are."""
+    pairs = [
+        {"symbol": f"C{i}/USDT", "base": f"C{i}", "quote": "USDT", "price": 1000 / (i + 1),
+         "volume24h": i * 1.5, "spread": 0.0012, "updatedAt": "2025-01-01T00:00:00"}
+        for i in range(n)
+    ]
+    unlocks = [
+        {"slug": f"coin-{i}", "name": f"Coin {i}", "nextUnlockDate": "2025-06-01T00:00:00",
+         "nextUnlockAmount": i * 10, "allocations": [
+             {"name": name, "share": share, "schedule": [
+                 {"date": f"2025-{m:02d}-01", "amount": i * m, "percent": m / 12} for m in range(1, 13)
+             ]}
+             for name, share in (("Team", 0.2), ("Investors", 0.15), ("Ecosystem", 0.3))
+         ]}
+        for i in range(max(1, n // 20))
+    ]
+    chart = [
+        {"timestamp": 1_700_000_000_000 + i * 3_600_000, "price": 100 + (i % 97) / 7,
+         "volume": 1e6 + i, "marketCap": 1e9 + i * 3}
+        for i in range(n)
+    ]
+    return {
+        "exchange_pairs": json.dumps(_envelope("exchanges/{exchangeSlug}/pairs", pairs), indent=2).encode(),
+        "token_unlocks": json.dumps(_envelope("tokenUnlocks", unlocks), indent=2).encode(),
+        "chart_hourly": json.dumps(_envelope("coins/history/chart-by-interval/{slug}", chart), indent=2).encode(),
+    }
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(name: str, raw: bytes, backends: list, repeat: int) -> list[dict]:
+    obj = json.loads(raw)
+    results = []
+    for backend in backends:
+        results.append({
+            "snapshot": name,
+            "backend": backend.name,
+            "mb": round(len(raw) / 1e6, 2),
+            "decode_sec": round(_best_of(repeat, lambda: backend.loads(raw)), 4),
+            "encode_sec": round(_best_of(repeat, lambda: backend.dumps(obj)), 4),
+            "encode_indent_sec": round(_best_of(repeat, lambda: backend.dumps(obj, indent=True)), 4),
+        })
+    return results
+
+
+def _print_row(r: dict, baseline: dict) -> None:
+    def cell(key: str) -> str:
+        speedup = baseline[key] / r[key] if r[key] else float("inf")
+        return f"{r[key]:8.4f}s ({speedup:4.1f}x)"
+
+    print(
+        f"{r['snapshot']:<28} {r['backend']:<8} {r['mb']:7.2f} MB  decode {cell('decode_sec')}  "
+        f"encode {cell('encode_sec')}  indent {cell('encode_indent_sec')}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the JSON backends on snapshot payloads.")
+    parser.add_argument("--items", type=int, default=20000, help="Items per synthetic snapshot.")
+    parser.add_argument("--snapshots", type=Path, nargs="+", default=None, help="Snapshot files to use instead.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept).")
+    parser.add_argument("--output", type=Path, default=None, help="Also write results as JSON.")
+    args = parser.parse_args()
+
+    backends = [b for b in map(_json_backend, JSON_BACKENDS) if b is not None]
+    missing = [name for name in JSON_BACKENDS if name not in {b.name for b in backends}]
+    print(f"Backends: {', '.join(b.name for b in backends)}"
+          + (f" (not installed: {', '.join(missing)})" if missing else ""))
+
+    if args.snapshots:
+        snapshots = {path.name: path.read_bytes() for path in args.snapshots}
+    else:
+        snapshots = synthetic_snapshots(args.items)
+
+    results = []
+    for name, raw in snapshots.items():
+        rows = bench(name, raw, backends, args.repeat)
+        baseline = next(r for r in rows if r["backend"] == "json")
+        for r in rows:
+            _print_row(r, baseline)
+        results.extend(rows)
+
+    if args.output:
+        args.output.write_text(json.dumps({"settings": vars(args) | {"output": str(args.output)},
+                                           "results": results}, indent=2, default=str))
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
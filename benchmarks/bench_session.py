@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Compare per-request latency of bare requests.get vs the pooled DropsTabClient
+# against a local mock server (no real API calls, no quota used).
+#
+# Usage:
+#     python benchmarks/bench_session.py --calls 500
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+
+import requests
+
+# Make project root importable so we can use dropstab_base.py
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from dropstab_base import HEADERS, DropsTabClient, RateLimiter
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so the server honours keep-alive between requests
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps(
+            {"status": "ok", "data": {"content": [], "currentPage": 0, "totalPages": 1}}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _time_calls(call, n: int) -> list[float]:
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    ms = sorted(x * 1000 for x in latencies)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(
+        f"{label:<16} mean {statistics.mean(ms):7.3f} ms | "
+        f"median {statistics.median(ms):7.3f} ms | p95 {p95:7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call HTTP.")
+    parser.add_argument("--calls", type=int, default=300, help="Requests per variant.")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+
+    try:
+        bare = _time_calls(
+            lambda: requests.get(f"{base_url}/coins", headers=HEADERS, timeout=10).json(),
+            args.calls,
+        )
+        # Unlimited private limiter: measure the transport, not the rate budget
+        with DropsTabClient(base_url=base_url, limiter=RateLimiter(rate=0)) as client:
+            pooled = _time_calls(lambda: client.get("coins"), args.calls)
+    finally:
+        server.shutdown()
+
+    print(f"{args.calls} calls per variant against {base_url}")
+    _report("requests.get", bare)
+    _report("DropsTabClient", pooled)
+    print(f"speedup (mean): {statistics.mean(bare) / statistics.mean(pooled):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# Local stand-in for the DropsTab API, for benchmarks (no real API calls, no quota used).
+#
+# Serves deterministic synthetic data for the list endpoints (paginated with
+# page/pageSize -> content/currentPage/totalPages), exchanges/{slug}/pairs,
+# the detail endpoints and the history endpoints (price, chart-by-interval,
+# chart-by-timeframe, fear-index). Latency (fixed, plus per item for list
+# pages), the largest accepted pageSize and injected 429/5xx responses are
+# configurable.
+#
+# Usage (standalone):
+#     python benchmarks/mock_dropstab.py --port 8765 --latency-ms 50 --error-rate 0.02
+#
+# Usage (in-process):
+#     with MockDropsTab(items=5000, latency=0.05) as mock:
+#         set_client(DropsTabClient(base_url=mock.base_url, limiter=RateLimiter(rate=0)))
+
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta, UTC
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Paginated list endpoints and the item generator used for each
+LIST_ENDPOINTS = {
+    "coins": "coin",
+    "coins/supported": "coin",
+    "fundingRounds": "round",
+    "investors": "investor",
+    "tokenUnlocks": "unlock",
+    "tokenUnlocks/supportedCoins": "coin",
+    "cryptoActivities": "activity",
+    "exchanges": "exchange",
+}
+
+# Step between chart points per interval
+INTERVAL_STEPS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+# Largest chart-by-interval range (in points) answered; longer ranges get a 400
+MAX_CHART_POINTS = 5000
+
+
+def _item(kind: str, i: int) -> dict:
+    """Deterministic synthetic record `i` of a kind."""
+    slug = f"{kind}-{i}"
+    date = (datetime(2025, 1, 1, tzinfo=UTC) - timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%S")
+    if kind == "coin":
+        return {"id": i, "slug": slug, "symbol": f"C{i}", "name": f"Coin {i}", "rank": i + 1,
+                "price": round(1000 / (i + 1), 6), "marketCap": 10**9 // (i + 1)}
+    if kind == "round":
+        return {"id": i, "date": date, "coin": {"slug": f"coin-{i % 500}"}, "stage": "Seed",
+                "fundsRaised": 1_000_000 + i, "investors": [{"slug": f"investor-{i % 97}"}]}
+    if kind == "unlock":
+        return {"slug": f"coin-{i}", "nextUnlockDate": date, "nextUnlockAmount": i * 10}
+    if kind == "activity":
+        return {"id": i, "date": date, "coins": [{"slug": f"coin-{i % 500}"}], "type": "listing",
+                "title": f"Activity {i}"}
+    if kind == "pair":
+        return {"symbol": f"C{i}/USDT", "base": f"C{i}", "quote": "USDT", "volume24h": i * 1.5}
+    return {"id": i, "slug": slug, "name": f"{kind.title()} {i}"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so the server honours keep-alive between requests
+    protocol_version = "HTTP/1.1"
+    mock: "MockDropsTab"
+
+    def do_GET(self):
+        mock = self.mock
+        url = urlparse(self.path)
+        path = url.path.split("/api/v1/", 1)[-1].strip("/")
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        delay = mock.latency + mock.jitter * mock.roll()
+        delay += mock.item_latency * mock.page_items(path, params)
+        if delay:
+            time.sleep(delay)
+
+        roll = mock.roll()
+        if roll < mock.throttle_rate:
+            return self._send(429, {"status": "error", "message": "rate limited"},
+                              {"Retry-After": str(mock.retry_after)})
+        if roll < mock.throttle_rate + mock.error_rate:
+            return self._send(503, {"status": "error", "message": "injected failure"})
+
+        try:
+            status, data = mock.route(path, params)
+        except (KeyError, ValueError) as e:
+            status, data = 400, {"message": str(e)}
+        body = {"status": "ok", "data": data} if status == 200 else {"status": "error", **data}
+        self._send(status, body)
+
+    def _send(self, status: int, body: dict, headers: dict | None = None):
+        raw = json.dumps(body).encode()
+        self.mock.count(status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+class MockDropsTab:
+    """
+    Threaded local DropsTab server.
+
+    Args:
+        items: Items per list endpoint (and pairs per exchange).
+        latency: Fixed delay per response, in seconds.
+        jitter: Extra uniform random delay per response, up to this many seconds.
+        error_rate: Fraction of requests answered with 503.
+        throttle_rate: Fraction of requests answered with 429.
+        retry_after: Retry-After header value sent with 429s.
+        seed: Seed of the RNG drawing latency jitter and injected failures.
+        port: Port to listen on (0 = any free port).
+        item_latency: Extra delay per item of a list page, in seconds.
+        max_page_size: Largest pageSize accepted; larger ones get a 400 (None = any).
+    """
+
+    def __init__(
+        self,
+        items: int = 2000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 0,
+        seed: int = 1,
+        port: int = 0,
+        item_latency: float = 0.0,
+        max_page_size: int | None = None,
+    ):
+        self.items = items
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.seed = seed
+        self.item_latency = item_latency
+        self.max_page_size = max_page_size
+        self.statuses = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        handler = type("Handler", (_Handler,), {"mock": self})
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1"
+
+    def roll(self) -> float:
+        """Next number from the seeded RNG shared by all handler threads."""
+        with self._lock:
+            return self._rng.random()
+
+    def count(self, status: int) -> None:
+        with self._lock:
+            self.statuses[status] += 1
+
+    def reset_counts(self) -> dict:
+        """Return and clear the per-status response counts."""
+        with self._lock:
+            counts, self.statuses = dict(self.statuses), Counter()
+        return counts
+
+    # Routing
+
+    def page_items(self, path: str, params: dict) -> int:
+        """Items a list page request returns (0 for anything else)."""
+        parts = path.split("/")
+        listed = path in LIST_ENDPOINTS or parts[-1] == "pairs" or (len(parts) == 3 and parts[1] == "coin")
+        if not listed or "pageSize" not in params:
+            return 0
+        size = int(params["pageSize"])
+        return max(0, min(size, self.items - int(params.get("page", 0)) * size))
+
+    def _page(self, kind: str, params: dict) -> dict:
+        page = int(params.get("page", 0))
+        size = int(params.get("pageSize", 100))
+        if self.max_page_size is not None and size > self.max_page_size:
+            raise ValueError(f"pageSize must be at most {self.max_page_size}")
+        total_pages = max(1, -(-self.items // size))
+        start = page * size
+        content = [_item(kind, i) for i in range(start, min(start + size, self.items))]
+        return {"content": content, "currentPage": page, "totalPages": total_pages,
+                "pageSize": size, "totalElements": self.items}
+
+    @staticmethod
+    def _points(params: dict, step: timedelta, value, max_points: int | None = None) -> list:
+        start = datetime.fromisoformat(params["from"]).replace(tzinfo=UTC)
+        end = datetime.fromisoformat(params.get("to") or "2025-01-01T00:00:00").replace(tzinfo=UTC)
+        if max_points is not None and (end - start) / step > max_points:
+            raise ValueError(f"range too large: more than {MAX_CHART_POINTS} points")
+        points, ts = [], start
+        while ts <= end:
+            points.append(value(int(ts.timestamp() * 1000)))
+            ts += step
+        return points
+
+    def route(self, path: str, params: dict) -> tuple[int, object]:
+        if path in LIST_ENDPOINTS:
+            return 200, self._page(LIST_ENDPOINTS[path], params)
+
+        parts = path.split("/")
+        if parts[0] == "exchanges" and len(parts) == 3 and parts[2] == "pairs":
+            return 200, self._page("pair", params)
+        if parts[:2] == ["coins", "history"] and len(parts) >= 3:
+            kind = parts[2]
+            if kind == "price":
+                return 200, {"price": 100.0, "date": params["date"]}
+            if kind == "chart-by-interval":
+                step = INTERVAL_STEPS[params.get("interval", "hour")]
+                return 200, self._points(
+                    params, step, lambda ms: [ms, 100 + ms % 7, 1e6, 1e9], MAX_CHART_POINTS
+                )
+            if kind == "chart-by-timeframe":
+                now = int(datetime(2025, 1, 1, tzinfo=UTC).timestamp() * 1000)
+                return 200, [[now - i * 3_600_000, 100.0, 1e6, 1e9] for i in range(168)][::-1]
+            if kind == "fear-index":
+                return 200, self._points(
+                    params, timedelta(days=1),
+                    lambda ms: {"timestamp": ms, "value": ms % 100, "label": "Fear" if ms % 100 < 50 else "Greed"},
+                )
+        if len(parts) == 3 and parts[:2] == ["coins", "detailed"]:
+            return 200, _item("coin", zlib.crc32(parts[2].encode()) % 10_000)
+        if len(parts) == 3 and parts[:2] == ["tokenUnlocks", "chart"]:
+            now = int(datetime(2025, 1, 1, tzinfo=UTC).timestamp() * 1000)
+            return 200, [{"timestamp": now + i * 86_400_000, "unlocked": i * 1000} for i in range(365)]
+        if len(parts) == 3 and parts[1] == "coin" and parts[0] in ("fundingRounds", "cryptoActivities"):
+            return 200, self._page(LIST_ENDPOINTS[parts[0]], params)
+        if len(parts) == 2 and parts[0] in ("investors", "exchanges", "tokenUnlocks", "fundingRounds",
+                                            "cryptoActivities"):
+            return 200, {"slug": parts[1], "name": parts[1].title()}
+        return 404, {"message": f"unknown endpoint {path}"}
+
+    # Lifecycle
+
+    def start(self) -> "MockDropsTab":
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "MockDropsTab":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local mock DropsTab API.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--items", type=int, default=2000, help="Items per list endpoint.")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 503 responses.")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429 responses.")
+    parser.add_argument("--item-latency-ms", type=float, default=0.0, help="Extra latency per list item.")
+    parser.add_argument("--max-page-size", type=int, default=None, help="Largest pageSize accepted.")
+    args = parser.parse_args()
+
+    mock = MockDropsTab(
+        items=args.items,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        port=args.port,
+        item_latency=args.item_latency_ms / 1000,
+        max_page_size=args.max_page_size,
+    )
+    print(f"Mock DropsTab API on {mock.base_url} (Ctrl+C to stop)")
+    try:
+        mock.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
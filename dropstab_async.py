@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Asyncio counterpart of the HTTP helpers in dropstab_base.py (aiohttp backend).
+
+Sits alongside the sync API: it shares the same configuration (API_BASE,
+HEADERS, PAGE_SIZE, ...), the same process/cross-process RateLimiter and
+the same RetryPolicy/RetryBudget types, so sync scripts and async services
+draw from one rate budget. Requests are recorded in the shared client's
+RequestMetrics, so async traffic shows up in run reports and Prometheus
+output too.
+
+Typical usage:
+
+    import asyncio
+    from dropstab_async import AsyncDropsTabClient
+
+    async def main():
+        async with AsyncDropsTabClient(limit=20) as client:
+            async for content in client.paginate("coins"):
+                ...
+            details = await client.get_many(
+                [f"coins/detailed/{slug}" for slug in slugs],
+                max_concurrency=50,
+            )
+
+    asyncio.run(main())
+
+Requires `aiohttp` (optional dependency, not needed by the sync scripts).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency
+    aiohttp = None
+
+from dropstab_base import (
+    API_BASE,
+    PAGE_SIZE,
+    POOL_SIZE,
+    MAX_WORKERS,
+    RateLimiter,
+    RequestEvent,
+    RequestMetrics,
+    RetryBudget,
+    RetryPolicy,
+    RetryStats,
+    HTTPStatusError,
+    endpoint_label,
+    get_headers,
+    get_limiter,
+    get_serializer,
+    log_page,
+    parse_retry_after,
+    request_metrics,
+)
+
+
+class AsyncDropsTabClient:
+    """
+    Async HTTP client backed by one pooled `aiohttp.ClientSession`.
+
+    Use as an async context manager (or call `close()`). Every attempt takes
+    a token from `limiter` without blocking the event loop (a limiter shared
+    through a state file is locked and read in a worker thread); failed
+    attempts are retried per `retry` while `retry_budget` lasts. Cancelling
+    a task that awaits `get`/`paginate` cancels its in-flight requests.
+
+    Args:
+        base_url: API root that relative paths are resolved against.
+        headers: Default headers sent with every request (defaults to `get_headers()`).
+        limit: Max simultaneous connections held by the session.
+        limiter: Rate limiter to draw from (defaults to the shared `get_limiter()`).
+        retry: Retry policy (defaults to `RetryPolicy()`).
+        retry_budget: Retry budget for this client's run (defaults to RETRY_BUDGET).
+        metrics: Where attempts are recorded (defaults to `request_metrics()`,
+            shared with the sync client).
+    """
+
+    def __init__(
+        self,
+        base_url: str = API_BASE,
+        headers: dict | None = None,
+        limit: int = POOL_SIZE,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        metrics: RequestMetrics | None = None,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncDropsTabClient requires aiohttp. Install it with `pip install aiohttp`."
+            )
+        self.base_url = base_url.rstrip("/")
+        self.headers = dict(get_headers() if headers is None else headers)
+        self.limit = limit
+        self.limiter = limiter if limiter is not None else get_limiter()
+        self.retry = retry or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.retry_stats = RetryStats()
+        self.metrics = metrics if metrics is not None else request_metrics()
+        self._session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self) -> "AsyncDropsTabClient":
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=30),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session and all pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def url_for(self, path: str) -> str:
+        """Resolve a full URL or a path relative to `base_url`."""
+        return path if path.startswith("http") else f"{self.base_url}/{path.lstrip('/')}"
+
+    async def _limiter_call(self, method, *args):
+        """Call a limiter method; file-backed limiters do blocking I/O, so off the loop."""
+        if self.limiter.state_file is None:
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    async def _acquire(self) -> None:
+        while True:
+            wait = await self._limiter_call(self.limiter.try_acquire)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _is_retryable_error(self, exc: Exception) -> bool:
+        if isinstance(exc, (asyncio.TimeoutError, aiohttp.ServerTimeoutError)):
+            return self.retry.retry_read_timeouts
+        if isinstance(exc, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+            return self.retry.retry_connection_errors
+        return False
+
+    async def get(self, path: str, params: dict | None = None, timeout: int = 10):
+        """
+        Async GET with retries per `self.retry`.
+
+        Args:
+            path: Either a full URL or a path relative to `base_url`.
+            params: Optional query parameters dict.
+            timeout: Total timeout per attempt, in seconds.
+
+        Returns:
+            Parsed JSON (usually a dict), or response text if JSON parsing fails.
+
+        Raises:
+            HTTPStatusError: if the response is not OK (status >= 400)
+                after retries are exhausted.
+            aiohttp.ClientError / asyncio.TimeoutError: on transport errors
+                that are not retryable or persist after retries.
+        """
+        session = self._ensure_session()
+        url = self.url_for(path)
+        params = params or {}
+        endpoint = endpoint_label(path)
+
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            await self._acquire()
+            sent = time.perf_counter()
+            try:
+                async with session.get(
+                    url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as resp:
+                    status, headers = resp.status, resp.headers
+                    body = await resp.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                self.metrics.record(RequestEvent(
+                    endpoint, url, None, time.perf_counter() - sent,
+                    throttled=sent - start, error=type(exc).__name__,
+                ))
+                if not self._is_retryable_error(exc):
+                    raise
+                error, reason, retry_after = exc, type(exc).__name__, None
+            else:
+                self.metrics.record(RequestEvent(
+                    endpoint, url, status, time.perf_counter() - sent,
+                    bytes=len(body), throttled=sent - start,
+                ))
+                await self._limiter_call(self.limiter.observe, status, headers)
+                if status not in self.retry.statuses:
+                    break
+                error, reason = None, str(status)
+                retry_after = parse_retry_after(headers.get("Retry-After"))
+
+            attempt += 1
+            exhausted = attempt >= self.retry.max_attempts
+            if exhausted or not self.retry_budget.try_spend():
+                self.retry_stats.record_give_up(budget_exhausted=not exhausted)
+                if error is not None:
+                    raise error
+                break  # report the HTTP error below
+
+            wait = self.retry.delay(attempt - 1, retry_after)
+            self.retry_stats.record_retry(reason, wait)
+            self.metrics.record_retry(endpoint, wait)
+            print(
+                f"[retry] GET {path} failed ({reason}); "
+                f"attempt {attempt + 1}/{self.retry.max_attempts} in {wait:.1f}s"
+            )
+            await asyncio.sleep(wait)
+
+        # Try to decode JSON; fall back to raw text
+        try:
+            payload = get_serializer().loads(body)
+        except ValueError:
+            payload = body.decode(errors="replace")
+
+        if status >= 400:
+            raise HTTPStatusError(
+                f"GET {status} :: {url}\n"
+                f"Params={params}\n"
+                f"Resp={payload}",
+                status,
+                payload,
+            )
+
+        return payload
+
+    async def get_many(
+        self,
+        paths: list[str],
+        params: dict | None = None,
+        max_concurrency: int = 50,
+    ) -> list:
+        """
+        GET many paths concurrently (at most `max_concurrency` at once).
+
+        Results come back in the order of `paths`. The first failure cancels
+        the remaining requests and is re-raised.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def one(path: str):
+            async with semaphore:
+                return await self.get(path, params=params)
+
+        tasks = [asyncio.ensure_future(one(path)) for path in paths]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_page(self, path: str, params: dict, page: int, page_size: int) -> dict:
+        resp = await self.get(path, params={**params, "page": page, "pageSize": page_size})
+        return resp.get("data", {}) if isinstance(resp, dict) else {}
+
+    async def paginate(
+        self,
+        path: str,
+        params: dict | None = None,
+        page_size: int = PAGE_SIZE,
+        max_concurrency: int = MAX_WORKERS,
+        label: str | None = None,
+    ) -> AsyncIterator[list]:
+        """
+        Async version of `dropstab_base.iter_pages`.
+
+        Reads page 0 to learn `totalPages`, then fetches the remaining pages
+        concurrently (at most `max_concurrency` in flight, `2 * max_concurrency`
+        scheduled or buffered) and yields each page's `content` list strictly in page order.
+        Leaving the loop early cancels pages still in flight.
+        """
+        label = label or path
+        params = dict(params or {})
+
+        first = await self._fetch_page(path, params, 0, page_size)
+        content = first.get("content", [])
+        log_page(label, first, len(content))
+        yield content
+
+        total_pages = first.get("totalPages")
+        if not content or total_pages is None or total_pages <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(page: int) -> dict:
+            async with semaphore:
+                return await self._fetch_page(path, params, page, page_size)
+
+        window = 2 * max(1, max_concurrency)
+        remaining = iter(range(1, total_pages))
+        pending: deque[asyncio.Task] = deque()
+        try:
+            for page in remaining:
+                pending.append(asyncio.ensure_future(fetch(page)))
+                if len(pending) >= window:
+                    break
+
+            while pending:
+                data = await pending.popleft()
+                page = next(remaining, None)
+                if page is not None:
+                    pending.append(asyncio.ensure_future(fetch(page)))
+
+                content = data.get("content", [])
+                log_page(label, data, len(content))
+                if not content:
+                    break
+                yield content
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def fetch_all_pages(self, path: str, params: dict | None = None, **kwargs) -> list:
+        """Collect every item of a paginated endpoint, in page order."""
+        items: list = []
+        async for content in self.paginate(path, params, **kwargs):
+            items.extend(content)
+        return items
+
+
+__all__ = [
+    "AsyncDropsTabClient",
+]
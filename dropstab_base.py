@@ -19,15 +19,45 @@ Typical usage in endpoint scripts:
         DATA_DIR, RAW_DIR,
         GET, utc_now_iso, today_tag,
     )
+
+Paginated list endpoints can use `fetch_all_pages` (or `iter_pages`),
+which reads page 0 and then fetches the remaining pages concurrently.
+Passing `checkpoint=<name>` persists every page under RAW_DIR/checkpoints/
+so a rerun resumes after the last completed page. `SnapshotWriter` streams
+pages into the JSON snapshot as they arrive instead of building one big list.
+
+Every request made through `GET` is recorded per endpoint (latency
+histogram, bytes, status codes, retries, rate-limit waits, cache outcomes);
+`request_metrics()` returns them as a dict or Prometheus text.
 """
 
 from __future__ import annotations
 
+import bisect
+import json
+import math
+import os
+import random
+import re
+import shutil
+import textwrap
+import threading
 import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from datetime import datetime, UTC
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # imported on first use at runtime (see _requests)
+    import requests
 
-import requests
+try:  # POSIX only; without it the rate limiter coordinates threads, not processes
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
 
 
 # Paths & directories
@@ -39,27 +69,39 @@ ROOT_DIR = Path(__file__).resolve().parent
 DATA_DIR = ROOT_DIR / "data"
 RAW_DIR = DATA_DIR / "raw"
 
-DATA_DIR.mkdir(exist_ok=True)
-RAW_DIR.mkdir(exist_ok=True)
+# Per-crawl page checkpoints, so interrupted paginated crawls can resume
+CHECKPOINT_DIR = RAW_DIR / "checkpoints"
+
+# Directories are created on first write (SnapshotWriter, atomic_write, ...),
+# not at import, so importing this module has no side effects.
 
 
 # API configuration
 API_BASE = "https://public-api.dropstab.com/api/v1"
 API_KEY_FILE = ROOT_DIR / "DropsTab_API_key.txt"
 
+# Environment variable that takes precedence over API_KEY_FILE
+API_KEY_ENV = "DROPSTAB_API_KEY"
+
 
 def _load_api_key() -> str:
     """
-    Load the DropsTab API key from DropsTab_API_key.txt (first non-empty line).
+    Load the DropsTab API key from $DROPSTAB_API_KEY, or else from
+    DropsTab_API_key.txt (first non-empty line).
 
     Raises:
-        FileNotFoundError: if the key file is missing.
+        FileNotFoundError: if neither is set and the key file is missing.
         RuntimeError: if the file exists but appears to be empty.
     """
+    key = os.environ.get(API_KEY_ENV, "").strip()
+    if key:
+        return key
+
     if not API_KEY_FILE.is_file():
         raise FileNotFoundError(
             f"API key file not found: {API_KEY_FILE}. "
-            "Create it and put your DropsTab Pro API key in the first line."
+            "Create it and put your DropsTab Pro API key in the first line "
+            f"(or set {API_KEY_ENV})."
         )
 
     lines = [line.strip() for line in API_KEY_FILE.read_text().splitlines()]
@@ -72,12 +114,37 @@ def _load_api_key() -> str:
     )
 
 
-DT_API_KEY = _load_api_key()
+_headers: dict | None = None
+_config_lock = threading.Lock()
 
-HEADERS = {
-    "x-dropstab-api-key": DT_API_KEY,
-    "accept": "*/*",
-}
+
+def get_headers() -> dict:
+    """Default request headers; the API key is loaded on the first call."""
+    global _headers
+    if _headers is None:
+        with _config_lock:
+            if _headers is None:
+                _headers = {
+                    "x-dropstab-api-key": _load_api_key(),
+                    "accept": "*/*",
+                }
+    return _headers
+
+
+def __getattr__(name: str):
+    """Resolve DT_API_KEY and HEADERS lazily, on first access."""
+    if name == "HEADERS":
+        return get_headers()
+    if name == "DT_API_KEY":
+        return get_headers()["x-dropstab-api-key"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _requests():
+    """Import `requests` on first use, keeping `import dropstab_base` cheap."""
+    import requests
+
+    return requests
 
 
 # Shared constants
@@ -88,6 +155,36 @@ PAGE_SIZE: int = 100
 # Default sleep between API calls, in seconds
 SLEEP_SEC: float = 0.75
 
+# Write snapshots without indentation (smaller, faster) instead of indent=2
+COMPACT_JSON: bool = False
+
+# Default number of pooled keep-alive connections held by the shared client
+POOL_SIZE: int = 10
+
+# Default number of pages fetched concurrently by the paginator
+MAX_WORKERS: int = 4
+
+# Default request budget shared by all callers, in requests per second
+REQUESTS_PER_SEC: float = 4.0
+
+# Max requests that may be sent back-to-back after an idle period
+RATE_BURST: int = 4
+
+# Max retries (across all requests) allowed in one run of a script
+RETRY_BUDGET: int = 200
+
+# Token-bucket state shared by all scripts/processes using the default limiter
+RATE_LIMIT_STATE_FILE = DATA_DIR / "ratelimit_state.json"
+
+# Upper bounds (seconds) of the per-endpoint request latency histogram buckets
+LATENCY_BUCKETS: tuple = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# JSON backends in order of preference; "json" (stdlib) is always available
+JSON_BACKENDS: tuple = ("orjson", "msgspec", "json")
+
+# Environment variable forcing one JSON backend (e.g. DROPSTAB_JSON=json)
+JSON_BACKEND_ENV = "DROPSTAB_JSON"
+
 
 # Time helpers
 
@@ -101,11 +198,928 @@ def today_tag() -> str:
     return datetime.now(UTC).strftime("%Y%m%d")
 
 
+def latest_snapshot(name: str) -> Path | None:
+    """
+    Newest `RAW_DIR/<name>_YYYYMMDD.json` snapshot, or None if there is none.
+
+    Example: `latest_snapshot("coins_all")` -> RAW_DIR / "coins_all_20251116.json".
+    """
+    pattern = re.compile(rf"{re.escape(name)}_(\d{{8}})\.json")
+    matches = [p for p in RAW_DIR.glob(f"{name}_*.json") if pattern.fullmatch(p.name)]
+    return max(matches, key=lambda p: p.name) if matches else None
+
+
+def latest_snapshots(prefix: str) -> dict[str, Path]:
+    """
+    Newest `RAW_DIR/<prefix>_<key>_YYYYMMDD.json` snapshot for every `<key>`,
+    for endpoints written once per entity (pairs per exchange, charts per coin).
+
+    Example: `latest_snapshots("exchange_pairs")` ->
+    `{"binance": RAW_DIR / "exchange_pairs_binance_20251116.json", ...}`.
+    """
+    pattern = re.compile(rf"{re.escape(prefix)}_(?P<key>.+)_\d{{8}}\.json")
+    latest: dict[str, Path] = {}
+    for path in sorted(RAW_DIR.glob(f"{prefix}_*_*.json")):
+        match = pattern.fullmatch(path.name)
+        if match:
+            latest[match["key"]] = path  # sorted, so the newest tag wins
+    return latest
+
+
+# JSON serialization
+
+@dataclass(frozen=True)
+class JsonSerializer:
+    """
+    One JSON backend behind a common interface (see `get_serializer`).
+
+    `loads` accepts bytes or str, so responses are decoded straight from the
+    body bytes. `dumps` returns str: compact, or indented by two spaces like
+    `json.dumps(obj, indent=2)`. Fast backends fall back to the stdlib for
+    the few inputs they refuse (NaN literals, integers beyond 64 bits, non-str
+    keys); decode errors are always raised as ValueError.
+
+    Attributes:
+        name: Backend name ("orjson", "msgspec" or "json").
+    """
+
+    name: str
+    _loads: Callable[[bytes | str], object]
+    _dumps: Callable[[object, bool], str]
+    _convert: Callable[[object, type], object] | None = None
+
+    def loads(self, data: bytes | str) -> object:
+        try:
+            return self._loads(data)
+        except ValueError:
+            if self.name == "json":
+                raise
+        except Exception:  # msgspec.DecodeError is not a ValueError
+            pass
+        return json.loads(data)
+
+    def dumps(self, obj, indent: bool = False) -> str:
+        try:
+            return self._dumps(obj, indent)
+        except (TypeError, OverflowError):
+            if self.name == "json":
+                raise
+        return json.dumps(obj, indent=2) if indent else json.dumps(obj, separators=(",", ":"))
+
+    def loads_as(self, data: bytes | str, type_: type):
+        """
+        Decode and validate into `type_` (a msgspec.Struct, dataclass,
+        `list[...]`, ...). Needs msgspec, whichever backend decodes.
+
+        Raises:
+            ImportError: if msgspec is not installed.
+            ValueError: if the data does not match `type_`.
+        """
+        convert = self._convert or _msgspec_convert()
+        obj = self.loads(data)
+        try:
+            return convert(obj, type_)
+        except Exception as exc:  # msgspec.ValidationError
+            raise ValueError(f"JSON does not match {type_}: {exc}") from exc
+
+
+def _msgspec_convert() -> Callable[[object, type], object]:
+    try:
+        import msgspec
+    except ImportError:
+        raise ImportError(
+            "Typed decoding needs msgspec. Install it with: pip install msgspec"
+        ) from None
+    return msgspec.convert
+
+
+def _json_backend(name: str) -> JsonSerializer | None:
+    """Build the named backend, or None if its package is not installed."""
+    if name == "json":
+        def dumps(obj, indent: bool) -> str:
+            return json.dumps(obj, indent=2) if indent else json.dumps(obj, separators=(",", ":"))
+
+        return JsonSerializer("json", json.loads, dumps)
+
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            return None
+
+        def dumps(obj, indent: bool) -> str:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+        return JsonSerializer("orjson", orjson.loads, dumps)
+
+    if name == "msgspec":
+        try:
+            import msgspec
+        except ImportError:
+            return None
+        encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+
+        def dumps(obj, indent: bool) -> str:
+            raw = encoder.encode(obj)
+            return (msgspec.json.format(raw, indent=2) if indent else raw).decode()
+
+        return JsonSerializer("msgspec", decoder.decode, dumps, msgspec.convert)
+
+    raise ValueError(f"Unknown JSON backend {name!r}; choose from {', '.join(JSON_BACKENDS)}")
+
+
+_serializer: JsonSerializer | None = None
+
+
+def set_serializer(name: str | None = None) -> JsonSerializer:
+    """
+    Select the JSON backend used by `GET`, snapshots and checkpoints.
+
+    Args:
+        name: Backend name; None picks the first installed of JSON_BACKENDS,
+            unless $DROPSTAB_JSON names one.
+
+    Raises:
+        ImportError: if the requested backend is not installed.
+    """
+    global _serializer
+    name = name or os.environ.get(JSON_BACKEND_ENV) or None
+    if name is not None:
+        serializer = _json_backend(name)
+        if serializer is None:
+            raise ImportError(f"JSON backend {name!r} is not installed (pip install {name})")
+    else:
+        serializer = next(s for s in map(_json_backend, JSON_BACKENDS) if s is not None)
+    _serializer = serializer
+    return serializer
+
+
+def get_serializer() -> JsonSerializer:
+    """The active JSON backend, chosen on first use (see `set_serializer`)."""
+    return _serializer or set_serializer()
+
+
+def read_json(path: Path) -> object:
+    """Decode a JSON file with the active backend."""
+    return get_serializer().loads(Path(path).read_bytes())
+
+
+# Rate limiting
+
+# Guards creation of the process-wide limiter and client
+_client_lock = threading.RLock()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _header_number(headers, *names: str) -> float | None:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared by every request made through `GET`.
+
+    The bucket refills at `rate` tokens per second up to `burst` tokens, and
+    each request takes one token. When `state_file` is set, the bucket lives
+    in that small JSON file under an exclusive `flock`, so every process
+    pointing at the same file (e.g. scripts launched by run_all_dropstab.py,
+    or several run by hand) draws from one budget. Without `fcntl` (Windows)
+    the state stays in-process.
+
+    The limiter also learns from responses (see `observe`): `Retry-After`
+    and exhausted `X-RateLimit-Remaining`/`RateLimit-Remaining` headers
+    pause all callers until the server-announced reset.
+
+    Args:
+        rate: Tokens added per second. Values <= 0 disable pacing (server
+            announced pauses are still honoured).
+        burst: Bucket capacity, i.e. max back-to-back requests.
+        state_file: Optional JSON file used to share state across processes.
+    """
+
+    def __init__(
+        self,
+        rate: float = REQUESTS_PER_SEC,
+        burst: int = RATE_BURST,
+        state_file: Path | None = None,
+    ):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.state_file = Path(state_file) if state_file and fcntl is not None else None
+        self._lock = threading.Lock()
+        self._state = self._fresh_state()
+
+    def _fresh_state(self) -> dict:
+        return {"tokens": float(self.burst), "updated": time.time(), "paused_until": 0.0}
+
+    @contextmanager
+    def _locked_state(self):
+        """Yield the mutable bucket state, holding the thread (and file) lock."""
+        with self._lock:
+            if self.state_file is None:
+                yield self._state
+                return
+
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.state_file, "a+") as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+                try:
+                    fh.seek(0)
+                    try:
+                        state = {**self._fresh_state(), **json.loads(fh.read())}
+                    except ValueError:
+                        state = self._fresh_state()
+                    yield state
+                    fh.seek(0)
+                    fh.truncate()
+                    fh.write(json.dumps(state))
+                    fh.flush()
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def try_acquire(self) -> float:
+        """Take a token if possible; otherwise return seconds to wait (non-blocking)."""
+        with self._locked_state() as state:
+            now = time.time()
+            if now < state["paused_until"]:
+                return state["paused_until"] - now
+            if self.rate <= 0:
+                return 0.0
+
+            elapsed = max(0.0, now - state["updated"])
+            tokens = min(float(self.burst), state["tokens"] + elapsed * self.rate)
+            state["updated"] = now
+            if tokens >= 1.0:
+                state["tokens"] = tokens - 1.0
+                return 0.0
+            state["tokens"] = tokens
+            return (1.0 - tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request is allowed under the shared budget."""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers sharing this limiter for `seconds`."""
+        with self._locked_state() as state:
+            until = time.time() + seconds
+            state["paused_until"] = max(state["paused_until"], until)
+            state["tokens"] = 0.0
+
+    def observe(self, status_code: int, headers) -> None:
+        """
+        Learn from a response's status code and rate-limit headers.
+
+        - 429 with `Retry-After` (seconds or HTTP date): pause for that long
+          (2 seconds when the header is missing or unparseable).
+        - Remaining quota of 0 (`X-RateLimit-Remaining` / `RateLimit-Remaining`):
+          pause until the reset announced by `X-RateLimit-Reset` /
+          `RateLimit-Reset` (delta seconds or an epoch timestamp).
+        - Low remaining quota: cap the bucket so we never burst past it.
+        """
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if status_code == 429:
+            self.pause(2.0 if retry_after is None else retry_after)
+            return
+        if retry_after is not None:
+            self.pause(retry_after)
+            return
+
+        remaining = _header_number(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        if remaining <= 0:
+            reset = _header_number(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+            if reset is not None:
+                # Large values are epoch timestamps, small ones are deltas
+                self.pause(reset - time.time() if reset > 1e9 else reset)
+            return
+
+        with self._locked_state() as state:
+            state["tokens"] = min(state["tokens"], remaining)
+
+
+_limiter: RateLimiter | None = None
+
+
+def get_limiter() -> RateLimiter:
+    """Return the process-wide limiter, shared across processes via RATE_LIMIT_STATE_FILE."""
+    global _limiter
+    if _limiter is None:
+        with _client_lock:
+            if _limiter is None:
+                _limiter = RateLimiter(state_file=RATE_LIMIT_STATE_FILE)
+    return _limiter
+
+
+# Retries
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Which failures `DropsTabClient.get` retries, and how long it waits.
+
+    Waits use exponential backoff with full jitter: a random delay between
+    0 and `min(backoff_max, backoff_base * 2 ** attempt)`. When the server
+    sends `Retry-After`, the wait is at least that long.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first one.
+        statuses: HTTP status codes that are retried.
+        retry_connection_errors: Retry connection errors/resets and connect timeouts.
+        retry_read_timeouts: Retry read timeouts.
+        backoff_base: Base delay in seconds for the first retry.
+        backoff_max: Upper bound for a single backoff delay, in seconds.
+        jitter: Randomize delays (full jitter) to avoid synchronized retries.
+        respect_retry_after: Honour the `Retry-After` header.
+    """
+
+    max_attempts: int = 5
+    statuses: frozenset = frozenset({429, 500, 502, 503, 504})
+    retry_connection_errors: bool = True
+    retry_read_timeouts: bool = True
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+
+    def is_retryable_error(self, exc: Exception) -> bool:
+        """Whether a transport exception should be retried under this policy."""
+        requests = _requests()
+        if isinstance(exc, requests.exceptions.ReadTimeout):
+            return self.retry_read_timeouts
+        if isinstance(
+            exc,
+            (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError),
+        ):
+            return self.retry_connection_errors
+        return False
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        cap = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        delay = random.uniform(0, cap) if self.jitter else cap
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class RetryBudget:
+    """
+    Thread-safe cap on the total number of retries in one run.
+
+    Once spent, requests fail on their first retryable error instead of
+    backing off, so a broken upstream cannot stretch a run indefinitely.
+
+    Args:
+        max_retries: Retries allowed for the lifetime of the budget
+            (None for unlimited).
+    """
+
+    def __init__(self, max_retries: int | None = RETRY_BUDGET):
+        self.max_retries = max_retries
+        self._spent = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        """Consume one retry; False if the budget is exhausted."""
+        with self._lock:
+            if self.max_retries is not None and self._spent >= self.max_retries:
+                return False
+            self._spent += 1
+            return True
+
+    @property
+    def spent(self) -> int:
+        return self._spent
+
+
+@dataclass
+class RetryStats:
+    """Retry counters and time spent waiting, exported via `as_dict`."""
+
+    retries: int = 0
+    wait_sec: float = 0.0
+    by_reason: dict = field(default_factory=dict)
+    gave_up: int = 0
+    budget_exhausted: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_retry(self, reason: str, wait: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.wait_sec += wait
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+    def record_give_up(self, budget_exhausted: bool) -> None:
+        with self._lock:
+            self.gave_up += 1
+            self.budget_exhausted += int(budget_exhausted)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "retry_wait_sec": round(self.wait_sec, 3),
+                "retries_by_reason": dict(self.by_reason),
+                "gave_up": self.gave_up,
+                "budget_exhausted": self.budget_exhausted,
+            }
+
+
+# Request metrics
+
+# Static path segments of the API; any other segment is a slug/id placeholder
+_STATIC_SEGMENTS = {
+    "coins", "detailed", "supported", "history", "price", "chart-by-interval",
+    "chart-by-timeframe", "fear-index", "fundingRounds", "coin", "investors",
+    "tokenUnlocks", "supportedCoins", "chart", "cryptoActivities", "exchanges", "pairs",
+}
+
+
+def endpoint_label(path: str) -> str:
+    """
+    Endpoint template for a request path, used as the metrics label.
+
+    Example: `endpoint_label("coins/detailed/bitcoin")` -> "coins/detailed/{}".
+    """
+    path = path.split("?", 1)[0]
+    if path.startswith(API_BASE):
+        path = path[len(API_BASE):]
+    segments = [seg for seg in path.strip("/").split("/") if seg]
+    return "/".join(seg if seg in _STATIC_SEGMENTS else "{}" for seg in segments)
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    One HTTP attempt as seen by `RequestMetrics` and its hooks.
+
+    Attributes:
+        endpoint: Endpoint template (see `endpoint_label`).
+        url: Full request URL.
+        status: HTTP status code, or None if the attempt failed in transport.
+        seconds: Time spent in the HTTP call (excluding rate-limit waits).
+        bytes: Response body size.
+        throttled: Seconds spent waiting for a rate-limiter token first.
+        error: Exception class name for transport failures.
+    """
+
+    endpoint: str
+    url: str
+    status: int | None
+    seconds: float
+    bytes: int = 0
+    throttled: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class _EndpointStats:
+    buckets: list = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    requests: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+    statuses: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
+    retries: int = 0
+    retry_wait: float = 0.0
+    throttle_wait: float = 0.0
+    cache: dict = field(default_factory=dict)
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bucket bound below which a fraction `q` of requests finished."""
+        if not self.requests:
+            return None
+        rank, seen = q * self.requests, 0
+        for bound, count in zip(LATENCY_BUCKETS + (math.inf,), self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return math.inf
+
+
+class RequestMetrics:
+    """
+    Per-endpoint request metrics: latency histogram, bytes, status codes,
+    transport errors, retries, rate-limit waits and cache outcomes.
+
+    Every DropsTabClient records into one (`client.metrics`); hooks added
+    with `add_hook` are called with each RequestEvent as well, e.g. to log
+    slow requests or forward them to another metrics system.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, _EndpointStats] = {}
+        self._hooks: list[Callable[[RequestEvent], None]] = []
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        self._hooks.append(hook)
+
+    def _stats(self, endpoint: str) -> _EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        return stats
+
+    def record(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._stats(event.endpoint)
+            stats.requests += 1
+            stats.seconds += event.seconds
+            stats.bytes += event.bytes
+            stats.throttle_wait += event.throttled
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS, event.seconds)] += 1
+            if event.error is not None:
+                stats.errors[event.error] = stats.errors.get(event.error, 0) + 1
+            else:
+                key = str(event.status)
+                stats.statuses[key] = stats.statuses.get(key, 0) + 1
+        for hook in self._hooks:
+            hook(event)
+
+    def record_retry(self, endpoint: str, wait: float) -> None:
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.retries += 1
+            stats.retry_wait += wait
+
+    def record_cache(self, endpoint: str, outcome: str) -> None:
+        """Count a cache outcome: "hit", "miss", "stale" or "revalidated"."""
+        with self._lock:
+            stats = self._stats(endpoint)
+            stats.cache[outcome] = stats.cache.get(outcome, 0) + 1
+
+    def as_dict(self) -> dict:
+        """Per-endpoint summary, slowest endpoint (by total request time) first."""
+        with self._lock:
+            items = sorted(self._endpoints.items(), key=lambda kv: -kv[1].seconds)
+            return {
+                endpoint: {
+                    "requests": s.requests,
+                    "seconds_total": round(s.seconds, 3),
+                    "seconds_mean": round(s.seconds / s.requests, 4) if s.requests else None,
+                    "p50_le": s.quantile(0.5),
+                    "p95_le": s.quantile(0.95),
+                    "bytes": s.bytes,
+                    "statuses": dict(s.statuses),
+                    "errors": dict(s.errors),
+                    "retries": s.retries,
+                    "retry_wait_sec": round(s.retry_wait, 3),
+                    "ratelimit_wait_sec": round(s.throttle_wait, 3),
+                    "cache": dict(s.cache),
+                }
+                for endpoint, s in items
+            }
+
+    def to_prometheus(self, prefix: str = "dropstab") -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+
+            metric = family("request_duration_seconds", "histogram", "HTTP request latency.")
+            for endpoint, s in endpoints:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (math.inf,), s.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(f'{metric}_bucket{{endpoint="{endpoint}",le="{le}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{endpoint="{endpoint}"}} {s.seconds:.6f}')
+                lines.append(f'{metric}_count{{endpoint="{endpoint}"}} {s.requests}')
+
+            metric = family("responses_total", "counter", "HTTP responses by status code.")
+            for endpoint, s in endpoints:
+                for status, count in sorted(s.statuses.items()):
+                    lines.append(f'{metric}{{endpoint="{endpoint}",status="{status}"}} {count}')
+
+            metric = family("request_errors_total", "counter", "Requests failed in transport.")
+            for endpoint, s in endpoints:
+                for error, count in sorted(s.errors.items()):
+                    lines.append(f'{metric}{{endpoint="{endpoint}",error="{error}"}} {count}')
+
+            metric = family("cache_lookups_total", "counter", "Response cache outcomes.")
+            for endpoint, s in endpoints:
+                for outcome, count in sorted(s.cache.items()):
+                    lines.append(f'{metric}{{endpoint="{endpoint}",result="{outcome}"}} {count}')
+
+            for name, attr, help_text in (
+                ("response_bytes_total", "bytes", "Response body bytes received."),
+                ("retries_total", "retries", "Retried requests."),
+                ("retry_wait_seconds_total", "retry_wait", "Seconds slept before retries."),
+                ("ratelimit_wait_seconds_total", "throttle_wait", "Seconds waited for the rate limiter."),
+            ):
+                metric = family(name, "counter", help_text)
+                for endpoint, s in endpoints:
+                    lines.append(f'{metric}{{endpoint="{endpoint}"}} {getattr(s, attr)}')
+
+        return "\n".join(lines) + "\n"
+
+
+# HTTP client
+
+class HTTPStatusError(RuntimeError):
+    """
+    A response that is not OK after retries.
+
+    Attributes:
+        status: HTTP status code.
+        payload: Decoded response body (dict, or raw text if not JSON).
+    """
+
+    def __init__(self, message: str, status: int, payload: object = None):
+        super().__init__(message)
+        self.status = status
+        self.payload = payload
+
+    @property
+    def server_message(self) -> str:
+        """The server's error message: the body's `message` field, else the raw body."""
+        if isinstance(self.payload, dict):
+            return str(self.payload.get("message") or "")
+        return self.payload if isinstance(self.payload, str) else ""
+
+
+class DropsTabClient:
+    """
+    HTTP client owning a pooled, keep-alive `requests.Session`.
+
+    Reusing one session means consecutive calls share TCP/TLS connections
+    instead of paying a fresh handshake per request. `GET` goes through a
+    shared instance of this class (see `get_client`). Every attempt first
+    takes a token from `limiter`; failed attempts are retried per `retry`
+    while `retry_budget` lasts, and counted in `retry_stats`.
+
+    An optional response `cache` (e.g. `dropstab_cache.DiskResponseCache`)
+    is consulted before sending: fresh entries are returned without a
+    request, stale entries are revalidated with their ETag/Last-Modified.
+    Any object with `cacheable(url, params)`, `lookup(url, params)`,
+    `store(url, params, payload, headers)` and `revalidated(url, params,
+    entry, headers)` works. Only cacheable requests are looked up and
+    counted as cache hits/misses.
+
+    Every attempt, retry and cache outcome is recorded per endpoint in
+    `metrics` (see RequestMetrics).
+
+    `page_sizer` (None by default) lets `iter_pages` choose page sizes per
+    endpoint; see `dropstab_pagesize.PageSizeTuner` for the interface.
+
+    Args:
+        base_url: API root that relative paths are resolved against.
+        headers: Default headers sent with every request (defaults to `get_headers()`).
+        pool_size: Max connections kept open per host.
+        limiter: Rate limiter to draw from (defaults to the shared `get_limiter()`).
+        retry: Retry policy (defaults to `RetryPolicy()`).
+        retry_budget: Retry budget for this client's run (defaults to RETRY_BUDGET).
+        cache: Optional response cache (disabled by default).
+        metrics: Request metrics to record into (defaults to a new RequestMetrics).
+    """
+
+    def __init__(
+        self,
+        base_url: str = API_BASE,
+        headers: dict | None = None,
+        pool_size: int = POOL_SIZE,
+        limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        cache=None,
+        metrics: RequestMetrics | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.cache = cache
+        self.page_sizer = None
+        self.limiter = limiter if limiter is not None else get_limiter()
+        self.retry = retry or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.retry_stats = RetryStats()
+        self.metrics = metrics if metrics is not None else RequestMetrics()
+
+        requests = _requests()
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        self.session.headers.update(get_headers() if headers is None else headers)
+        self.session.headers["connection"] = "keep-alive"
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def url_for(self, path: str) -> str:
+        """Resolve a full URL or a path relative to `base_url`."""
+        return path if path.startswith("http") else f"{self.base_url}/{path.lstrip('/')}"
+
+    def get(self, path: str, params: dict | None = None, timeout: int = 10):
+        """
+        GET with retries per `self.retry`.
+
+        Args:
+            path: Either a full URL or a path relative to `base_url`.
+            params: Optional query parameters dict.
+            timeout: Requests timeout in seconds.
+
+        Returns:
+            Parsed JSON (usually a dict), or response text if JSON parsing fails.
+
+        Raises:
+            HTTPStatusError: if the response is not OK (status_code >= 400)
+                after retries are exhausted (a RuntimeError).
+            requests.RequestException: on transport errors that are not
+                retryable or persist after retries.
+        """
+        requests = _requests()
+        url = self.url_for(path)
+        params = params or {}
+        endpoint = endpoint_label(path)
+
+        # Serve fresh cache entries directly; revalidate stale ones if possible
+        cacheable = self.cache is not None and self.cache.cacheable(url, params)
+        cached = self.cache.lookup(url, params) if cacheable else None
+        if cacheable:
+            outcome = "miss" if cached is None else "hit" if cached.fresh else "stale"
+            self.metrics.record_cache(endpoint, outcome)
+        if cached is not None and cached.fresh:
+            return cached.payload
+        conditional = cached.validators if cached is not None else None
+
+        attempt = 0
+        while True:
+            try:
+                resp = self._send(url, params, timeout, conditional, endpoint)
+            except requests.exceptions.RequestException as exc:
+                if not self.retry.is_retryable_error(exc):
+                    raise
+                error, reason, retry_after = exc, type(exc).__name__, None
+            else:
+                if resp.status_code not in self.retry.statuses:
+                    break
+                error, reason = None, str(resp.status_code)
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+
+            attempt += 1
+            exhausted = attempt >= self.retry.max_attempts
+            if exhausted or not self.retry_budget.try_spend():
+                self.retry_stats.record_give_up(budget_exhausted=not exhausted)
+                if error is not None:
+                    raise error
+                break  # report the HTTP error below
+
+            wait = self.retry.delay(attempt - 1, retry_after)
+            self.retry_stats.record_retry(reason, wait)
+            self.metrics.record_retry(endpoint, wait)
+            print(
+                f"[retry] GET {path} failed ({reason}); "
+                f"attempt {attempt + 1}/{self.retry.max_attempts} in {wait:.1f}s"
+            )
+            time.sleep(wait)
+
+        if resp.status_code == 304 and cached is not None:
+            self.metrics.record_cache(endpoint, "revalidated")
+            self.cache.revalidated(url, params, cached, resp.headers)
+            return cached.payload
+
+        # Decode JSON straight from the body bytes; fall back to raw text
+        try:
+            payload = get_serializer().loads(resp.content)
+        except ValueError:
+            payload = resp.text
+
+        if not resp.ok:
+            raise HTTPStatusError(
+                f"GET {resp.status_code} :: {url}\n"
+                f"Params={params}\n"
+                f"Resp={payload}",
+                resp.status_code,
+                payload,
+            )
+
+        if self.cache is not None:
+            self.cache.store(url, params, payload, resp.headers)
+        return payload
+
+    def _send(
+        self,
+        url: str,
+        params: dict,
+        timeout: int,
+        headers: dict | None = None,
+        endpoint: str | None = None,
+    ) -> requests.Response:
+        requests = _requests()
+        endpoint = endpoint or endpoint_label(url)
+        start = time.perf_counter()
+        self.limiter.acquire()
+        sent = time.perf_counter()
+        try:
+            resp = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        except requests.exceptions.RequestException as exc:
+            self.metrics.record(RequestEvent(
+                endpoint, url, None, time.perf_counter() - sent,
+                throttled=sent - start, error=type(exc).__name__,
+            ))
+            raise
+        self.metrics.record(RequestEvent(
+            endpoint, url, resp.status_code, time.perf_counter() - sent,
+            bytes=len(resp.content), throttled=sent - start,
+        ))
+        self.limiter.observe(resp.status_code, resp.headers)
+        return resp
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "DropsTabClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_client: DropsTabClient | None = None
+
+
+def retry_metrics() -> dict:
+    """Retry counters and wait time of the shared client, for run reports."""
+    return get_client().retry_stats.as_dict()
+
+
+def request_metrics() -> RequestMetrics:
+    """Per-endpoint request metrics of the shared client (see RequestMetrics)."""
+    return get_client().metrics
+
+
+def get_client() -> DropsTabClient:
+    """Return the process-wide client used by `GET`, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = DropsTabClient()
+    return _client
+
+
+def set_client(client: DropsTabClient | None) -> None:
+    """
+    Replace the process-wide client used by `GET`.
+
+    Useful to change the pool size or point scripts at another base URL
+    (e.g. a local mock server). Passing None resets to a default client on
+    the next call.
+    """
+    global _client
+    with _client_lock:
+        old, _client = _client, client
+    if old is not None and old is not client:
+        old.close()
+
+
 # HTTP helper
 
 def GET(path: str, params: dict | None = None, timeout: int = 10):
     """
-    Minimal GET helper with one retry on HTTP 429.
+    Minimal GET helper with retries, exponential backoff and a retry budget.
+
+    Requests go through the shared pooled client (see `get_client`), so
+    consecutive calls reuse keep-alive connections and share its rate
+    limiter, RetryPolicy and RetryBudget.
 
     Args:
         path: Either a full URL or a path relative to API_BASE.
@@ -118,48 +1132,404 @@ def GET(path: str, params: dict | None = None, timeout: int = 10):
     Raises:
         RuntimeError: if the response is not OK (status_code >= 400).
     """
-    url = path if path.startswith("http") else f"{API_BASE}/{path.lstrip('/')}"
-    params = params or {}
+    return get_client().get(path, params=params, timeout=timeout)
 
-    resp = requests.get(url, headers=HEADERS, params=params, timeout=timeout)
 
-    # Handle rate limiting with a simple single retry.
-    if resp.status_code == 429:
-        retry_after_raw = resp.headers.get("Retry-After", "2")
-        try:
-            retry_after = int(retry_after_raw)
-        except ValueError:
-            retry_after = 2
-        time.sleep(retry_after)
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=timeout)
+# Concurrency helpers
+
+def map_ordered(fn: Callable, items: Iterable, max_workers: int = MAX_WORKERS) -> Iterator:
+    """
+    Apply `fn` to `items` on a thread pool and yield results in input order.
+
+    At most `2 * max_workers` calls are in flight or buffered at any time, so
+    `items` may be a long (or lazy) iterable. Closing the generator early
+    cancels calls that have not started yet. An exception raised by `fn`
+    propagates when its result is reached.
+    """
+    workers = max(1, max_workers)
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Try to decode JSON; fall back to raw text
+    pool = ThreadPoolExecutor(max_workers=workers)
+    remaining = iter(items)
+    pending: deque = deque()
     try:
-        payload = resp.json()
-    except ValueError:
-        payload = resp.text
+        for item in remaining:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= 2 * workers:
+                break
 
-    if not resp.ok:
-        raise RuntimeError(
-            f"GET {resp.status_code} :: {url}\n"
-            f"Params={params}\n"
-            f"Resp={payload}"
-        )
+        while pending:
+            result = pending.popleft().result()
+            for item in remaining:
+                pending.append(pool.submit(fn, item))
+                break
+            yield result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# Pagination helpers
+
+def _fetch_page(path: str, params: dict, page: int, page_size: int) -> dict:
+    resp = GET(path, params={**params, "page": page, "pageSize": page_size})
+    return resp.get("data", {}) if isinstance(resp, dict) else {}
+
+
+def log_page(label: str, data: dict, count: int) -> None:
+    """Print a progress line for a fetched page of a paginated crawl."""
+    total_pages = data.get("totalPages")
+    print(
+        f"[{label}] page {data.get('currentPage')}/"
+        f"{(total_pages - 1) if total_pages is not None else '?'} "
+        f"with {count} items"
+    )
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """
+    Write `text` to `path` via a temp file so readers never see partial data.
+    Missing parent directories are created.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class PageCheckpoint:
+    """
+    On-disk checkpoint of a paginated crawl: one JSON file per completed
+    page plus a `cursor.json` recording the last completed page.
+
+    A cursor only counts for the same endpoint, params and page size;
+    anything else is treated as stale and discarded.
+
+    Args:
+        name: Checkpoint name, a directory under CHECKPOINT_DIR
+            (scripts use their undated snapshot name, e.g. "coins_all", so
+            a crawl can resume on a later day).
+        path: Endpoint path being crawled.
+        params: Extra query parameters of the crawl.
+        page_size: Items per page of the crawl.
+    """
+
+    def __init__(self, name: str, path: str, params: dict, page_size: int):
+        self.directory = CHECKPOINT_DIR / name
+        self.cursor_file = self.directory / "cursor.json"
+        self._meta = {
+            "endpoint": path,
+            "params": json.loads(json.dumps(params)),
+            "page_size": page_size,
+        }
+
+    def _page_file(self, page: int) -> Path:
+        return self.directory / f"page_{page:06d}.json"
+
+    def load(self) -> dict | None:
+        """Return the cursor of a matching earlier run, or None to start fresh."""
+        try:
+            cursor = json.loads(self.cursor_file.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        if any(cursor.get(key) != value for key, value in self._meta.items()):
+            self.clear()
+            return None
+        return cursor
+
+    def saved_page_size(self) -> int | None:
+        """Page size of a resumable crawl of the same endpoint and params, if any."""
+        try:
+            cursor = json.loads(self.cursor_file.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        if any(cursor.get(key) != self._meta[key] for key in ("endpoint", "params")):
+            return None
+        return cursor.get("page_size")
+
+    def read_page(self, page: int) -> list:
+        """Content of a completed page."""
+        return read_json(self._page_file(page))
+
+    def save_page(self, page: int, content: list, total_pages: int | None) -> None:
+        """Persist a completed page, then advance the cursor to it."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        atomic_write(self._page_file(page), get_serializer().dumps(content))
+        cursor = {
+            **self._meta,
+            "last_page": page,
+            "total_pages": total_pages,
+            "updated_utc": utc_now_iso(),
+        }
+        atomic_write(self.cursor_file, json.dumps(cursor, indent=2))
+
+    def clear(self) -> None:
+        """Delete the checkpoint directory."""
+        shutil.rmtree(self.directory, ignore_errors=True)
 
-    return payload
+
+def clear_checkpoint(name: str) -> None:
+    """Delete a crawl checkpoint once its snapshot has been written."""
+    shutil.rmtree(CHECKPOINT_DIR / name, ignore_errors=True)
+
+
+def iter_pages(
+    path: str,
+    params: dict | None = None,
+    page_size: int | None = None,
+    max_workers: int | None = None,
+    label: str | None = None,
+    checkpoint: str | None = None,
+) -> Iterator[list]:
+    """
+    Yield the `content` list of every page of a paginated endpoint, in page order.
+
+    Page 0 is fetched first to learn `totalPages`; pages 1..N-1 are then
+    fetched concurrently by a bounded worker pool and yielded strictly in
+    page order. At most `2 * max_workers` pages are in flight or buffered at
+    any time; requests are paced by the shared limiter behind `GET`.
+
+    With `checkpoint`, each page is persisted (see PageCheckpoint) before it
+    is yielded. If a matching checkpoint already exists, its pages are
+    replayed from disk and fetching resumes after the last completed page.
+
+    Without an explicit `page_size`, a page sizer installed on the shared
+    client (see dropstab_pagesize) picks the size, is told how every page
+    went, and may shrink the size if page 0 is rejected or times out. A
+    checkpoint is resumed at its own page size unless the sizer has since
+    learned that size fails for the endpoint; the crawl then starts over.
+
+    Args:
+        path: Endpoint path relative to API_BASE (e.g. "coins").
+        params: Extra query parameters sent with every page.
+        page_size: Items per page (defaults to the client's page sizer, if
+            any, else PAGE_SIZE).
+        max_workers: Max pages fetched concurrently (defaults to MAX_WORKERS,
+            read at call time so it can be tuned globally).
+        label: Prefix for progress lines (defaults to `path`).
+        checkpoint: Optional checkpoint name under CHECKPOINT_DIR.
+
+    Yields:
+        The `content` list of each page, starting with page 0.
+    """
+    label = label or path
+    params = dict(params or {})
+    max_workers = max_workers or MAX_WORKERS
+    sizer = get_client().page_sizer if page_size is None else None
+    if sizer is None:
+        page_size = page_size or PAGE_SIZE
+    else:
+        page_size = sizer.page_size(path)
+        if checkpoint:
+            # Resume an interrupted crawl at the page size it was started with,
+            # unless that size has since failed: the checkpoint is then stale
+            saved = PageCheckpoint(checkpoint, path, params, page_size).saved_page_size()
+            limit = sizer.limit(path)
+            if saved and (limit is None or saved < limit):
+                page_size = saved
+    ckpt = PageCheckpoint(checkpoint, path, params, page_size) if checkpoint else None
+    cursor = ckpt.load() if ckpt else None
+
+    def fetch_sized(page: int) -> dict:
+        try:
+            data = _fetch_page(path, params, page, page_size)
+        except (RuntimeError, OSError):
+            if sizer is not None:
+                sizer.failed(path, page_size)
+            raise
+        if sizer is not None:
+            total = data.get("totalPages")
+            last = total is None or page >= total - 1
+            sizer.observe(path, page_size, len(data.get("content", [])), last)
+        return data
+
+    if cursor is not None:
+        total_pages = cursor["total_pages"]
+        start = cursor["last_page"] + 1
+        print(f"[{label}] resuming from checkpoint: {start} page(s) already stored")
+        for page in range(start):
+            yield ckpt.read_page(page)
+        if total_pages is None or start >= total_pages:
+            return
+    else:
+        while True:
+            try:
+                first = fetch_sized(0)
+                break
+            except (RuntimeError, OSError) as exc:
+                smaller = sizer.page_size(path) if sizer is not None else page_size
+                if smaller >= page_size:
+                    raise
+                print(f"[{label}] pageSize={page_size} failed ({exc}); retrying with {smaller}")
+                page_size = smaller
+                ckpt = PageCheckpoint(checkpoint, path, params, page_size) if checkpoint else None
+        content = first.get("content", [])
+        total_pages = first.get("totalPages")
+        log_page(label, first, len(content))
+        if ckpt:
+            ckpt.save_page(0, content, total_pages)
+        yield content
+
+        # Stop if no content or there is only one page (or pagination info missing)
+        if not content or total_pages is None or total_pages <= 1:
+            if sizer is not None:
+                sizer.finish(path)
+            return
+        start = 1
+
+    def fetch(page: int) -> tuple[int, dict]:
+        return page, fetch_sized(page)
+
+    with closing(map_ordered(fetch, range(start, total_pages), max_workers)) as pages:
+        for page, data in pages:
+            content = data.get("content", [])
+            log_page(label, data, len(content))
+            if not content:
+                break
+            if ckpt:
+                ckpt.save_page(page, content, total_pages)
+            yield content
+    if sizer is not None:
+        sizer.finish(path)
+
+
+def fetch_all_pages(path: str, params: dict | None = None, **kwargs) -> list:
+    """
+    Fetch every page of a paginated endpoint and return all items in page order.
+
+    Keyword arguments are passed through to `iter_pages`.
+    """
+    items: list = []
+    for content in iter_pages(path, params, **kwargs):
+        items.extend(content)
+    return items
+
+
+# Snapshot writing
+
+class SnapshotWriter:
+    """
+    Stream a JSON snapshot `{<envelope>..., "items": [...]}` to disk.
+
+    The envelope is written first, then items are appended page by page, so
+    memory stays bounded by one page instead of the whole collection. The
+    output goes to a temp file that replaces `filename` only when the
+    context exits cleanly.
+
+    Usage:
+
+        with SnapshotWriter(filename, {"data_ts_utc": ..., "endpoint": ...}) as writer:
+            for content in iter_pages("coins"):
+                writer.write_items(content)
+        print(writer.count)
+
+    Args:
+        filename: Target snapshot path.
+        envelope: Top-level keys written before `items`.
+        compact: Write without indentation (defaults to COMPACT_JSON). The
+            indented form is byte-identical to `dumps(payload, indent=True)`
+            of the active JSON backend (`get_serializer()`).
+    """
+
+    def __init__(self, filename: Path, envelope: dict, compact: bool | None = None):
+        self.filename = Path(filename)
+        self.envelope = envelope
+        self.compact = COMPACT_JSON if compact is None else compact
+        self.count = 0
+        self._serializer = get_serializer()
+        self._tmp = self.filename.with_name(self.filename.name + ".tmp")
+        self._fh = None
+
+    def _dumps(self, obj) -> str:
+        return self._serializer.dumps(obj, indent=not self.compact)
+
+    def __enter__(self) -> "SnapshotWriter":
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self._tmp, "w", encoding="utf-8")
+        head = self._dumps({**self.envelope, "items": []})
+        # Drop the closing "[]}" (plus whitespace) to leave the items array open
+        self._fh.write(head[: head.rindex("[") + 1])
+        return self
+
+    def write_items(self, items: Iterable) -> None:
+        """Append items to the snapshot's `items` array."""
+        for item in items:
+            if self.compact:
+                sep = "," if self.count else ""
+                self._fh.write(sep + self._dumps(item))
+            else:
+                sep = ",\n" if self.count else "\n"
+                self._fh.write(sep + textwrap.indent(self._dumps(item), "    "))
+            self.count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                if self.compact or not self.count:
+                    self._fh.write("]}" if self.compact else "]\n}")
+                else:
+                    self._fh.write("\n  ]\n}")
+        finally:
+            self._fh.close()
+        if exc_type is None:
+            os.replace(self._tmp, self.filename)
+        else:
+            self._tmp.unlink(missing_ok=True)
 
 
 __all__ = [
     "ROOT_DIR",
     "DATA_DIR",
     "RAW_DIR",
+    "CHECKPOINT_DIR",
     "API_BASE",
     "API_KEY_FILE",
+    "API_KEY_ENV",
     "DT_API_KEY",
     "HEADERS",
+    "get_headers",
     "PAGE_SIZE",
     "SLEEP_SEC",
+    "COMPACT_JSON",
+    "POOL_SIZE",
+    "MAX_WORKERS",
+    "REQUESTS_PER_SEC",
+    "RATE_BURST",
+    "RATE_LIMIT_STATE_FILE",
+    "RateLimiter",
+    "get_limiter",
+    "RETRY_BUDGET",
+    "RetryPolicy",
+    "RetryBudget",
+    "RetryStats",
+    "parse_retry_after",
+    "LATENCY_BUCKETS",
+    "JSON_BACKENDS",
+    "JSON_BACKEND_ENV",
+    "JsonSerializer",
+    "get_serializer",
+    "set_serializer",
+    "read_json",
+    "endpoint_label",
+    "RequestEvent",
+    "RequestMetrics",
+    "HTTPStatusError",
+    "DropsTabClient",
+    "get_client",
+    "set_client",
+    "retry_metrics",
+    "request_metrics",
     "utc_now_iso",
     "today_tag",
+    "latest_snapshot",
+    "latest_snapshots",
     "GET",
+    "atomic_write",
+    "map_ordered",
+    "PageCheckpoint",
+    "clear_checkpoint",
+    "log_page",
+    "iter_pages",
+    "fetch_all_pages",
+    "SnapshotWriter",
 ]
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Bulk per-slug detail fetcher.
+
+Fetches the detail endpoints that the single-slug scripts cover
+(`coins/detailed/{slug}`, `investors/{slug}`, `exchanges/{slug}`,
+`tokenUnlocks/{coinSlug}`) for many slugs at once, with bounded parallelism
+and the shared rate limiter behind `dropstab_base.GET`.
+
+Slugs come from a file (one per line), from stdin, or from the latest list
+snapshot in RAW_DIR. Results go to one combined snapshot or to shards of
+`--shard-size` slugs each; slugs that fail are listed in an `_errors` file
+and do not stop the run.
+
+Usage examples:
+
+    # All coins from the latest coins_all_YYYYMMDD.json snapshot
+    python dropstab_bulk.py coins --from-snapshot
+
+    # Investors listed in a file, 500 per output shard
+    python dropstab_bulk.py investors --slugs-file investors.txt --shard-size 500
+
+    # Slugs piped on stdin
+    echo -e "bitcoin\\nethereum" | python dropstab_bulk.py token_unlocks --stdin
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import closing
+from itertools import islice
+from dataclasses import dataclass
+from pathlib import Path
+
+from dropstab_base import (
+    RAW_DIR,
+    GET,
+    SnapshotWriter,
+    atomic_write,
+    latest_snapshot,
+    map_ordered,
+    read_json,
+    today_tag,
+    utc_now_iso,
+)
+from dropstab_endpoints import ENDPOINTS
+
+# Default number of slugs fetched concurrently
+BULK_WORKERS: int = 8
+
+
+@dataclass(frozen=True)
+class DetailSpec:
+    """
+    A per-slug detail endpoint and where its slugs come from.
+
+    Attributes:
+        path: Endpoint path template with a `{slug}` placeholder.
+        endpoint: Endpoint name written to the snapshot envelope.
+        name: Output file prefix.
+        list_snapshot: Name of the list snapshot providing slugs.
+        slug_keys: Candidate keys holding the slug in list items, tried in order.
+    """
+
+    path: str
+    endpoint: str
+    name: str
+    list_snapshot: str
+    slug_keys: tuple = ("slug",)
+
+    @classmethod
+    def from_endpoints(cls, detail_key: str, list_key: str, slug_keys: tuple = ("slug",)) -> DetailSpec:
+        """
+        Spec for a detail endpoint registered in dropstab_endpoints.ENDPOINTS,
+        fed by the slugs of a list endpoint's snapshot.
+
+        The detail path's single placeholder becomes `{slug}`; the output
+        prefix is its snapshot name without that placeholder.
+        """
+        detail, listing = ENDPOINTS[detail_key], ENDPOINTS[list_key]
+        (placeholder,) = detail.placeholders
+        return cls(
+            detail.path.replace(f"{{{placeholder}}}", "{slug}"),
+            detail.path,
+            detail.name.replace(f"_{{{placeholder}}}", ""),
+            listing.name,
+            slug_keys,
+        )
+
+
+DETAIL_SPECS = {
+    "coins": DetailSpec.from_endpoints("coin_details", "coins"),
+    "investors": DetailSpec.from_endpoints("investor_details", "investors"),
+    "exchanges": DetailSpec.from_endpoints("exchange_details", "exchanges"),
+    "token_unlocks": DetailSpec.from_endpoints(
+        "token_unlocks_by_coin", "token_unlocks_supported", slug_keys=("slug", "coinSlug")
+    ),
+}
+
+
+def slugs_from_lines(lines: Iterable[str]) -> list[str]:
+    """Non-empty, de-duplicated slugs from text lines (order preserved)."""
+    seen: dict = {}
+    for line in lines:
+        slug = line.strip()
+        if slug and not slug.startswith("#"):
+            seen.setdefault(slug, None)
+    return list(seen)
+
+
+def slugs_from_snapshot(spec: DetailSpec, snapshot: Path | None = None) -> list[str]:
+    """Slugs of every item in a list snapshot (default: the latest one)."""
+    snapshot = snapshot or latest_snapshot(spec.list_snapshot)
+    if snapshot is None:
+        raise FileNotFoundError(
+            f"No {spec.list_snapshot}_YYYYMMDD.json snapshot in {RAW_DIR}; "
+            "run the list script first."
+        )
+    items = read_json(snapshot).get("items", [])
+    slugs = []
+    for item in items:
+        for key in spec.slug_keys:
+            if isinstance(item, dict) and item.get(key):
+                slugs.append(str(item[key]))
+                break
+    return slugs_from_lines(slugs)
+
+
+def iter_details(
+    spec: DetailSpec,
+    slugs: Iterable[str],
+    max_workers: int = BULK_WORKERS,
+) -> Iterator[tuple[str, object, str | None]]:
+    """
+    Fetch details for `slugs` concurrently, yielding `(slug, data, error)`
+    in slug order. `error` is None on success; failures do not stop the run.
+    """
+    def fetch(slug: str) -> tuple[str, object, str | None]:
+        try:
+            resp = GET(spec.path.format(slug=slug))
+        except Exception as e:  # keep going; report per slug
+            return slug, None, repr(e)
+        data = resp.get("data", resp) if isinstance(resp, dict) else resp
+        return slug, data, None
+
+    with closing(map_ordered(fetch, slugs, max_workers)) as results:
+        yield from results
+
+
+def _shards(results: Iterator, size: int) -> Iterator[list]:
+    """Split `results` into lists of at most `size` entries."""
+    while True:
+        shard = list(islice(results, size))
+        if not shard:
+            return
+        yield shard
+
+
+def bulk_fetch(
+    spec: DetailSpec,
+    slugs: list[str],
+    max_workers: int = BULK_WORKERS,
+    shard_size: int | None = None,
+) -> dict:
+    """
+    Fetch details for all `slugs` and write them to RAW_DIR.
+
+    Writes `<name>_bulk_<tag>.json` (or `<name>_bulk_<tag>_partNNNN.json`
+    shards of `shard_size` slugs) with items `{"slug": ..., "data": ...}`,
+    plus `<name>_bulk_<tag>_errors.json` if any slug failed.
+
+    Returns:
+        Summary dict with counts and the written files.
+    """
+    tag = today_tag()
+    base = f"{spec.name}_bulk_{tag}"
+    envelope = {
+        "data_ts_utc": utc_now_iso(),
+        "status": "ok",
+        "endpoint": spec.endpoint,
+    }
+
+    results = iter_details(spec, slugs, max_workers)
+    shards = _shards(results, shard_size) if shard_size else [results]
+
+    files: list[str] = []
+    errors: list[dict] = []
+    ok = 0
+    for number, shard in enumerate(shards, start=1):
+        part = f"_part{number:04d}" if shard_size else ""
+        with SnapshotWriter(RAW_DIR / f"{base}{part}.json", envelope) as writer:
+            for slug, data, error in shard:
+                if error is not None:
+                    print(f"[{spec.endpoint}] {slug}: failed ({error})")
+                    errors.append({"slug": slug, "error": error})
+                    continue
+                writer.write_items([{"slug": slug, "data": data}])
+                ok += 1
+                if ok % 100 == 0:
+                    print(f"[{spec.endpoint}] {ok}/{len(slugs)} slugs fetched")
+        files.append(str(writer.filename))
+
+    if errors:
+        errors_file = RAW_DIR / f"{base}_errors.json"
+        atomic_write(errors_file, json.dumps({**envelope, "status": "partial", "items": errors}, indent=2))
+        files.append(str(errors_file))
+
+    summary = {"slugs": len(slugs), "ok": ok, "failed": len(errors), "files": files}
+    print(f"Finished bulk {spec.endpoint}: {ok} ok, {len(errors)} failed -> {files}")
+    return summary
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Fetch DropsTab detail endpoints for many slugs at once.",
+    )
+    parser.add_argument("kind", choices=list(DETAIL_SPECS), help="Detail endpoint to fetch.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--slugs-file", type=Path, help="File with one slug per line.")
+    source.add_argument("--stdin", action="store_true", help="Read slugs from stdin.")
+    source.add_argument(
+        "--from-snapshot",
+        nargs="?",
+        const="latest",
+        metavar="PATH",
+        help="Take slugs from a list snapshot (default: latest in RAW_DIR).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BULK_WORKERS,
+        help=f"Slugs fetched concurrently (default: {BULK_WORKERS}).",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=None,
+        help="Write shards of this many slugs instead of one combined file.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    spec = DETAIL_SPECS[args.kind]
+
+    if args.slugs_file:
+        slugs = slugs_from_lines(args.slugs_file.read_text().splitlines())
+    elif args.stdin:
+        slugs = slugs_from_lines(sys.stdin)
+    else:
+        snapshot = None if args.from_snapshot == "latest" else Path(args.from_snapshot)
+        slugs = slugs_from_snapshot(spec, snapshot)
+
+    bulk_fetch(spec, slugs, max_workers=args.workers, shard_size=args.shard_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP response cache for `dropstab_base.GET`.
+
+Entries are keyed by URL plus normalized query params and stored as one
+JSON file each under CACHE_DIR. Every entry gets a TTL from the first
+matching rule in `ttl_rules` (seconds, `FOREVER`, or 0 = do not cache):
+historical prices and charts whose range lies entirely before today never
+change and are kept forever, detail endpoints for a while, list pages not
+at all. Expired entries that carry an ETag or Last-Modified are revalidated
+with a conditional request instead of being re-downloaded. The cache is an
+LRU bounded by `max_entries` and `max_bytes`.
+
+Typical usage:
+
+    from dropstab_base import GET
+    from dropstab_cache import install_cache
+
+    cache = install_cache()          # shared client now goes through the cache
+    GET("coins/history/price/bitcoin", params={"date": "2024-01-01"})
+    print(cache.stats())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+
+from dropstab_base import DATA_DIR, atomic_write, get_client
+
+# Where cached responses live
+CACHE_DIR = DATA_DIR / "cache"
+
+# LRU bounds
+CACHE_MAX_ENTRIES: int = 50_000
+CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+# TTL value meaning "never expires"
+FOREVER = float("inf")
+
+
+def _today() -> str:
+    return datetime.now(UTC).strftime("%Y-%m-%d")
+
+
+def _closed_before_today(*param_names: str) -> Callable[[dict], bool]:
+    """Predicate: the first present date param lies strictly before today (UTC)."""
+    def check(params: dict) -> bool:
+        for name in param_names:
+            value = params.get(name)
+            if value:
+                return str(value)[:10] < _today()
+        return False
+
+    return check
+
+
+@dataclass(frozen=True)
+class TTLRule:
+    """
+    TTL for URLs matching `pattern` (regex, searched in the URL).
+
+    Attributes:
+        pattern: Regex searched in the request URL.
+        ttl: Seconds to keep the entry fresh (FOREVER, or 0 to skip caching).
+        when: Optional predicate on the params; the rule applies only if true.
+    """
+
+    pattern: str
+    ttl: float
+    when: Callable[[dict], bool] | None = None
+
+    def matches(self, url: str, params: dict) -> bool:
+        return bool(re.search(self.pattern, url)) and (self.when is None or self.when(params))
+
+
+DEFAULT_TTL_RULES = [
+    # Historical data for closed dates never changes
+    TTLRule(r"/coins/history/price/", FOREVER, _closed_before_today("date")),
+    TTLRule(r"/coins/history/chart-by-interval/", FOREVER, _closed_before_today("to")),
+    TTLRule(r"/coins/history/fear-index", FOREVER, _closed_before_today("to")),
+    TTLRule(r"/coins/history/", 15 * 60),
+    # Detail endpoints
+    TTLRule(r"/coins/detailed/", 60 * 60),
+    TTLRule(r"/investors/[^/?]+$", 6 * 60 * 60),
+    TTLRule(r"/exchanges/[^/?]+$", 6 * 60 * 60),
+    TTLRule(r"/fundingRounds/\d+$", 6 * 60 * 60),
+    TTLRule(r"/tokenUnlocks/(?!supportedCoins|chart/)[^/?]+$", 6 * 60 * 60),
+    # Everything else (list pages in particular) is not cached
+    TTLRule(r"", 0),
+]
+
+
+@dataclass
+class CachedResponse:
+    """A cache entry as returned by `DiskResponseCache.lookup`."""
+
+    payload: object
+    fresh: bool
+    validators: dict
+    path: Path
+
+
+class DiskResponseCache:
+    """
+    LRU response cache stored as JSON files, pluggable into DropsTabClient.
+
+    Args:
+        directory: Cache directory (defaults to CACHE_DIR).
+        ttl_rules: Ordered TTL rules; the first match wins.
+        max_entries: Max number of cached responses.
+        max_bytes: Max total size of cached responses on disk.
+    """
+
+    def __init__(
+        self,
+        directory: Path = CACHE_DIR,
+        ttl_rules: list[TTLRule] | None = None,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ):
+        self.directory = Path(directory)
+        self.ttl_rules = DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "revalidated": 0, "stores": 0, "evictions": 0}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._sizes = {p: p.stat().st_size for p in self.directory.glob("*/*.json")}
+        self._total_bytes = sum(self._sizes.values())
+
+    # Keys and TTLs
+
+    @staticmethod
+    def key(url: str, params: dict) -> str:
+        """Stable key for a URL and its params (order and value types normalized)."""
+        normalized = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        raw = json.dumps([url, normalized], separators=(",", ":"))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def ttl_for(self, url: str, params: dict) -> float:
+        for rule in self.ttl_rules:
+            if rule.matches(url, params):
+                return rule.ttl
+        return 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    # Client protocol
+
+    def cacheable(self, url: str, params: dict) -> bool:
+        """Whether a TTL rule allows caching the request at all."""
+        return self.ttl_for(url, params) != 0
+
+    def lookup(self, url: str, params: dict) -> CachedResponse | None:
+        """Cached response for the request, fresh or stale; None on a miss."""
+        if self.ttl_for(url, params) == 0:
+            return None
+        path = self._path(self.key(url, params))
+        try:
+            entry = json.loads(path.read_text())
+        except (FileNotFoundError, ValueError):
+            self._count("misses")
+            return None
+
+        expires_at = entry["expires_at"]
+        fresh = expires_at is None or time.time() < expires_at
+        validators = {}
+        if entry.get("etag"):
+            validators["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            validators["If-Modified-Since"] = entry["last_modified"]
+
+        if not fresh and not validators:
+            self._count("misses")
+            return None
+        self._count("hits" if fresh else "stale")
+        os.utime(path)  # mark as recently used
+        return CachedResponse(entry["payload"], fresh, validators, path)
+
+    def store(self, url: str, params: dict, payload, headers) -> None:
+        """Cache a successful response if a TTL rule allows it."""
+        ttl = self.ttl_for(url, params)
+        if ttl == 0:
+            return
+        entry = {
+            "url": url,
+            "params": {str(k): str(v) for k, v in (params or {}).items()},
+            "stored_at": time.time(),
+            "expires_at": None if ttl == FOREVER else time.time() + ttl,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "payload": payload,
+        }
+        path = self._path(self.key(url, params))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(entry, separators=(",", ":"))
+        atomic_write(path, text)
+        size = len(text.encode())  # max_bytes counts bytes on disk, not characters
+
+        with self._lock:
+            self._stats["stores"] += 1
+            self._total_bytes += size - self._sizes.get(path, 0)
+            self._sizes[path] = size
+        self._evict()
+
+    def revalidated(self, url: str, params: dict, cached: CachedResponse, headers) -> None:
+        """Server answered 304: keep the payload and restart its TTL."""
+        self._count("revalidated")
+        self.store(url, params, cached.payload, {
+            "ETag": headers.get("ETag") or cached.validators.get("If-None-Match"),
+            "Last-Modified": headers.get("Last-Modified")
+            or cached.validators.get("If-Modified-Since"),
+        })
+
+    # Housekeeping
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both bounds hold."""
+        with self._lock:
+            if len(self._sizes) <= self.max_entries and self._total_bytes <= self.max_bytes:
+                return
+
+            def last_used(p: Path) -> float:
+                try:
+                    return p.stat().st_mtime
+                except FileNotFoundError:
+                    return 0.0
+
+            for path in sorted(self._sizes, key=last_used):
+                if len(self._sizes) <= self.max_entries and self._total_bytes <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                self._total_bytes -= self._sizes.pop(path)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            for path in self._sizes:
+                path.unlink(missing_ok=True)
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters plus current size."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"] + self._stats["stale"]
+            return {
+                **self._stats,
+                "hit_ratio": round(self._stats["hits"] / lookups, 3) if lookups else None,
+                "entries": len(self._sizes),
+                "bytes": self._total_bytes,
+            }
+
+
+def install_cache(**kwargs) -> DiskResponseCache:
+    """
+    Put a DiskResponseCache under the shared client used by `GET`.
+
+    Keyword arguments are passed to DiskResponseCache.
+    """
+    cache = DiskResponseCache(**kwargs)
+    get_client().cache = cache
+    return cache
+
+
+__all__ = [
+    "CACHE_DIR",
+    "CACHE_MAX_ENTRIES",
+    "CACHE_MAX_BYTES",
+    "FOREVER",
+    "TTLRule",
+    "DEFAULT_TTL_RULES",
+    "CachedResponse",
+    "DiskResponseCache",
+    "install_cache",
+]
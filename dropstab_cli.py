@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the DropsTab scripts.
+
+Runs endpoint scripts and the tool modules inside one interpreter instead of
+spawning a new Python process per script, so a cron job firing many small
+detail fetches pays interpreter startup (and the `requests` import) once.
+Modules are imported only when their command runs.
+
+Endpoint scripts are addressed as `<domain>/<name>`, where `<name>` is the
+file name without `fetch_` and `.py` (e.g. `coins/coin_details_by_slug`);
+a bare `<name>` works when it is unique. `--set NAME=VALUE` overrides a
+module-level constant of the script (e.g. its COIN_SLUG) before it runs.
+
+Usage examples:
+
+    # List the endpoint scripts
+    python dropstab_cli.py list
+
+    # Run endpoint scripts in-process, one after the other
+    python dropstab_cli.py fetch coins/all_coins funding_rounds/all_funding_rounds
+    python dropstab_cli.py fetch coin_details_by_slug --set COIN_SLUG=bitcoin
+
+    # Tool modules take their usual arguments
+    python dropstab_cli.py endpoint exchange_pairs exchangeSlug=binance
+    python dropstab_cli.py run-all --jobs 4 --skip exchanges
+    python dropstab_cli.py prices --pair bitcoin 2024-01-01 --output -
+    python dropstab_cli.py index --get coins symbol BTC
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import time
+import traceback
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# Tool commands: command -> module whose `main()` is called with the remaining arguments
+COMMANDS = {
+    "endpoint": "dropstab_endpoints",
+    "run-all": "run_all_dropstab",
+    "delta": "dropstab_delta",
+    "bulk": "dropstab_bulk",
+    "prices": "dropstab_prices",
+    "timeseries": "dropstab_timeseries",
+    "index": "dropstab_index",
+    "warehouse": "dropstab_warehouse",
+    "store": "dropstab_store",
+    "export": "dropstab_export",
+    "pagesize": "dropstab_pagesize",
+    "models": "dropstab_models",
+}
+
+
+def endpoint_scripts() -> dict[str, str]:
+    """`{"<domain>/<name>": relative path}` of every endpoint script."""
+    return {
+        f"{path.parent.name}/{path.stem.removeprefix('fetch_')}": str(path.relative_to(ROOT))
+        for path in sorted((ROOT / "endpoints").glob("*/fetch_*.py"))
+    }
+
+
+def resolve_script(name: str, scripts: dict[str, str] | None = None) -> str:
+    """
+    Resolve a script key (`<domain>/<name>` or a unique `<name>`) to its path.
+
+    Raises:
+        ValueError: if the name matches no script or more than one.
+    """
+    scripts = endpoint_scripts() if scripts is None else scripts
+    name = name.removesuffix(".py")
+    if name in scripts:
+        return scripts[name]
+    short = name.rsplit("/", 1)[-1].removeprefix("fetch_")
+    matches = [key for key in scripts if key.rsplit("/", 1)[-1] == short]
+    if len(matches) == 1:
+        return scripts[matches[0]]
+    if matches:
+        raise ValueError(f"Ambiguous script {name!r}: {', '.join(matches)}")
+    raise ValueError(f"Unknown script {name!r}; see `python dropstab_cli.py list`")
+
+
+def _coerce(current, value: str):
+    """Convert a --set value to the type of the constant it replaces."""
+    if isinstance(current, bool):
+        return value.lower() in ("1", "true", "yes")
+    if isinstance(current, (int, float)):
+        return type(current)(value)
+    return value
+
+
+def load_script(rel_path: str, overrides: dict[str, str] | None = None):
+    """
+    Import an endpoint script and return its `main`, after replacing the
+    module-level constants in `overrides` that the script defines.
+    """
+    from run_all_dropstab import load_main
+
+    main = load_main(rel_path)
+    namespace = main.__globals__  # the script module's globals
+    for name, value in (overrides or {}).items():
+        if name.isupper() and name in namespace:
+            namespace[name] = _coerce(namespace[name], value)
+    return main
+
+
+def fetch(names: list[str], overrides: dict[str, str]) -> int:
+    """
+    Run the named endpoint scripts in order; returns the number that failed.
+
+    Raises:
+        ValueError: if a name matches no single script, or an override
+            names a constant none of the scripts define.
+    """
+    scripts = endpoint_scripts()
+    mains = {path: load_script(path, overrides) for path in (resolve_script(n, scripts) for n in names)}
+    unused = [
+        name for name in overrides
+        if not (name.isupper() and any(name in run.__globals__ for run in mains.values()))
+    ]
+    if unused:
+        raise ValueError(f"No selected script defines {', '.join(unused)}")
+
+    failed = 0
+    for rel_path, run in mains.items():
+        start = time.perf_counter()
+        try:
+            run()
+        except Exception:
+            failed += 1
+            traceback.print_exc()
+            print(f"[{rel_path}] failed after {time.perf_counter() - start:.2f}s")
+        else:
+            print(f"[{rel_path}] done in {time.perf_counter() - start:.2f}s")
+    return failed
+
+
+def _parse_overrides(values: list[str]) -> dict[str, str]:
+    overrides = {}
+    for item in values:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"--set expects NAME=VALUE, got {item!r}")
+        overrides[name] = value
+    return overrides
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run DropsTab endpoint scripts and tools in one process.",
+        epilog="Tool commands (arguments are passed through): " + ", ".join(COMMANDS),
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List the endpoint scripts.")
+    fetch_parser = sub.add_parser("fetch", help="Run one or more endpoint scripts.")
+    fetch_parser.add_argument("scripts", nargs="+", help="<domain>/<name> or a unique <name>.")
+    fetch_parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Override a script constant, e.g. COIN_SLUG=bitcoin (repeatable).",
+    )
+    for command, module in COMMANDS.items():
+        sub.add_parser(command, help=f"Run {module}.py.", add_help=False)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        command, rest = argv[0], argv[1:]
+        sys.argv = [f"{Path(sys.argv[0]).name} {command}", *rest]
+        importlib.import_module(COMMANDS[command]).main()
+        return 0
+
+    args = parse_args(argv)
+    if args.command == "list":
+        for key, rel_path in endpoint_scripts().items():
+            print(f"{key:<55} {rel_path}")
+        return 0
+    try:
+        return 1 if fetch(args.scripts, _parse_overrides(args.overrides)) else 0
+    except (ValueError, argparse.ArgumentTypeError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Incremental (delta) sync for DropsTab list endpoints.
+
+Keeps the last synced collection of each endpoint in a local state store
+(DATA_DIR/state/<name>.json), keyed by entity id or slug. Each sync:
+
+  - pages through the endpoint one page at a time; for endpoints sorted
+    newest-first by a date field (funding rounds, crypto activities) paging
+    stops at the first page that reaches records older than the previous
+    sync's newest record, so no page past that point is requested,
+  - merges the fetched records into the stored ones, fetched (newest) first,
+  - writes the merged snapshot (same envelope as the full scripts) plus a
+    change set `{added, changed, removed}` next to it in RAW_DIR.
+
+Removed records can only be detected on full scans, so early-stopping
+endpoints report `removed` as an empty list. An empty page before the last
+page announced by `totalPages` aborts the sync instead of being read as the
+end of the data, which would report every later record as removed.
+
+Usage examples:
+
+    # Delta-sync everything supported
+    python dropstab_delta.py
+
+    # Only funding rounds and activities
+    python dropstab_delta.py funding_rounds crypto_activities
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from dropstab_base import (
+    DATA_DIR,
+    GET,
+    PAGE_SIZE,
+    RAW_DIR,
+    SnapshotWriter,
+    atomic_write,
+    get_serializer,
+    read_json,
+    today_tag,
+    utc_now_iso,
+)
+from dropstab_endpoints import ENDPOINTS
+
+# Local state store (last merged collection per endpoint)
+STATE_DIR = DATA_DIR / "state"
+
+
+@dataclass(frozen=True)
+class DeltaSpec:
+    """
+    How to delta-sync one list endpoint.
+
+    Attributes:
+        path: Endpoint path relative to API_BASE.
+        name: Snapshot/state name, matches the full script's file prefix.
+        id_keys: Candidate record keys identifying an entity, tried in order.
+        date_key: Field the endpoint sorts by (newest first); enables
+            early stopping. None means every sync is a full scan.
+    """
+
+    path: str
+    name: str
+    id_keys: tuple = ("id", "slug")
+    date_key: str | None = None
+
+    @classmethod
+    def from_endpoint(cls, key: str) -> DeltaSpec:
+        """Spec for a paginated list endpoint registered in dropstab_endpoints.ENDPOINTS."""
+        spec = ENDPOINTS[key]
+        return cls(spec.path, spec.name, spec.id_keys, spec.date_key)
+
+
+DELTA_SPECS = {
+    key: DeltaSpec.from_endpoint(key)
+    for key in ("funding_rounds", "crypto_activities", "coins", "investors")
+}
+
+
+def _record_id(record: dict, id_keys: tuple) -> str | None:
+    for key in id_keys:
+        value = record.get(key) if isinstance(record, dict) else None
+        if value is not None:
+            return str(value)
+    return None
+
+
+def _as_timestamp(value) -> float | None:
+    """Normalize epoch seconds/milliseconds or ISO 8601 strings to epoch seconds."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _iter_pages_sequential(path: str, label: str, page_size: int = PAGE_SIZE) -> Iterator[list]:
+    """
+    Yield the `content` list of each page of `path`, fetching one page at a time.
+
+    Unlike `iter_pages`, no page is requested before the caller asks for it,
+    so breaking out of the loop wastes no requests.
+
+    Raises:
+        RuntimeError: If a page before the last one announced by `totalPages`
+            comes back empty.
+    """
+    page = 0
+    while True:
+        resp = GET(path, params={"page": page, "pageSize": page_size})
+        data = resp.get("data", {}) if isinstance(resp, dict) else {}
+        content = data.get("content", [])
+        total_pages = data.get("totalPages")
+        print(
+            f"[{label}] page {page}/"
+            f"{(total_pages - 1) if total_pages is not None else '?'} "
+            f"with {len(content)} items"
+        )
+        if not content:
+            if total_pages is not None and page < total_pages and (page > 0 or total_pages > 1):
+                raise RuntimeError(f"[{label}] page {page} of {total_pages} is unexpectedly empty")
+            return
+        yield content
+        page += 1
+        if total_pages is None or page >= total_pages:
+            return
+
+
+def load_state(name: str) -> dict:
+    """Stored state for `name`, or an empty state if never synced."""
+    try:
+        return read_json(STATE_DIR / f"{name}.json")
+    except (FileNotFoundError, ValueError):
+        return {"synced_at": None, "watermark": None, "records": {}}
+
+
+def save_state(name: str, state: dict) -> None:
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    atomic_write(STATE_DIR / f"{name}.json", get_serializer().dumps(state))
+
+
+def delta_sync(spec: DeltaSpec) -> dict:
+    """
+    Run one delta sync for `spec` and write the merged snapshot and change set.
+
+    Returns:
+        Summary dict with counts of fetched, added, changed and removed records.
+    """
+    state = load_state(spec.name)
+    old_records: dict = state["records"]
+    watermark = state["watermark"] if old_records else None
+
+    fetched: dict = {}
+    full_scan = True
+    newest = watermark
+    for content in _iter_pages_sequential(spec.path, label=f"{spec.path} delta"):
+        reached_old = False
+        for record in content:
+            record_id = _record_id(record, spec.id_keys)
+            if record_id is None:
+                continue
+            fetched[record_id] = record
+            if spec.date_key:
+                ts = _as_timestamp(record.get(spec.date_key))
+                if ts is not None:
+                    newest = ts if newest is None else max(newest, ts)
+                    if watermark is not None and ts < watermark:
+                        reached_old = True
+        if reached_old:
+            full_scan = False
+            print(f"[{spec.path} delta] reached records older than last sync, stopping")
+            break
+
+    added = [rec for rid, rec in fetched.items() if rid not in old_records]
+    changed = [
+        rec for rid, rec in fetched.items()
+        if rid in old_records and old_records[rid] != rec
+    ]
+    if full_scan:
+        removed = [rid for rid in old_records if rid not in fetched]
+        merged = fetched
+    else:
+        removed = []
+        # Fetched records are the newest, so they lead the merged snapshot
+        merged = {**fetched, **{rid: rec for rid, rec in old_records.items() if rid not in fetched}}
+
+    tag = today_tag()
+    filename = RAW_DIR / f"{spec.name}_{tag}.json"
+    envelope = {
+        "data_ts_utc": utc_now_iso(),
+        "status": "ok",
+        "endpoint": spec.path,
+        "sync_mode": "delta",
+    }
+    with SnapshotWriter(filename, envelope) as writer:
+        writer.write_items(merged.values())
+
+    changes_file = RAW_DIR / f"{spec.name}_changes_{tag}.json"
+    with SnapshotWriter(
+        changes_file,
+        {**envelope, "since": state["synced_at"], "full_scan": full_scan, "removed": removed},
+    ) as changes:
+        changes.write_items([{"change": "added", "record": rec} for rec in added])
+        changes.write_items([{"change": "changed", "record": rec} for rec in changed])
+
+    save_state(
+        spec.name,
+        {"synced_at": envelope["data_ts_utc"], "watermark": newest, "records": merged},
+    )
+
+    summary = {
+        "fetched": len(fetched),
+        "added": len(added),
+        "changed": len(changed),
+        "removed": len(removed),
+        "total": len(merged),
+    }
+    print(f"Finished writing {filename} and {changes_file} ({summary})")
+    return summary
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Delta-sync DropsTab list endpoints against the local state store.",
+    )
+    parser.add_argument(
+        "keys",
+        nargs="*",
+        metavar="KEY",
+        help=f"Endpoints to sync (default: all). Choices: {', '.join(DELTA_SPECS)}.",
+    )
+    args = parser.parse_args()
+    unknown = sorted(set(args.keys) - set(DELTA_SPECS))
+    if unknown:
+        parser.error(f"unknown endpoint key(s): {', '.join(unknown)}")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    for key in args.keys or DELTA_SPECS:
+        delta_sync(DELTA_SPECS[key])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Declarative registry of the DropsTab endpoints and one engine that fetches them.
+
+Each endpoint is described once in ENDPOINTS (path template, pagination
+style, default query params, record id keys, output file prefix);
+`fetch_endpoint` does the rest the same way for every endpoint: it fills in
+the path, pages through list endpoints with `iter_pages` (concurrent pages,
+checkpoints, streaming `SnapshotWriter`) or makes a single `GET`, builds the
+snapshot envelope and writes `RAW_DIR/<name>_YYYYMMDD.json`. The scripts in
+endpoints/ are thin wrappers around it, so changes to fetching, retries or
+output apply to all of them at once. `fetch_records` fetches the same way
+but returns typed records (dropstab_models), converting each page as it
+arrives instead of writing a snapshot.
+
+Path placeholders are passed as keyword arguments and also recorded in the
+envelope (e.g. `"coinSlug": "the-graph"`).
+
+Usage examples:
+
+    # List the registered endpoints
+    python dropstab_endpoints.py
+
+    # Fetch one; placeholders and query params as NAME=VALUE
+    python dropstab_endpoints.py coins
+    python dropstab_endpoints.py exchange_pairs exchangeSlug=binance
+    python dropstab_endpoints.py coin_price slug=bitcoin --param date=2024-01-01
+
+    from dropstab_endpoints import fetch_endpoint, fetch_records
+    fetch_endpoint("token_unlocks_chart", coinSlug="the-graph")
+    pairs = fetch_records("exchange_pairs", exchangeSlug="binance")
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import string
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dropstab_base import (
+    RAW_DIR,
+    GET,
+    SnapshotWriter,
+    atomic_write,
+    clear_checkpoint,
+    get_serializer,
+    iter_pages,
+    latest_snapshot,
+    read_json,
+    today_tag,
+    utc_now_iso,
+)
+from dropstab_models import (
+    ChartPoint,
+    Coin,
+    CryptoActivity,
+    Exchange,
+    ExchangePair,
+    FundingRound,
+    Investor,
+    Record,
+    TokenUnlock,
+    to_records,
+)
+
+# Pagination styles understood by the engine
+PAGES = "pages"    # page/pageSize -> content/totalPages, via iter_pages
+SINGLE = "single"  # one GET, the unwrapped `data` becomes `items`
+
+
+@dataclass(frozen=True)
+class EndpointSpec:
+    """
+    Everything the engine needs to fetch one endpoint.
+
+    Attributes:
+        path: Path template relative to API_BASE, with `{placeholders}`.
+        name: Output file prefix template (same placeholders); the snapshot
+            is written to `RAW_DIR/<name>_YYYYMMDD.json`.
+        pagination: PAGES or SINGLE.
+        params: Default query params. None means the endpoint takes none
+            and the envelope has no `query_params`.
+        id_keys: Candidate record keys identifying an entity, tried in order.
+        date_key: Field list items are sorted by, newest first (if any).
+        as_list: Wrap a single-object SINGLE response into a one-item list.
+        fetcher: Replaces the GET of a SINGLE endpoint:
+            `fn(path, path_params, params) -> items`.
+        extra: Additional envelope fields.
+        model: Record model of the items (dropstab_models), if any.
+    """
+
+    path: str
+    name: str
+    pagination: str = SINGLE
+    params: dict | None = None
+    id_keys: tuple = ("id", "slug")
+    date_key: str | None = None
+    as_list: bool = False
+    fetcher: Callable[[str, dict, dict], object] | None = None
+    extra: dict = field(default_factory=dict)
+    model: type[Record] | None = None
+
+    @property
+    def placeholders(self) -> list[str]:
+        """Names of the `{placeholders}` in `path`."""
+        return [name for _, name, _, _ in string.Formatter().parse(self.path) if name]
+
+
+def _chart_range(path: str, path_params: dict, params: dict) -> list:
+    """
+    Chunked chart-by-interval download (see dropstab_timeseries.fetch_chart_items):
+    the raw API items, de-duplicated by timestamp. Their normalized points are
+    also merged into the chart's time-series store.
+    """
+    from dropstab_timeseries import CHART_COLUMNS, fetch_chart_items, merge_chart, parse_points
+
+    missing = [key for key in ("from", "to") if not params.get(key)]
+    if missing:
+        raise ValueError(
+            f"{path} needs the {' and '.join(missing)} query param(s) as LocalDateTime, "
+            "e.g. from=2024-01-01T00:00:00 to=2024-02-01T00:00:00"
+        )
+    interval = params.get("interval", "hour")
+    extra = {k: v for k, v in params.items() if k not in ("from", "to", "interval")}
+    items = fetch_chart_items(path_params["slug"], params["from"], params["to"], interval, params=extra)
+    merge_chart(path_params["slug"], interval, parse_points(items, CHART_COLUMNS))
+    return items
+
+
+def _fear_index(path: str, path_params: dict, params: dict) -> object:
+    """
+    Full fear-index history as raw API items: the previous snapshot's items
+    plus only the tail after them (see dropstab_timeseries.update_fear_index_items).
+    """
+    from dropstab_timeseries import update_fear_index_items
+
+    previous = latest_snapshot(ENDPOINTS["fear_index"].name)
+    items = read_json(previous).get("items", []) if previous is not None else []
+    return update_fear_index_items(items if isinstance(items, list) else [], start=params["from"])
+
+
+ENDPOINTS: dict[str, EndpointSpec] = {
+    # Coins
+    "coins": EndpointSpec("coins", "coins_all", PAGES, id_keys=("slug", "id"), model=Coin),
+    "coins_supported": EndpointSpec(
+        "coins/supported", "coins_supported_all", PAGES, id_keys=("slug", "id"), model=Coin
+    ),
+    "coin_details": EndpointSpec("coins/detailed/{slug}", "coin_detailed_{slug}", model=Coin),
+    # Token unlocks
+    "token_unlocks": EndpointSpec("tokenUnlocks", "tokenUnlocks_all", PAGES, model=TokenUnlock),
+    "token_unlocks_supported": EndpointSpec(
+        "tokenUnlocks/supportedCoins", "tokenUnlocks_supportedCoins_all", PAGES, id_keys=("slug", "coinSlug"),
+        model=Coin,
+    ),
+    "token_unlocks_by_coin": EndpointSpec("tokenUnlocks/{coinSlug}", "tokenUnlocks_{coinSlug}", model=TokenUnlock),
+    "token_unlocks_chart": EndpointSpec("tokenUnlocks/chart/{coinSlug}", "tokenUnlocks_chart_{coinSlug}", params={}),
+    # Funding rounds
+    "funding_rounds": EndpointSpec("fundingRounds", "fundingRounds_all", PAGES, date_key="date", model=FundingRound),
+    "funding_round_details": EndpointSpec("fundingRounds/{id}", "fundingRound_{id}", model=FundingRound),
+    "funding_rounds_by_coin": EndpointSpec(
+        "fundingRounds/coin/{coinSlug}", "fundingRounds_coin_{coinSlug}", as_list=True, model=FundingRound
+    ),
+    # Investors
+    "investors": EndpointSpec("investors", "investors_list_all", PAGES, id_keys=("slug", "id"), model=Investor),
+    "investor_details": EndpointSpec("investors/{investorSlug}", "investor_{investorSlug}", model=Investor),
+    # History
+    "fear_index": EndpointSpec(
+        "coins/history/fear-index",
+        "fear_index_history",
+        params={"from": "2010-01-01T00:00:00"},
+        id_keys=("timestamp",),
+        fetcher=_fear_index,
+    ),
+    "coin_price": EndpointSpec("coins/history/price/{slug}", "coin_price_{slug}", params={}),
+    "coin_chart_timeframe": EndpointSpec(
+        "coins/history/chart-by-timeframe/{slug}",
+        "coin_chart_timeframe_{slug}",
+        params={"timeFrame": "DAY"},
+        model=ChartPoint,
+    ),
+    "coin_chart_interval": EndpointSpec(
+        "coins/history/chart-by-interval/{slug}",
+        "coin_chart_interval_{slug}",
+        params={"interval": "hour"},
+        id_keys=("timestamp",),
+        fetcher=_chart_range,
+        model=ChartPoint,
+    ),
+    # Crypto activities
+    "crypto_activities": EndpointSpec(
+        "cryptoActivities", "cryptoActivities_all", PAGES, date_key="date", model=CryptoActivity
+    ),
+    "crypto_activity": EndpointSpec("cryptoActivities/{id}", "cryptoActivity_{id}", model=CryptoActivity),
+    "crypto_activities_by_coin": EndpointSpec(
+        "cryptoActivities/coin/{coinSlug}", "cryptoActivities_coin_{coinSlug}", PAGES, date_key="date",
+        model=CryptoActivity,
+    ),
+    # Exchanges
+    "exchanges": EndpointSpec("exchanges", "exchanges_all", PAGES, id_keys=("slug", "id"), model=Exchange),
+    "exchange_details": EndpointSpec("exchanges/{exchangeSlug}", "exchange_{exchangeSlug}", model=Exchange),
+    "exchange_pairs": EndpointSpec(
+        "exchanges/{exchangeSlug}/pairs", "exchange_pairs_{exchangeSlug}", PAGES, id_keys=("symbol",),
+        model=ExchangePair,
+    ),
+}
+
+
+def _get(path: str, path_params: dict, params: dict | None) -> object:
+    resp = GET(path, params=params)
+    # unwrap common API pattern: {"data": [...]} or just [...]
+    return resp.get("data", resp) if isinstance(resp, dict) else resp
+
+
+def _resolve(endpoint: str | EndpointSpec, params: dict | None, path_params: dict) -> tuple:
+    """`(spec, path, query)` for a fetch; query is None when the endpoint takes no params."""
+    spec = ENDPOINTS[endpoint] if isinstance(endpoint, str) else endpoint
+    expected = spec.placeholders
+    if sorted(path_params) != sorted(expected):
+        raise ValueError(
+            f"{spec.path} expects path params {expected}, got {sorted(path_params)}"
+        )
+    query = None if spec.params is None and params is None else {**(spec.params or {}), **(params or {})}
+    return spec, spec.path.format(**path_params), query
+
+
+def _checkpoint_name(name: str, query: dict | None) -> str:
+    """
+    Undated checkpoint name of a crawl: the snapshot name plus a digest of its
+    query params, so a crawl interrupted before UTC midnight resumes after it.
+    """
+    if not query:
+        return name
+    digest = hashlib.blake2b(json.dumps(query, sort_keys=True).encode(), digest_size=4).hexdigest()
+    return f"{name}_{digest}"
+
+
+def fetch_endpoint(
+    endpoint: str | EndpointSpec,
+    params: dict | None = None,
+    **path_params: str,
+) -> Path:
+    """
+    Fetch an endpoint and write its snapshot to RAW_DIR.
+
+    Args:
+        endpoint: Key in ENDPOINTS, or a spec.
+        params: Query params, merged over the spec's defaults.
+        **path_params: Values for the path placeholders (e.g. `coinSlug="the-graph"`).
+
+    Returns:
+        The snapshot file written.
+
+    Raises:
+        KeyError: for an unknown endpoint key.
+        ValueError: if placeholders are missing or unexpected.
+    """
+    spec, path, query = _resolve(endpoint, params, path_params)
+    name = spec.name.format(**path_params)
+    filename = RAW_DIR / f"{name}_{today_tag()}.json"
+
+    envelope = {
+        "data_ts_utc": utc_now_iso(),
+        "status": "ok",
+        "endpoint": spec.path,
+        **path_params,
+        **spec.extra,
+    }
+    if query is not None:
+        envelope["query_params"] = query
+
+    if spec.pagination == PAGES:
+        checkpoint = _checkpoint_name(name, query)
+        with SnapshotWriter(filename, envelope) as writer:
+            for content in iter_pages(path, params=query, checkpoint=checkpoint):
+                writer.write_items(content)
+        clear_checkpoint(checkpoint)
+        print(f"Finished writing {filename} (items: {writer.count})")
+        return filename
+
+    data = (spec.fetcher or _get)(path, path_params, query)
+    if spec.as_list and not isinstance(data, list):
+        data = [data]
+    atomic_write(filename, get_serializer().dumps({**envelope, "items": data}, indent=True))
+    count = f" (items: {len(data)})" if isinstance(data, list) else ""
+    print(f"Finished writing {filename}{count}")
+    return filename
+
+
+def fetch_records(
+    endpoint: str | EndpointSpec,
+    params: dict | None = None,
+    **path_params: str,
+) -> list[Record]:
+    """
+    Fetch an endpoint as typed records, without writing a snapshot.
+
+    List pages are converted as they arrive, so only the records (not the
+    raw items) are held in memory; single responses become a list of one
+    record for detail endpoints.
+
+    Raises:
+        KeyError: for an unknown endpoint key.
+        ValueError: if placeholders are missing or unexpected, or the
+            endpoint has no record model.
+    """
+    spec, path, query = _resolve(endpoint, params, path_params)
+    if spec.model is None:
+        raise ValueError(f"{spec.path} has no record model")
+
+    if spec.pagination == PAGES:
+        records = []
+        for content in iter_pages(path, params=query):
+            records.extend(to_records(content, spec.model))
+        return records
+
+    data = (spec.fetcher or _get)(path, path_params, query)
+    return to_records(data if isinstance(data, list) else [data], spec.model)
+
+
+def _assignments(values: list[str]) -> dict[str, str]:
+    pairs = {}
+    for item in values:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {item!r}")
+        pairs[name] = value
+    return pairs
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fetch a registered DropsTab endpoint.")
+    parser.add_argument("endpoint", nargs="?", choices=list(ENDPOINTS), help="Endpoint key (omit to list).")
+    parser.add_argument("path_params", nargs="*", metavar="NAME=VALUE", help="Path placeholder values.")
+    parser.add_argument(
+        "--param", action="append", default=[], metavar="NAME=VALUE", help="Query param (repeatable)."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.endpoint is None:
+        for key, spec in ENDPOINTS.items():
+            print(f"{key:<26} {spec.pagination:<7} {spec.path}")
+        return
+    fetch_endpoint(
+        args.endpoint,
+        params=_assignments(args.param) or None,
+        **_assignments(args.path_params),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Columnar export of JSON snapshots to Arrow IPC or Parquet.
+
+Flattens the `items` of a snapshot (nested dicts become `parent.child`
+columns, lists are kept as JSON strings) into one typed table per file
+under COLUMNAR_DIR. Column names and types are recorded per endpoint in
+SCHEMA_DIR/<endpoint>.json, so every day's table for an endpoint has the
+same schema: new fields are appended as new columns, and a column's type
+only ever widens (null -> bool -> int64 -> float64 -> string), never changes
+arbitrarily between days. A column that has only held nulls so far is
+written with Arrow's null type, so it does not claim to be a string column.
+Per-entity snapshots (pairs of one exchange, chart of one coin) share one
+schema per endpoint, e.g. `exchange_pairs` for every exchange.
+
+Arrow IPC files can be memory-mapped, so loading a day's coin universe is
+a zero-copy open (`load_table("coins_all")`).
+
+Usage examples:
+
+    # Export the latest list, exchange-pair and chart snapshots (Arrow IPC)
+    python dropstab_export.py
+
+    # Export specific snapshots as Parquet
+    python dropstab_export.py --format parquet data/raw/coins_all_20251116.json
+
+Requires `pyarrow` (optional dependency, not needed by the fetch scripts).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # optional dependency
+    pa = None
+
+from dropstab_base import DATA_DIR, atomic_write, latest_snapshot, latest_snapshots, read_json
+
+# Columnar tables and their per-endpoint schemas
+COLUMNAR_DIR = DATA_DIR / "columnar"
+SCHEMA_DIR = COLUMNAR_DIR / "schemas"
+
+# List snapshots exported by default
+DEFAULT_SNAPSHOTS = [
+    "coins_all",
+    "coins_supported_all",
+    "fundingRounds_all",
+    "investors_list_all",
+    "tokenUnlocks_all",
+    "tokenUnlocks_supportedCoins_all",
+    "cryptoActivities_all",
+    "exchanges_all",
+    "fear_index_history",
+]
+
+# Per-entity snapshots `<prefix>_<slug>_YYYYMMDD.json` exported by default
+# (newest per slug); every slug of a prefix shares the prefix's schema
+DEFAULT_ENTITY_SNAPSHOTS = [
+    "exchange_pairs",
+    "coin_chart_timeframe",
+    "coin_chart_interval",
+    "tokenUnlocks_chart",
+]
+
+# Nested dicts deeper than this are stored as JSON strings
+FLATTEN_DEPTH = 2
+
+# Type widening order; a column's type only moves to the right
+_TYPE_ORDER = ["null", "bool", "int64", "float64", "string"]
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("dropstab_export requires pyarrow. Install it with `pip install pyarrow`.")
+
+
+def flatten(item, prefix: str = "", depth: int = 0) -> dict:
+    """Flatten nested dicts into `a.b` keys; lists and deeper dicts become JSON."""
+    if not isinstance(item, dict):
+        if isinstance(item, list):
+            # Chart-style rows ([ts, price, ...]) become positional columns
+            return {f"c{i}": v for i, v in enumerate(item)}
+        return {"value": item}
+
+    row = {}
+    for key, value in item.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and depth < FLATTEN_DEPTH:
+            row.update(flatten(value, f"{name}.", depth + 1))
+        elif isinstance(value, (dict, list)):
+            row[name] = json.dumps(value, separators=(",", ":"))
+        else:
+            row[name] = value
+    return row
+
+
+def _type_of(value) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int64" if -(2**63) <= value < 2**63 else "float64"
+    if isinstance(value, float):
+        return "float64"
+    return "string"
+
+
+def _widen(a: str, b: str) -> str:
+    return _TYPE_ORDER[max(_TYPE_ORDER.index(a), _TYPE_ORDER.index(b))]
+
+
+def endpoint_name(snapshot: Path) -> str:
+    """
+    Endpoint/schema name of a snapshot: its stem without the date tag, or the
+    DEFAULT_ENTITY_SNAPSHOTS prefix for a per-entity snapshot.
+    """
+    stem = Path(snapshot).stem
+    head, _, tag = stem.rpartition("_")
+    name = head if tag.isdigit() and len(tag) == 8 else stem
+    for prefix in DEFAULT_ENTITY_SNAPSHOTS:
+        if name.startswith(f"{prefix}_"):
+            return prefix
+    return name
+
+
+def default_snapshots() -> list[Path]:
+    """Latest snapshot of every DEFAULT_SNAPSHOTS name and DEFAULT_ENTITY_SNAPSHOTS entity."""
+    snapshots = [path for path in (latest_snapshot(name) for name in DEFAULT_SNAPSHOTS) if path]
+    for prefix in DEFAULT_ENTITY_SNAPSHOTS:
+        snapshots.extend(latest_snapshots(prefix).values())
+    return snapshots
+
+
+def load_schema(name: str) -> dict:
+    """Recorded `{column: type}` schema for an endpoint (insertion-ordered)."""
+    try:
+        return json.loads((SCHEMA_DIR / f"{name}.json").read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def update_schema(name: str, rows: list[dict]) -> dict:
+    """Merge the columns/types seen in `rows` into the recorded schema and save it."""
+    schema = load_schema(name)
+    before = dict(schema)
+    for row in rows:
+        for column, value in row.items():
+            schema[column] = _widen(schema.get(column, "null"), _type_of(value))
+    if schema != before:
+        SCHEMA_DIR.mkdir(parents=True, exist_ok=True)
+        atomic_write(SCHEMA_DIR / f"{name}.json", json.dumps(schema, indent=2))
+    return schema
+
+
+def _arrow_type(name: str):
+    return {
+        "null": pa.null(),  # no value seen yet; widens once one is
+        "bool": pa.bool_(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+    }[name]
+
+
+def _coerce(value, type_name: str):
+    if value is None:
+        return None
+    if type_name in ("string", "null"):
+        return value if isinstance(value, str) else json.dumps(value)
+    if type_name == "float64":
+        return float(value)
+    if type_name == "int64":
+        return int(value)
+    return value
+
+
+def to_table(name: str, items: list):
+    """Build a typed Arrow table for `items` using the endpoint's recorded schema."""
+    _require_pyarrow()
+    if isinstance(items, dict):
+        items = [items]
+    rows = [flatten(item) for item in items]
+    schema = update_schema(name, rows)
+
+    arrays = []
+    fields = []
+    for column, type_name in schema.items():
+        arrow_type = _arrow_type(type_name)
+        values = [_coerce(row.get(column), type_name) for row in rows]
+        arrays.append(pa.array(values, type=arrow_type))
+        fields.append(pa.field(column, arrow_type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def export_snapshot(snapshot: Path, fmt: str = "arrow") -> Path:
+    """
+    Export one JSON snapshot to COLUMNAR_DIR as `<stem>.arrow` or `<stem>.parquet`.
+
+    Returns:
+        Path of the written table.
+    """
+    _require_pyarrow()
+    snapshot = Path(snapshot)
+    payload = read_json(snapshot)
+    table = to_table(endpoint_name(snapshot), payload.get("items", []))
+    table = table.replace_schema_metadata({
+        "endpoint": str(payload.get("endpoint", "")),
+        "data_ts_utc": str(payload.get("data_ts_utc", "")),
+    })
+
+    COLUMNAR_DIR.mkdir(parents=True, exist_ok=True)
+    target = COLUMNAR_DIR / f"{snapshot.stem}.{fmt}"
+    tmp = target.with_name(target.name + ".tmp")
+    if fmt == "parquet":
+        pyarrow.parquet.write_table(table, tmp)
+    else:
+        with pa.OSFile(str(tmp), "wb") as sink, pyarrow.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    tmp.replace(target)
+    print(f"Exported {snapshot.name} -> {target} ({table.num_rows} rows, {table.num_columns} columns)")
+    return target
+
+
+def load_table(name: str, tag: str | None = None, memory_map: bool = True):
+    """
+    Load an exported table by snapshot name, e.g. `load_table("coins_all")`.
+
+    Picks the newest `<name>_YYYYMMDD` table (or the one for `tag`), preferring
+    Arrow IPC, which is memory-mapped (zero-copy) when `memory_map` is set.
+    """
+    _require_pyarrow()
+    pattern = f"{name}_{tag}" if tag else f"{name}_[0-9]*"
+    for suffix in ("arrow", "parquet"):
+        candidates = sorted(COLUMNAR_DIR.glob(f"{pattern}.{suffix}"))
+        if not candidates:
+            continue
+        path = candidates[-1]
+        if suffix == "parquet":
+            return pyarrow.parquet.read_table(path, memory_map=memory_map)
+        source = pa.memory_map(str(path)) if memory_map else pa.OSFile(str(path))
+        return pyarrow.ipc.open_file(source).read_all()
+    raise FileNotFoundError(f"No exported table for {pattern} in {COLUMNAR_DIR}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export JSON snapshots to Arrow/Parquet.")
+    parser.add_argument(
+        "snapshots",
+        nargs="*",
+        type=Path,
+        help="Snapshot files to export (default: latest list, pair and chart snapshots).",
+    )
+    parser.add_argument("--format", choices=["arrow", "parquet"], default="arrow")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    snapshots = args.snapshots or default_snapshots()
+    for snapshot in snapshots:
+        export_snapshot(snapshot, args.format)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Local lookup index over the latest list snapshots.
+
+Builds one SQLite file (INDEX_FILE) from the newest `*_all_YYYYMMDD.json`
+snapshots in RAW_DIR so lookups never load or scan the raw JSON:
+
+  - `keys`: exact-match indexes by id, slug and symbol (slug and symbol
+    are case-insensitive) for coins, investors, exchanges, funding rounds,
+    token unlocks and crypto activities,
+  - `links`: secondary indexes coin -> funding rounds, investor -> funding
+    rounds, coin -> token unlocks, coin -> crypto activities and
+    exchange -> pairs (from `exchange_pairs_<slug>_YYYYMMDD.json` files),
+  - `records`: each item as compact JSON, returned by the lookups.
+
+The index is written to a temporary file and swapped in atomically, so
+readers always see a complete index. Reads open it read-only and
+memory-mapped; a lookup is a single B-tree probe.
+
+Usage examples:
+
+    # (Re)build the index from the latest snapshots
+    python dropstab_index.py
+
+    # Look things up
+    python dropstab_index.py --get coins symbol BTC
+    python dropstab_index.py --linked investor_rounds a16z
+
+    from dropstab_index import LocalIndex
+    with LocalIndex() as index:
+        btc = index.get("coins", "symbol", "btc")
+        rounds = index.linked("coin_rounds", "bitcoin")
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from dropstab_base import DATA_DIR, latest_snapshot, latest_snapshots, read_json, utc_now_iso
+from dropstab_models import entities, to_slug
+
+# Where the index lives
+INDEX_DIR = DATA_DIR / "index"
+INDEX_FILE = INDEX_DIR / "lookup.sqlite"
+
+# Bytes of the index file memory-mapped by readers
+MMAP_SIZE: int = 256 * 1024 * 1024
+
+# Key fields whose values are matched case-insensitively
+_FOLDED_FIELDS = {"slug", "symbol"}
+
+_SCHEMA = """
+CREATE TABLE records (rid INTEGER PRIMARY KEY, kind TEXT NOT NULL, data TEXT NOT NULL);
+CREATE TABLE keys (kind TEXT NOT NULL, field TEXT NOT NULL, value TEXT NOT NULL, rid INTEGER NOT NULL);
+CREATE TABLE links (relation TEXT NOT NULL, key TEXT NOT NULL, rid INTEGER NOT NULL);
+CREATE TABLE sources (
+    kind TEXT PRIMARY KEY, snapshot TEXT, data_ts_utc TEXT, count INTEGER, built_utc TEXT
+);
+"""
+
+# Created after the bulk insert, which is much faster than maintaining them row by row
+_INDEXES = """
+CREATE INDEX keys_lookup ON keys (kind, field, value);
+CREATE INDEX links_lookup ON links (relation, key);
+"""
+
+
+def _linker(*keys: str) -> Callable[[dict], list[str]]:
+    """Slugs referenced by an item under `keys` (strings, {slug} dicts or lists of either)."""
+    return lambda item: [slug for slug in map(to_slug, entities(item, *keys)) if slug]
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """
+    What to index for one kind of record.
+
+    Attributes:
+        kind: Record kind used in lookups (e.g. "coins").
+        snapshot: List snapshot name read from RAW_DIR.
+        fields: Item fields indexed in `keys`.
+        links: `{relation: fn(item) -> keys}` secondary indexes.
+    """
+
+    kind: str
+    snapshot: str
+    fields: tuple = ("id", "slug")
+    links: tuple = ()
+
+
+INDEX_SPECS = [
+    IndexSpec("coins", "coins_all", ("id", "slug", "symbol")),
+    IndexSpec("investors", "investors_list_all"),
+    IndexSpec("exchanges", "exchanges_all"),
+    IndexSpec(
+        "funding_rounds",
+        "fundingRounds_all",
+        ("id", "slug"),
+        (
+            ("coin_rounds", _linker("coinSlug", "coin", "coins")),
+            ("investor_rounds", _linker("investors", "leadInvestors", "funds")),
+        ),
+    ),
+    IndexSpec(
+        "token_unlocks",
+        "tokenUnlocks_all",
+        ("id", "slug", "symbol"),
+        (("coin_unlocks", _linker("coinSlug", "coin", "slug")),),
+    ),
+    IndexSpec(
+        "crypto_activities",
+        "cryptoActivities_all",
+        ("id",),
+        (("coin_activities", _linker("coinSlug", "coin", "coins")),),
+    ),
+]
+
+
+def _items(path: Path) -> tuple[list, dict]:
+    payload = read_json(path)
+    items = payload.get("items", [])
+    if isinstance(items, dict):
+        items = items.get("content") or items.get("pairs") or [items]
+    return [i for i in items if isinstance(i, dict)], payload
+
+
+def _key_value(field: str, value) -> str | None:
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    value = str(value)
+    return value.lower() if field in _FOLDED_FIELDS else value
+
+
+def build_index(path: Path = INDEX_FILE) -> dict:
+    """
+    Rebuild the lookup index from the latest snapshots in RAW_DIR.
+
+    Returns:
+        `{kind: record count}` for every kind that had a snapshot.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+
+    counts: dict[str, int] = {}
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;" + _SCHEMA)
+        rid = 0
+        with conn:
+            sources = [(spec, latest_snapshot(spec.snapshot)) for spec in INDEX_SPECS]
+            for exchange, pairs_file in latest_snapshots("exchange_pairs").items():
+                links = (("exchange_pairs", lambda item, slug=exchange.lower(): [slug]),)
+                sources.append((IndexSpec("pairs", pairs_file.stem, ("id", "symbol"), links), pairs_file))
+
+            for spec, snapshot in sources:
+                if snapshot is None:
+                    continue
+                items, payload = _items(snapshot)
+                records, keys, links = [], [], []
+                for item in items:
+                    rid += 1
+                    records.append((rid, spec.kind, json.dumps(item, separators=(",", ":"))))
+                    for field in spec.fields:
+                        value = _key_value(field, item.get(field))
+                        if value is not None:
+                            keys.append((spec.kind, field, value, rid))
+                    for relation, linker in spec.links:
+                        links.extend((relation, key, rid) for key in set(linker(item)))
+
+                conn.executemany("INSERT INTO records VALUES (?, ?, ?)", records)
+                conn.executemany("INSERT INTO keys VALUES (?, ?, ?, ?)", keys)
+                conn.executemany("INSERT INTO links VALUES (?, ?, ?)", links)
+                conn.execute(
+                    "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, "
+                    "COALESCE((SELECT count FROM sources WHERE kind = ?), 0) + ?, ?)",
+                    (spec.kind, snapshot.name, payload.get("data_ts_utc"), spec.kind, len(records),
+                     utc_now_iso()),
+                )
+                counts[spec.kind] = counts.get(spec.kind, 0) + len(records)
+            conn.executescript(_INDEXES)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    os.replace(tmp, path)
+    print(f"Index written to {path}: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+    return counts
+
+
+class LocalIndex:
+    """
+    Read-only, memory-mapped view of the lookup index.
+
+    Connections are not shared between threads; open one LocalIndex per thread.
+
+    Args:
+        path: Index file (defaults to INDEX_FILE).
+    """
+
+    def __init__(self, path: Path = INDEX_FILE):
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"No index at {path}; run `python dropstab_index.py` first.")
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        self.conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+
+    def find(self, kind: str, field: str, value) -> list[dict]:
+        """All `kind` records whose `field` equals `value`."""
+        rows = self.conn.execute(
+            "SELECT r.data FROM keys k JOIN records r ON r.rid = k.rid "
+            "WHERE k.kind = ? AND k.field = ? AND k.value = ? ORDER BY k.rid",
+            (kind, field, _key_value(field, value)),
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def get(self, kind: str, field: str, value) -> dict | None:
+        """First `kind` record whose `field` equals `value`, or None."""
+        row = self.conn.execute(
+            "SELECT r.data FROM keys k JOIN records r ON r.rid = k.rid "
+            "WHERE k.kind = ? AND k.field = ? AND k.value = ? ORDER BY k.rid LIMIT 1",
+            (kind, field, _key_value(field, value)),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def linked(self, relation: str, key: str) -> list[dict]:
+        """Records linked to `key` by `relation` (e.g. "coin_rounds", "bitcoin")."""
+        rows = self.conn.execute(
+            "SELECT r.data FROM links l JOIN records r ON r.rid = l.rid "
+            "WHERE l.relation = ? AND l.key = ? ORDER BY l.rid",
+            (relation, str(key).lower()),
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def sources(self) -> list[dict]:
+        """Snapshots the index was built from."""
+        cursor = self.conn.execute("SELECT * FROM sources ORDER BY kind")
+        names = [c[0] for c in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> LocalIndex:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build or query the local lookup index.")
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument("--get", nargs=3, metavar=("KIND", "FIELD", "VALUE"), help="Exact lookup.")
+    query.add_argument("--linked", nargs=2, metavar=("RELATION", "KEY"), help="Secondary lookup.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not (args.get or args.linked):
+        build_index()
+        return
+    with LocalIndex() as index:
+        result = index.find(*args.get) if args.get else index.linked(*args.linked)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Typed, slotted record models for the DropsTab payloads.
+
+API items are large nested dicts, of which the scripts use a handful of
+fields. The models here keep only those fields, in `__slots__` dataclasses
+(no per-instance `__dict__`), so a full coin universe or unlock list takes a
+fraction of the memory and attribute access is checked:
+
+    Coin, Investor, FundingRound, TokenUnlock, CryptoActivity, Exchange,
+    ExchangePair, ChartPoint
+
+`from_item` maps an API item onto a model. Field names vary between
+endpoints (`fundsRaised` vs `amount`, `coin` vs `coins` vs `coinSlug`), so
+each field lists the keys it is read from, in order; missing fields are
+None, slugs are lower-cased and nested entities are reduced to their slugs.
+Values are JSON scalars: an unexpected shape never fails the whole list.
+The extraction helpers behind the models (`pick`, `to_slug`, `entities`)
+are public, so other loaders (dropstab_warehouse) read items the same way.
+
+Each EndpointSpec in dropstab_endpoints names its model, so
+`dropstab_endpoints.fetch_records` converts every page as it arrives and
+`load_records` converts a snapshot written by any endpoint script.
+
+Usage examples:
+
+    # Summarize a snapshot as records
+    python dropstab_models.py data/raw/coins_all_20250101.json --limit 5
+
+    from dropstab_models import Coin, load_records
+    coins = load_records("data/raw/coins_all_20250101.json")
+    top = sorted(coins, key=lambda c: c.rank or 1e9)[:10]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import ClassVar
+
+from dropstab_base import read_json
+
+
+# Field extraction
+
+
+def _scalar(value):
+    """JSON scalars pass through; dicts/lists (and bools) become None/int."""
+    if isinstance(value, bool):
+        return int(value)
+    return value if isinstance(value, (str, int, float)) else None
+
+
+def pick(item: dict, *keys: str):
+    """First scalar value found under `keys`."""
+    for key in keys:
+        value = _scalar(item.get(key))
+        if value is not None:
+            return value
+    return None
+
+
+def to_slug(value) -> str | None:
+    """Lower-cased slug of a string or of an entity dict's `slug` (None if absent)."""
+    if isinstance(value, dict):
+        value = value.get("slug")
+    return value.lower() if isinstance(value, str) and value else None
+
+
+def entities(item: dict, *keys: str) -> list[dict | str]:
+    """Nested entities (dicts or slugs) under `keys`, flattening lists."""
+    out = []
+    for key in keys:
+        value = item.get(key)
+        out.extend(value if isinstance(value, list) else [value] if value else [])
+    return [v for v in out if isinstance(v, (dict, str))]
+
+
+def _slug_of(*keys: str) -> Callable[[dict], str | None]:
+    """Source reading the first slug under `keys` (a string or a nested entity)."""
+    def source(item: dict) -> str | None:
+        return next(filter(None, map(to_slug, entities(item, *keys))), None)
+
+    return source
+
+
+def _slugs_of(*keys: str) -> Callable[[dict], tuple]:
+    """Source reading every distinct slug under `keys`, in order."""
+    def source(item: dict) -> tuple:
+        return tuple(dict.fromkeys(filter(None, map(to_slug, entities(item, *keys)))))
+
+    return source
+
+
+# Models
+
+
+class Record:
+    """
+    Base of the models: `from_item` fills each field from its SOURCES entry,
+    either a tuple of item keys (first scalar wins) or a function of the item.
+    Fields without an entry are read from the key of the same name.
+    """
+
+    __slots__ = ()
+
+    SOURCES: ClassVar[dict[str, tuple | Callable[[dict], object]]] = {}
+
+    @classmethod
+    def from_item(cls, item: dict) -> Record:
+        values = {}
+        for f in fields(cls):
+            source = cls.SOURCES.get(f.name, (f.name,))
+            values[f.name] = source(item) if callable(source) else pick(item, *source)
+        return cls(**values)
+
+    def as_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(frozen=True, slots=True)
+class Coin(Record):
+    slug: str | None
+    id: int | None
+    symbol: str | None
+    name: str | None
+    rank: int | None
+    price: float | None
+    market_cap: float | None
+
+    SOURCES: ClassVar = {"slug": _slug_of("slug", "coinSlug"), "market_cap": ("marketCap", "mcap")}
+
+
+@dataclass(frozen=True, slots=True)
+class Investor(Record):
+    slug: str | None
+    id: int | None
+    name: str | None
+    tier: str | int | None
+
+    SOURCES: ClassVar = {"slug": _slug_of("slug")}
+
+
+@dataclass(frozen=True, slots=True)
+class FundingRound(Record):
+    id: int | str | None
+    coin_slug: str | None
+    date: str | None
+    stage: str | None
+    amount: float | None
+    investors: tuple
+
+    SOURCES: ClassVar = {
+        "id": ("id", "slug"),
+        "coin_slug": _slug_of("coin", "coins", "coinSlug"),
+        "date": ("date", "announceDate"),
+        "stage": ("stage", "round"),
+        "amount": ("fundsRaised", "amount", "raised"),
+        "investors": _slugs_of("investors", "leadInvestors", "funds"),
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class TokenUnlock(Record):
+    coin_slug: str | None
+    name: str | None
+    next_unlock_date: str | None
+    next_unlock_amount: float | None
+    next_unlock_value: float | None
+
+    SOURCES: ClassVar = {
+        "coin_slug": _slug_of("coin", "coinSlug", "slug"),
+        "next_unlock_date": ("nextUnlockDate", "unlockDate", "date"),
+        "next_unlock_amount": ("nextUnlockAmount", "amount", "tokens"),
+        "next_unlock_value": ("nextUnlockValue", "valueUsd", "value"),
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class CryptoActivity(Record):
+    id: int | str | None
+    coin_slug: str | None
+    date: str | None
+    type: str | None
+    title: str | None
+
+    SOURCES: ClassVar = {
+        "coin_slug": _slug_of("coin", "coins", "coinSlug"),
+        "date": ("date", "startDate"),
+        "type": ("type", "category"),
+        "title": ("title", "name"),
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class Exchange(Record):
+    slug: str | None
+    id: int | None
+    name: str | None
+
+    SOURCES: ClassVar = {"slug": _slug_of("slug")}
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangePair(Record):
+    symbol: str | None
+    base: str | None
+    quote: str | None
+    price: float | None
+    volume_24h: float | None
+
+    SOURCES: ClassVar = {
+        "symbol": ("symbol", "pair"),
+        "base": ("base", "baseSymbol"),
+        "quote": ("quote", "quoteSymbol"),
+        "volume_24h": ("volume24h", "volume"),
+    }
+
+    @classmethod
+    def from_item(cls, item: dict) -> ExchangePair:
+        pair = super(ExchangePair, cls).from_item(item)
+        if pair.symbol is None and pair.base and pair.quote:
+            return cls(f"{pair.base}/{pair.quote}", pair.base, pair.quote, pair.price, pair.volume_24h)
+        return pair
+
+
+@dataclass(frozen=True, slots=True)
+class ChartPoint(Record):
+    timestamp: int | None
+    price: float | None
+    volume: float | None
+    mcap: float | None
+
+    SOURCES: ClassVar = {"mcap": ("mcap", "marketCap")}
+
+    @classmethod
+    def from_item(cls, item: dict | list) -> ChartPoint:
+        """Accepts `{timestamp, price, ...}` items and raw `[ts, price, volume, mcap]` points."""
+        if isinstance(item, (list, tuple)):
+            values = [_scalar(v) for v in item[:4]]
+            return cls(*values, *[None] * (4 - len(values)))
+        return super(ChartPoint, cls).from_item(item)
+
+
+# Conversion
+
+
+def to_records(items: Iterable, model: type[Record]) -> list[Record]:
+    """Convert API items to `model` records, skipping items that are not objects/points."""
+    return [model.from_item(item) for item in items if isinstance(item, (dict, list))]
+
+
+def model_for(endpoint: str) -> type[Record] | None:
+    """Model of the registered endpoint whose path template is `endpoint`."""
+    from dropstab_endpoints import ENDPOINTS
+
+    return next((s.model for s in ENDPOINTS.values() if s.path == endpoint and s.model), None)
+
+
+def load_records(snapshot: Path | str, model: type[Record] | None = None) -> list[Record]:
+    """
+    Read a snapshot written by `fetch_endpoint` (or any endpoint script) as records.
+
+    Args:
+        snapshot: Snapshot file.
+        model: Model to use; by default the one of the endpoint recorded
+            in the envelope.
+
+    Raises:
+        ValueError: if no model is given and the endpoint has none.
+    """
+    payload = read_json(snapshot)
+    model = model or model_for(payload.get("endpoint", ""))
+    if model is None:
+        raise ValueError(f"No record model for endpoint {payload.get('endpoint')!r} ({snapshot})")
+    items = payload.get("items", [])
+    return to_records(items if isinstance(items, list) else [items], model)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Read snapshots as typed records.")
+    parser.add_argument("snapshots", nargs="+", type=Path, help="Snapshot files.")
+    parser.add_argument("--limit", type=int, default=3, help="Records to print per snapshot.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    for snapshot in args.snapshots:
+        records = load_records(snapshot)
+        kind = type(records[0]).__name__ if records else "records"
+        print(f"{snapshot.name}: {len(records)} {kind}")
+        for record in records[: args.limit]:
+            print(f"  {record}")
+
+
+__all__ = [
+    "pick",
+    "to_slug",
+    "entities",
+    "Record",
+    "Coin",
+    "Investor",
+    "FundingRound",
+    "TokenUnlock",
+    "CryptoActivity",
+    "Exchange",
+    "ExchangePair",
+    "ChartPoint",
+    "to_records",
+    "model_for",
+    "load_records",
+]
+
+
+if __name__ == "__main__":
+    main()
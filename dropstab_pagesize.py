@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Adaptive page sizes for paginated list endpoints.
+
+`PAGE_SIZE` (100) suits some endpoints and not others: exchange pairs or
+coins may accept far larger pages, while heavy endpoints such as token
+unlocks may time out. The PageSizeTuner learns a page size per endpoint
+(paths are grouped by `endpoint_label`, so all `exchanges/{}/pairs` share
+one) and persists it in PAGE_SIZE_STATE_FILE between runs:
+
+  - every page fetched by `iter_pages` is measured: items, HTTP time and
+    payload bytes (taken from the client's request metrics),
+  - after a completed crawl the next size is chosen: the next larger step
+    of PAGE_SIZE_LADDER while it is unexplored and below any known limit,
+    otherwise the size with the most items per second of HTTP time,
+  - sizes whose pages take more than TIMEOUT_SHARE of REQUEST_TIMEOUT are
+    not used,
+  - a rejected or timed-out page marks that size as the endpoint's limit
+    and the tuner steps down (page 0 is retried at once at the smaller
+    size); a server that returns fewer items than asked on a non-last page
+    caps the size at what it returned.
+
+Fewer, larger pages mean fewer rate-limited calls per crawl. `probe` finds
+an endpoint's largest workable size right away instead of over several runs.
+
+Usage examples:
+
+    # Learned sizes
+    python dropstab_pagesize.py
+
+    # Probe endpoints with page-0 requests of increasing size
+    python dropstab_pagesize.py --probe coins exchanges/binance/pairs
+
+    # Use learned sizes in this process (run_all_dropstab.py --adaptive-pages)
+    from dropstab_pagesize import install_page_sizer
+    install_page_sizer()
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+
+from dropstab_base import (
+    DATA_DIR,
+    GET,
+    PAGE_SIZE,
+    RequestEvent,
+    atomic_write,
+    endpoint_label,
+    get_client,
+    utc_now_iso,
+)
+
+# Where learned page sizes persist between runs
+PAGE_SIZE_STATE_FILE = DATA_DIR / "page_sizes.json"
+
+# Page sizes tried, smallest to largest
+PAGE_SIZE_LADDER: tuple = (25, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Request timeout the page sizes must stay within (DropsTabClient.get default)
+REQUEST_TIMEOUT: float = 10.0
+
+# Sizes whose mean page time exceeds this share of REQUEST_TIMEOUT are too slow
+TIMEOUT_SHARE: float = 0.5
+
+# Weight older measurements keep each time a crawl finishes
+DECAY: float = 0.5
+
+
+class PageSizeTuner:
+    """
+    Per-endpoint page sizes learned from measured pages, persisted as JSON.
+
+    Measurements come from a request-metrics hook on the client it is
+    attached to: `observe` pairs each page with the last request event of
+    the calling thread, so it must be called from the thread that fetched
+    the page (as `iter_pages` does). Thread-safe.
+
+    Args:
+        state_file: JSON file holding the learned sizes and measurements.
+        default: Page size for endpoints without history.
+        ladder: Candidate page sizes, ascending.
+    """
+
+    def __init__(
+        self,
+        state_file=PAGE_SIZE_STATE_FILE,
+        default: int = PAGE_SIZE,
+        ladder: tuple = PAGE_SIZE_LADDER,
+    ):
+        self.state_file = state_file
+        self.default = default
+        self.ladder = tuple(sorted(set(ladder) | {default}))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pages: dict[str, int] = {}  # pages seen in the current crawl, per endpoint
+        try:
+            self.state: dict = json.loads(self.state_file.read_text())
+        except (FileNotFoundError, ValueError):
+            self.state = {}
+
+    # Client integration
+
+    def attach(self, client) -> PageSizeTuner:
+        """Make `client` (and so `iter_pages` on it) use this tuner."""
+        client.metrics.add_hook(self._on_request)
+        client.page_sizer = self
+        return self
+
+    def _on_request(self, event: RequestEvent) -> None:
+        self._local.event = event
+
+    def _entry(self, path: str) -> dict:
+        return self.state.setdefault(
+            endpoint_label(path), {"size": self.default, "limit": None, "sizes": {}}
+        )
+
+    # Interface used by iter_pages
+
+    def page_size(self, path: str) -> int:
+        """Page size to use for the next crawl of `path`."""
+        with self._lock:
+            return self._entry(path)["size"]
+
+    def limit(self, path: str) -> int | None:
+        """Smallest page size known to fail for `path` (rejected, capped or timed out), if any."""
+        with self._lock:
+            return self._entry(path)["limit"]
+
+    def observe(self, path: str, page_size: int, items: int, last: bool) -> None:
+        """Record a fetched page; `last` marks the endpoint's final page."""
+        event = getattr(self._local, "event", None)
+        self._local.event = None
+        if event is None or event.status != 200:
+            return  # served from cache or otherwise not measured
+        with self._lock:
+            entry = self._entry(path)
+            label = endpoint_label(path)
+            self._pages[label] = self._pages.get(label, 0) + 1
+            stats = entry["sizes"].setdefault(
+                str(page_size), {"pages": 0, "items": 0, "seconds": 0.0, "bytes": 0}
+            )
+            stats["pages"] += 1
+            stats["items"] += items
+            stats["seconds"] += event.seconds
+            stats["bytes"] += event.bytes
+            if not last and 0 < items < page_size:
+                # The server capped the page: asking for more is pointless
+                entry["limit"] = self._min_limit(entry, page_size)
+                entry["size"] = items
+
+    def failed(self, path: str, page_size: int) -> None:
+        """
+        A page at `page_size` failed. If it was rejected (4xx other than 429)
+        or timed out, mark the size as the limit and step down; transient
+        failures (429, 5xx, connection errors) say nothing about page size.
+        """
+        event = getattr(self._local, "event", None)
+        self._local.event = None
+        if event is None:
+            return
+        rejected = event.status is not None and 400 <= event.status < 500 and event.status != 429
+        if not (rejected or event.error == "ReadTimeout"):
+            return
+        with self._lock:
+            entry = self._entry(path)
+            entry["limit"] = self._min_limit(entry, page_size)
+            smaller = [s for s in self.ladder if s < page_size]
+            entry["size"] = smaller[-1] if smaller else page_size
+            entry["updated_utc"] = utc_now_iso()
+        self.save()
+
+    def finish(self, path: str) -> None:
+        """A crawl of `path` completed: choose the next size and persist."""
+        with self._lock:
+            entry = self._entry(path)
+            pages = self._pages.pop(endpoint_label(path), 0)
+            if pages > 1:  # a single-page endpoint gains nothing from larger pages
+                entry["size"] = self._choose(entry)
+            for stats in entry["sizes"].values():
+                for key in ("pages", "items", "seconds", "bytes"):
+                    stats[key] *= DECAY
+            entry["updated_utc"] = utc_now_iso()
+        self.save()
+
+    # Decisions
+
+    @staticmethod
+    def _min_limit(entry: dict, size: int) -> int:
+        return size if entry["limit"] is None else min(entry["limit"], size)
+
+    @staticmethod
+    def _best(entry: dict) -> int | None:
+        """Measured size with the most items per second, within limit and timeout."""
+        limit = entry["limit"]
+        usable = {
+            int(size): st["items"] / st["seconds"]
+            for size, st in entry["sizes"].items()
+            if st["seconds"] > 0
+            and (limit is None or int(size) < limit)
+            and st["seconds"] / st["pages"] <= TIMEOUT_SHARE * REQUEST_TIMEOUT
+        }
+        return max(usable, key=usable.get) if usable else None
+
+    def _choose(self, entry: dict) -> int:
+        best = self._best(entry)
+        if best is None:
+            smaller = [s for s in self.ladder if s < entry["size"]]
+            return smaller[-1] if smaller else entry["size"]
+
+        limit = entry["limit"]
+        larger = [s for s in self.ladder if s > best]
+        if larger and str(larger[0]) not in entry["sizes"] and (limit is None or larger[0] < limit):
+            return larger[0]  # explore the next step up
+        return best
+
+    # Persistence and reporting
+
+    def save(self) -> None:
+        with self._lock:
+            text = json.dumps(self.state, indent=2, sort_keys=True)
+        atomic_write(self.state_file, text)
+
+    def as_dict(self) -> dict:
+        """`{endpoint: {size, limit, items_per_sec by size}}`, for reports."""
+        with self._lock:
+            return {
+                label: {
+                    "size": entry["size"],
+                    "limit": entry["limit"],
+                    "items_per_sec": {
+                        size: round(st["items"] / st["seconds"], 1)
+                        for size, st in sorted(entry["sizes"].items(), key=lambda kv: int(kv[0]))
+                        if st["seconds"] > 0
+                    },
+                }
+                for label, entry in sorted(self.state.items())
+            }
+
+    def probe(self, path: str, params: dict | None = None) -> int:
+        """
+        Fetch page 0 of `path` at increasing ladder sizes until one is
+        rejected, capped, too slow or already returns every item; then set
+        and persist the best size. Returns it.
+        """
+        params = dict(params or {})
+        start = [s for s in self.ladder if s >= min(self.default, self.page_size(path))]
+        for size in start:
+            try:
+                resp = GET(path, params={**params, "page": 0, "pageSize": size})
+            except (RuntimeError, OSError) as exc:
+                print(f"[probe {path}] pageSize={size}: failed ({exc})")
+                self.failed(path, size)
+                break
+            data = resp.get("data", {}) if isinstance(resp, dict) else {}
+            items = len(data.get("content", []))
+            total_pages = data.get("totalPages")
+            event = getattr(self._local, "event", None)
+            seconds = event.seconds if event is not None else 0.0
+            self.observe(path, size, items, last=not total_pages or total_pages <= 1)
+            print(f"[probe {path}] pageSize={size}: {items} items in {seconds:.2f}s")
+            if not total_pages or total_pages <= 1 or items < size:
+                break
+            if seconds > TIMEOUT_SHARE * REQUEST_TIMEOUT:
+                break
+
+        with self._lock:
+            entry = self._entry(path)
+            entry["size"] = self._best(entry) or entry["size"]
+            entry["updated_utc"] = utc_now_iso()
+            size = entry["size"]
+        self.save()
+        return size
+
+
+def install_page_sizer(**kwargs) -> PageSizeTuner:
+    """
+    Put a PageSizeTuner under the shared client, so `iter_pages` calls
+    without an explicit page size use the learned sizes.
+
+    Keyword arguments are passed to PageSizeTuner.
+    """
+    return PageSizeTuner(**kwargs).attach(get_client())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Show or probe learned page sizes.")
+    parser.add_argument(
+        "--probe", nargs="+", metavar="PATH", help="Endpoint paths to probe (e.g. coins)."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    tuner = install_page_sizer()
+    for path in args.probe or ():
+        size = tuner.probe(path)
+        print(f"{path}: page size {size}")
+    print(json.dumps(tuner.as_dict(), indent=2))
+
+
+__all__ = [
+    "PAGE_SIZE_STATE_FILE",
+    "PAGE_SIZE_LADDER",
+    "REQUEST_TIMEOUT",
+    "TIMEOUT_SHARE",
+    "DECAY",
+    "PageSizeTuner",
+    "install_page_sizer",
+]
+
+
+if __name__ == "__main__":
+    main()
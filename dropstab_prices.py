@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Batched historical price lookups for many (slug, date) pairs.
+
+`coins/history/price/{slug}` answers one slug on one date. For a list of
+pairs this module:
+
+1. de-duplicates the pairs,
+2. answers what it can from chart history already stored by
+   `dropstab_timeseries` (daily series first, then hourly),
+3. for slugs with several missing dates, fetches one daily chart range
+   covering them (`fetch_chart_range`) when that takes fewer calls than
+   asking date by date,
+4. falls back to `coins/history/price/{slug}` only for what is left.
+
+The result is a compact table: one `(slug, date, price, source)` row per
+unique pair, where `source` is "store", "chart", "price" or "failed".
+
+Usage examples:
+
+    # Pairs from a CSV with `slug,date` columns (header optional)
+    python dropstab_prices.py pairs.csv --output prices.csv
+
+    # Pairs on the command line
+    python dropstab_prices.py --pair bitcoin 2024-01-01 --pair ethereum 2024-01-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import sys
+from collections.abc import Iterable
+from contextlib import closing
+from datetime import datetime, UTC
+from pathlib import Path
+
+from dropstab_base import RAW_DIR, GET, map_ordered, today_tag
+from dropstab_timeseries import (
+    CHART_COLUMNS,
+    FIELD_ALIASES,
+    TimeSeries,
+    fetch_chart_range,
+    plan_chunks,
+)
+
+# Stored series consulted before any request, in order of preference
+STORE_INTERVALS = ("day", "hour")
+
+# Interval used for per-slug chart range calls
+RANGE_INTERVAL = "day"
+
+# Concurrent slugs (range calls) and concurrent per-date price calls
+PRICE_WORKERS: int = 8
+
+# Output table columns
+TABLE_COLUMNS = ("slug", "date", "price", "source")
+
+
+def _date_of(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, UTC).strftime("%Y-%m-%d")
+
+
+def _daily_prices(points: Iterable[tuple]) -> dict[str, float]:
+    """First non-NaN price per UTC date of `(ts_ms, price, ...)` points."""
+    prices: dict[str, float] = {}
+    for point in points:
+        if not math.isnan(point[1]):
+            prices.setdefault(_date_of(point[0]), point[1])
+    return prices
+
+
+def dedupe_pairs(pairs: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Unique `(slug, YYYY-MM-DD)` pairs in first-seen order."""
+    seen: dict = {}
+    for slug, date in pairs:
+        slug, date = str(slug).strip(), str(date).strip()[:10]
+        if slug and date:
+            seen.setdefault((slug, date), None)
+    return list(seen)
+
+
+def pairs_from_csv(path: Path) -> list[tuple[str, str]]:
+    """Read `slug,date` rows from a CSV file; a header row is skipped if present."""
+    with open(path, newline="") as f:
+        rows = [row for row in csv.reader(f) if len(row) >= 2]
+    if rows and rows[0][0].strip().lower() == "slug":
+        rows = rows[1:]
+    return [(row[0], row[1]) for row in rows]
+
+
+def _from_store(slug: str) -> dict[str, float]:
+    """Daily prices available in the local time-series store for `slug`."""
+    prices: dict[str, float] = {}
+    for interval in STORE_INTERVALS:
+        series = TimeSeries(slug, interval, CHART_COLUMNS)
+        if not series.meta()["count"]:
+            continue
+        columns = series.read()
+        for date, price in _daily_prices(zip(columns["timestamp"], columns["price"])).items():
+            prices.setdefault(date, price)
+    return prices
+
+
+def _price_value(data) -> float | None:
+    """Price from a `coins/history/price` payload (a number or a dict)."""
+    if isinstance(data, dict):
+        keys = FIELD_ALIASES["price"] + ("priceUsd", "usd")
+        data = next((data[k] for k in keys if data.get(k) is not None), None)
+    try:
+        return float(data)
+    except (TypeError, ValueError):
+        return None
+
+
+def _fetch_price(pair: tuple[str, str], params: dict) -> tuple[str, str, float | None]:
+    slug, date = pair
+    try:
+        resp = GET(f"coins/history/price/{slug}", params={**params, "date": date})
+    except Exception as e:  # keep going; the pair is reported as failed
+        print(f"[prices] {slug} {date}: failed ({e!r})")
+        return slug, date, None
+    data = resp.get("data", resp) if isinstance(resp, dict) else resp
+    return slug, date, _price_value(data)
+
+
+def _fetch_range(slug: str, dates: list[str], params: dict) -> tuple[dict[str, float], int]:
+    """Daily prices of one chart range covering `dates`, and the requests it took."""
+    stats: dict = {}
+    try:
+        points = fetch_chart_range(
+            slug, f"{min(dates)}T00:00:00", f"{max(dates)}T23:59:59", RANGE_INTERVAL,
+            params=params, stats=stats,
+        )
+    except Exception as e:  # the per-date fallback picks these up
+        print(f"[prices] chart range for {slug} failed ({e!r}); falling back to per-date calls")
+        return {}, stats.get("requests", 0)
+    return _daily_prices(points), stats.get("requests", 0)
+
+
+def lookup_prices(
+    pairs: Iterable[tuple[str, str]],
+    params: dict | None = None,
+    max_workers: int = PRICE_WORKERS,
+) -> list[tuple[str, str, float | None, str]]:
+    """
+    Historical prices for `(slug, date)` pairs with as few API calls as possible.
+
+    Args:
+        pairs: `(slug, date)` pairs; dates as `YYYY-MM-DD` (longer strings are cut).
+        params: Extra query params for every request (e.g. {"currency": "USD"}).
+        max_workers: Concurrent requests.
+
+    Returns:
+        One `(slug, date, price, source)` row per unique pair, in first-seen
+        order. `price` is None when no source had it (`source == "failed"`).
+    """
+    params = dict(params or {})
+    unique = dedupe_pairs(pairs)
+    found: dict[tuple[str, str], tuple[float, str]] = {}
+
+    dates_by_slug: dict[str, list[str]] = {}
+    for slug, date in unique:
+        dates_by_slug.setdefault(slug, []).append(date)
+
+    # 1. Local store
+    missing: dict[str, list[str]] = {}
+    for slug, dates in dates_by_slug.items():
+        stored = _from_store(slug)
+        for date in dates:
+            if date in stored:
+                found[slug, date] = (stored[date], "store")
+            else:
+                missing.setdefault(slug, []).append(date)
+
+    # 2. One chart range per slug where it takes fewer calls than per-date lookups
+    ranged = [
+        slug for slug, dates in missing.items()
+        if len(plan_chunks(f"{min(dates)}T00:00:00", f"{max(dates)}T23:59:59", RANGE_INTERVAL))
+        < len(dates)
+    ]
+
+    def fetch_range(slug: str) -> tuple[str, dict[str, float], int]:
+        return slug, *_fetch_range(slug, missing[slug], params)
+
+    range_requests = 0
+    with closing(map_ordered(fetch_range, ranged, max_workers)) as results:
+        for slug, prices, requests in results:
+            range_requests += requests
+            for date in missing[slug]:
+                if date in prices:
+                    found[slug, date] = (prices[date], "chart")
+
+    # 3. Per-date fallback for the leftovers
+    leftovers = [
+        (slug, date) for slug, dates in missing.items() for date in dates
+        if (slug, date) not in found
+    ]
+    with closing(map_ordered(lambda p: _fetch_price(p, params), leftovers, max_workers)) as results:
+        for slug, date, price in results:
+            if price is not None:
+                found[slug, date] = (price, "price")
+
+    calls = range_requests + len(leftovers)
+    print(
+        f"[prices] {len(unique)} pairs: {sum(s == 'store' for _, s in found.values())} from store, "
+        f"{len(ranged)} chart ranges in {range_requests} requests + {len(leftovers)} price calls "
+        f"({calls} requests)"
+    )
+    return [
+        (slug, date, *found.get((slug, date), (None, "failed")))
+        for slug, date in unique
+    ]
+
+
+def write_table(rows: list[tuple], output) -> None:
+    """Write lookup rows as CSV with a TABLE_COLUMNS header."""
+    writer = csv.writer(output)
+    writer.writerow(TABLE_COLUMNS)
+    writer.writerows(("" if v is None else v for v in row) for row in rows)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Look up historical prices for many (slug, date) pairs.",
+    )
+    parser.add_argument("csv", nargs="?", type=Path, help="CSV file with slug,date rows.")
+    parser.add_argument(
+        "--pair",
+        nargs=2,
+        action="append",
+        default=[],
+        metavar=("SLUG", "DATE"),
+        help="A single pair (repeatable).",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Output CSV path, or - for stdout (default: data/raw/prices_batch_<date>.csv).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=PRICE_WORKERS,
+        help=f"Concurrent requests (default: {PRICE_WORKERS}).",
+    )
+    args = parser.parse_args()
+    if not args.csv and not args.pair:
+        parser.error("give a CSV file or at least one --pair")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    pairs = (pairs_from_csv(args.csv) if args.csv else []) + [tuple(p) for p in args.pair]
+    rows = lookup_prices(pairs, max_workers=args.workers)
+
+    if args.output == "-":
+        write_table(rows, sys.stdout)
+        return
+    output = Path(args.output) if args.output else RAW_DIR / f"prices_batch_{today_tag()}.csv"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", newline="") as f:
+        write_table(rows, f)
+    print(f"Finished writing {output}")
+
+
+if __name__ == "__main__":
+    main()
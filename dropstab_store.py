@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Compressed, content-addressed snapshot store.
+
+Snapshots are split into records that are stored once and shared between
+days. For a snapshot `<name>_<tag>` the store keeps:
+
+    STORE_DIR/snapshots/<name>_<tag>.json.<ext>
+        manifest: the envelope plus the ordered list of record hashes
+    STORE_DIR/objects/<name>/<tag>-<n>.jsonl.<ext>
+        segment: `<hash>\\t<record JSON>` lines for the records first seen
+        in that snapshot
+    STORE_DIR/objects/<name>/index.json
+        `{hash: segment}` for every record stored for `<name>`
+
+so each day only costs its manifest plus the records that changed. Files are
+compressed with zstd when the optional `zstandard` package is installed,
+gzip otherwise; reads handle either. `read_snapshot` reconstructs any day's
+payload, from RAW_DIR if the plain file is still there, else from the store.
+Records are stored exactly as serialized, so reconstruction keeps each
+record's key order.
+
+Usage examples:
+
+    # Move every raw snapshot into the store, keeping the newest day of each
+    # endpoint as plain JSON for the other tools
+    python dropstab_store.py archive
+
+    # Reconstruct a day's snapshot as plain JSON
+    python dropstab_store.py restore coins_all 20251116 /tmp/coins_all_20251116.json
+
+    # Write straight into the store instead of RAW_DIR
+    from dropstab_store import SnapshotStore
+    with SnapshotStore().writer("coins_all", today_tag(), envelope) as writer:
+        for content in iter_pages("coins"):
+            writer.write_items(content)
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # optional dependency; gzip is used instead
+    zstandard = None
+
+from dropstab_base import (
+    DATA_DIR,
+    RAW_DIR,
+    SnapshotWriter,
+    atomic_write,
+    get_serializer,
+    latest_snapshot,
+    read_json,
+)
+
+# Where the store lives
+STORE_DIR = DATA_DIR / "store"
+
+# Compression used for new files: "zstd" (needs zstandard) or "gzip"
+DEFAULT_CODEC = "zstd" if zstandard is not None else "gzip"
+
+# Plain snapshots per endpoint left in RAW_DIR by `archive`
+KEEP_RAW: int = 1
+
+_EXTENSIONS = {"zstd": ".zst", "gzip": ".gz"}
+
+# `<name>_YYYYMMDD.json` snapshots in RAW_DIR
+_SNAPSHOT_FILE = re.compile(r"(?P<name>.+)_(?P<tag>\d{8})\.json")
+
+
+def _open(path: Path, mode: str):
+    """Open a compressed file in text mode, picking the codec from its suffix."""
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise ImportError(f"{path} is zstd-compressed; install zstandard to read it.")
+        return zstandard.open(path, mode, encoding="utf-8")
+    return gzip.open(path, mode, encoding="utf-8")
+
+
+def _find(base: Path) -> Path | None:
+    """`base` with whichever codec extension exists on disk."""
+    for ext in _EXTENSIONS.values():
+        path = base.with_name(base.name + ext)
+        if path.exists():
+            return path
+    return None
+
+
+def _serialize(item) -> str:
+    """Compact JSON of a record, keys in their original order (as stored)."""
+    return json.dumps(item, separators=(",", ":"))
+
+
+def record_hash(item) -> str:
+    """
+    Content hash of a record's stored serialization.
+
+    Key order is part of the hash, so every stored record reads back exactly
+    as it was written, key order included.
+    """
+    return _digest(_serialize(item))
+
+
+def _digest(record: str) -> str:
+    return hashlib.blake2b(record.encode(), digest_size=16).hexdigest()
+
+
+def _read_plain(snapshot: Path) -> tuple[str, str, dict, list]:
+    """`(name, tag, envelope, items)` of a plain snapshot, as the store records them."""
+    snapshot = Path(snapshot)
+    match = _SNAPSHOT_FILE.fullmatch(snapshot.name)
+    if match is None:
+        raise ValueError(f"{snapshot.name} is not a <name>_YYYYMMDD.json snapshot")
+    payload = read_json(snapshot)
+    items = payload.pop("items", [])
+    if not isinstance(items, list):
+        payload["single_item"] = True
+        items = [items]
+    return match["name"], match["tag"], payload, items
+
+
+class StoreWriter:
+    """
+    Stream one snapshot into the store; same interface as SnapshotWriter.
+
+    Only records whose hash is not stored yet are written (to a new
+    segment). The manifest and the index are written when the context
+    exits cleanly, so a failed run leaves the previous state intact.
+    """
+
+    def __init__(self, store: SnapshotStore, name: str, tag: str, envelope: dict):
+        self.store = store
+        self.name = name
+        self.tag = tag
+        self.envelope = envelope
+        self.filename = store.manifest_path(name, tag)
+        self.count = 0
+        self.new_records = 0
+        self._hashes: list[str] = []
+        self._fresh: dict[str, str] = {}
+        self._segment: Path | None = None
+        self._fh = None
+
+    def __enter__(self) -> StoreWriter:
+        self.store.lock(self.name).acquire()
+        self._known = self.store.load_index(self.name)
+        return self
+
+    def _open_segment(self) -> None:
+        directory = self.store.objects_dir(self.name)
+        directory.mkdir(parents=True, exist_ok=True)
+        n = len(list(directory.glob(f"{self.tag}-*.jsonl.*")))
+        self._segment = directory / f"{self.tag}-{n}.jsonl{self.store.ext}"
+        self._fh = _open(self._segment, "wt")
+
+    def write_items(self, items: Iterable) -> None:
+        """Append items to the snapshot, storing unseen records."""
+        for item in items:
+            record = _serialize(item)
+            digest = _digest(record)
+            self._hashes.append(digest)
+            self.count += 1
+            if digest in self._known or digest in self._fresh:
+                continue
+            if self._fh is None:
+                self._open_segment()
+            self._fh.write(f"{digest}\t{record}\n")
+            self._fresh[digest] = self._segment.name
+            self.new_records += 1
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if self._fh is not None:
+                self._fh.close()
+            if exc_type is not None:
+                if self._segment is not None:
+                    self._segment.unlink(missing_ok=True)
+                return
+            self.store.save_index(self.name, {**self._known, **self._fresh})
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            # Keep the codec suffix last so _open picks the right compressor
+            tmp = self.filename.with_name(f"{self.filename.stem}.tmp{self.filename.suffix}")
+            with _open(tmp, "wt") as fh:
+                json.dump({"envelope": self.envelope, "items": self._hashes}, fh, separators=(",", ":"))
+            tmp.replace(self.filename)
+            # A manifest in another codec for the same day is now stale
+            for ext in _EXTENSIONS.values():
+                other = self.filename.with_suffix(ext)
+                if other != self.filename:
+                    other.unlink(missing_ok=True)
+        finally:
+            self.store.lock(self.name).release()
+
+
+class SnapshotStore:
+    """
+    Content-addressed store of snapshots.
+
+    Args:
+        directory: Store root (defaults to STORE_DIR).
+        codec: "zstd" or "gzip" for newly written files (defaults to DEFAULT_CODEC).
+    """
+
+    _locks: dict = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, directory: Path = STORE_DIR, codec: str = DEFAULT_CODEC):
+        if codec == "zstd" and zstandard is None:
+            raise ImportError("zstd compression requires zstandard. Install it with `pip install zstandard`.")
+        self.directory = Path(directory)
+        self.ext = _EXTENSIONS[codec]
+
+    # Layout
+
+    def objects_dir(self, name: str) -> Path:
+        return self.directory / "objects" / name
+
+    def manifest_path(self, name: str, tag: str) -> Path:
+        return self.directory / "snapshots" / f"{name}_{tag}.json{self.ext}"
+
+    def lock(self, name: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault((self.directory, name), threading.Lock())
+
+    def load_index(self, name: str) -> dict:
+        try:
+            return json.loads((self.objects_dir(name) / "index.json").read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_index(self, name: str, index: dict) -> None:
+        self.objects_dir(name).mkdir(parents=True, exist_ok=True)
+        atomic_write(self.objects_dir(name) / "index.json", json.dumps(index, separators=(",", ":")))
+
+    # Writing
+
+    def writer(self, name: str, tag: str, envelope: dict) -> StoreWriter:
+        """Context manager writing snapshot `<name>_<tag>` (see StoreWriter)."""
+        return StoreWriter(self, name, tag, envelope)
+
+    def ingest(self, snapshot: Path) -> StoreWriter:
+        """Store a plain `<name>_<tag>.json` snapshot. Returns the finished writer."""
+        name, tag, envelope, items = _read_plain(snapshot)
+        with self.writer(name, tag, envelope) as writer:
+            writer.write_items(items)
+        return writer
+
+    def holds(self, snapshot: Path) -> bool:
+        """Whether the store has a plain snapshot with this exact envelope and records."""
+        name, tag, envelope, items = _read_plain(snapshot)
+        try:
+            manifest = self._manifest(name, tag)
+        except FileNotFoundError:
+            return False
+        return manifest == {"envelope": envelope, "items": [record_hash(item) for item in items]}
+
+    # Reading
+
+    def snapshots(self, name: str | None = None) -> list[tuple[str, str]]:
+        """Stored `(name, tag)` pairs, oldest first."""
+        out = set()
+        for path in (self.directory / "snapshots").glob("*.json.*"):
+            match = _SNAPSHOT_FILE.fullmatch(path.name.rsplit(".", 1)[0])
+            if match and (name is None or match["name"] == name):
+                out.add((match["name"], match["tag"]))
+        return sorted(out, key=lambda p: (p[0], p[1]))
+
+    def _manifest(self, name: str, tag: str) -> dict:
+        path = _find(self.directory / "snapshots" / f"{name}_{tag}.json")
+        if path is None:
+            raise FileNotFoundError(f"No stored snapshot {name}_{tag} in {self.directory}")
+        with _open(path, "rt") as fh:
+            return json.load(fh)
+
+    def iter_items(self, name: str, tag: str) -> Iterator:
+        """Records of a stored snapshot, in their original order."""
+        hashes = self._manifest(name, tag)["items"]
+        index = self.load_index(name)
+        records: dict[str, str] = {}
+        serializer = get_serializer()
+        for segment in {index[h] for h in hashes}:
+            with _open(self.objects_dir(name) / segment, "rt") as fh:
+                for line in fh:
+                    digest, _, record = line.rstrip("\n").partition("\t")
+                    records[digest] = record
+        for digest in hashes:
+            yield serializer.loads(records[digest])
+
+    def read(self, name: str, tag: str) -> dict:
+        """Reconstruct a stored snapshot's payload `{<envelope>..., "items": [...]}`."""
+        envelope = dict(self._manifest(name, tag)["envelope"])
+        items = list(self.iter_items(name, tag))
+        if envelope.pop("single_item", False):
+            items = items[0] if items else None
+        return {**envelope, "items": items}
+
+    def restore(self, name: str, tag: str, target: Path) -> Path:
+        """Write a stored snapshot back out as plain JSON (same format as the scripts)."""
+        payload = self.read(name, tag)
+        items = payload.pop("items")
+        if not isinstance(items, list):
+            atomic_write(Path(target), get_serializer().dumps({**payload, "items": items}, indent=True))
+            return Path(target)
+        with SnapshotWriter(target, payload) as writer:
+            writer.write_items(items)
+        return Path(target)
+
+
+def read_snapshot(name: str, tag: str | None = None, store: SnapshotStore | None = None) -> dict:
+    """
+    Payload of snapshot `<name>_<tag>` (default: the newest day), from RAW_DIR
+    if the plain file exists, otherwise reconstructed from the store.
+    """
+    store = store or SnapshotStore()
+    if tag is not None:
+        raw = RAW_DIR / f"{name}_{tag}.json"
+        return read_json(raw) if raw.exists() else store.read(name, tag)
+
+    raw = latest_snapshot(name)
+    stored = store.snapshots(name)
+    stored_tag = stored[-1][1] if stored else None
+    if raw is not None and (stored_tag is None or raw.stem[-8:] >= stored_tag):
+        return read_json(raw)
+    if stored_tag is None:
+        raise FileNotFoundError(f"No {name} snapshot in {RAW_DIR} or {store.directory}")
+    return store.read(name, stored_tag)
+
+
+def archive(keep_raw: int = KEEP_RAW, store: SnapshotStore | None = None) -> dict:
+    """
+    Ingest every plain snapshot in RAW_DIR into the store, then delete all
+    but the newest `keep_raw` plain files per endpoint.
+
+    A file is skipped only if the store already holds its exact content, so
+    a snapshot re-fetched after an earlier archive replaces the stored day
+    before its plain file is deleted.
+
+    Returns:
+        Summary dict: snapshots ingested, new records stored, files removed.
+    """
+    store = store or SnapshotStore()
+    by_name: dict[str, list[Path]] = {}
+    for path in sorted(RAW_DIR.glob("*_*.json")):
+        match = _SNAPSHOT_FILE.fullmatch(path.name)
+        if match:
+            by_name.setdefault(match["name"], []).append(path)
+
+    summary = {"ingested": 0, "records": 0, "new_records": 0, "removed": 0}
+    for name, paths in by_name.items():
+        # Newest `keep_raw` files; empty when keep_raw is 0
+        kept = paths[max(len(paths) - keep_raw, 0):]
+        for path in paths:
+            if not store.holds(path):
+                writer = store.ingest(path)
+                summary["ingested"] += 1
+                summary["records"] += writer.count
+                summary["new_records"] += writer.new_records
+        for path in paths[: len(paths) - len(kept)]:
+            path.unlink()
+            summary["removed"] += 1
+
+    print(
+        f"[store] ingested {summary['ingested']} snapshots: {summary['records']} records, "
+        f"{summary['new_records']} new; removed {summary['removed']} plain files"
+    )
+    return summary
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compressed, deduplicated snapshot store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    arc = sub.add_parser("archive", help="Move raw snapshots into the store.")
+    arc.add_argument(
+        "--keep-raw",
+        type=int,
+        default=KEEP_RAW,
+        help=f"Plain snapshots kept per endpoint in RAW_DIR (default: {KEEP_RAW}).",
+    )
+    res = sub.add_parser("restore", help="Reconstruct a stored snapshot as plain JSON.")
+    res.add_argument("name")
+    res.add_argument("tag")
+    res.add_argument("target", type=Path)
+    sub.add_parser("list", help="List stored snapshots.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    store = SnapshotStore()
+    if args.command == "archive":
+        archive(args.keep_raw, store)
+    elif args.command == "restore":
+        print(f"Restored {store.restore(args.name, args.tag, args.target)}")
+    else:
+        for name, tag in store.snapshots():
+            print(f"{name}_{tag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Local time-series store for coin charts and the fear index.
+
+Each series (e.g. slug "bitcoin" at interval "hour", or "fear-index" at
+"day") lives in TIMESERIES_DIR/<slug>/<interval>/ as one packed binary
+column per field (`array` module: int64 millisecond timestamps, float64
+values, NaN for missing) plus a small meta.json. Columns are append-only:
+a sync asks the API only for the tail after the last stored timestamp,
+drops overlapping points, replaces the last stored point if the server
+sent a newer value for it (e.g. the still-open current hour), and appends
+the rest.
+
+Usage examples:
+
+    # Keep hourly bitcoin history up to date (first run backfills from --start)
+    python dropstab_timeseries.py chart bitcoin --interval hour --start 2024-01-01
+
+    # Keep the fear index up to date
+    python dropstab_timeseries.py fear-index
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import threading
+from array import array
+from contextlib import closing
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+from dropstab_base import DATA_DIR, GET, HTTPStatusError, atomic_write, map_ordered
+
+# Where series are stored
+TIMESERIES_DIR = DATA_DIR / "timeseries"
+
+# Value columns per kind of series
+CHART_COLUMNS = ("price", "volume", "mcap")
+FEAR_INDEX_COLUMNS = ("value",)
+
+# First date requested when a series has never been synced
+CHART_DEFAULT_START = "2020-01-01T00:00:00"
+FEAR_INDEX_START = "2010-01-01T00:00:00"  # must be LocalDateTime (no Z, no offset)
+
+# Longest from/to window requested in one chart-by-interval call, per interval
+CHUNK_SPANS = {
+    "minute": timedelta(days=1),
+    "hour": timedelta(days=30),
+    "day": timedelta(days=365),
+    "week": timedelta(days=5 * 365),
+}
+DEFAULT_CHUNK_SPAN = timedelta(days=30)
+
+# Chunks are never split below this span when a range is rejected or times out
+MIN_CHUNK_SPAN = timedelta(hours=6)
+
+# Chunks fetched concurrently
+CHUNK_WORKERS: int = 4
+
+# A 4xx whose message matches this rejects the range as too large (other 4xx are final)
+RANGE_ERROR_PATTERN = re.compile(r"range|too (large|long|many)", re.IGNORECASE)
+
+# Field names the API may use for each column in dict-shaped points
+FIELD_ALIASES = {
+    "timestamp": ("timestamp", "time", "date", "ts", "t"),
+    "price": ("price", "close", "value"),
+    "volume": ("volume", "totalVolume", "volume24h", "vol"),
+    "mcap": ("marketCap", "mcap", "market_cap", "marketcap"),
+    "value": ("value", "index", "fearIndex", "score"),
+}
+
+# Keys of dict-of-arrays responses ({"price": [[ts, v], ...], ...})
+_SERIES_KEYS = {
+    "price": ("price", "prices"),
+    "volume": ("volume", "volumes", "totalVolumes"),
+    "mcap": ("marketCap", "marketCaps", "mcap"),
+    "value": ("value", "values"),
+}
+
+
+def _to_ms(value) -> int | None:
+    """Epoch seconds/milliseconds or ISO 8601 string -> epoch milliseconds."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value if value > 1e11 else value * 1000)
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp() * 1000)
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _local_datetime(ms: int) -> str:
+    """Epoch ms -> LocalDateTime string as the API expects (UTC, no suffix)."""
+    return datetime.fromtimestamp(ms / 1000, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _parse_local(value: str) -> datetime:
+    """LocalDateTime (or date) string -> aware UTC datetime."""
+    dt = datetime.fromisoformat(value)
+    return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
+
+
+def _format_local(dt: datetime) -> str:
+    return dt.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def parse_points(data, columns: tuple) -> list[tuple]:
+    """
+    Normalize a chart/fear-index payload into `(ts_ms, *values)` tuples.
+
+    Accepts a list of dicts, a list of `[ts, v1, v2, ...]` rows, or a dict of
+    `[[ts, v], ...]` arrays keyed by column name. Unparseable points are skipped.
+    """
+    if isinstance(data, dict):
+        content = data.get("content") or data.get("items") or data.get("data")
+        if isinstance(content, list):
+            return parse_points(content, columns)
+
+        by_ts: dict[int, list] = {}
+        for index, column in enumerate(columns):
+            rows = next(
+                (data[key] for key in _SERIES_KEYS.get(column, (column,)) if data.get(key)), []
+            )
+            for row in rows:
+                if isinstance(row, (list, tuple)) and len(row) >= 2:
+                    ts = _to_ms(row[0])
+                    if ts is not None:
+                        by_ts.setdefault(ts, [math.nan] * len(columns))[index] = _to_float(row[1])
+        return [(ts, *values) for ts, values in sorted(by_ts.items())]
+
+    points = []
+    for row in data or []:
+        if isinstance(row, dict):
+            ts = next(
+                (_to_ms(row[k]) for k in FIELD_ALIASES["timestamp"] if k in row), None
+            )
+            values = [
+                next((_to_float(row[k]) for k in FIELD_ALIASES.get(c, (c,)) if k in row), math.nan)
+                for c in columns
+            ]
+        elif isinstance(row, (list, tuple)) and row:
+            ts = _to_ms(row[0])
+            values = [_to_float(v) for v in row[1 : 1 + len(columns)]]
+            values += [math.nan] * (len(columns) - len(values))
+        else:
+            continue
+        if ts is not None:
+            points.append((ts, *values))
+    return sorted(points)
+
+
+class TimeSeries:
+    """
+    Append-only columnar series on disk.
+
+    Args:
+        slug: Series name (coin slug, or "fear-index").
+        interval: Sampling interval (e.g. "hour", "day").
+        columns: Value column names stored next to the timestamps.
+    """
+
+    _locks: dict = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, slug: str, interval: str, columns: tuple = CHART_COLUMNS):
+        self.slug = slug
+        self.interval = interval
+        self.columns = tuple(columns)
+        self.directory = TIMESERIES_DIR / slug / interval
+        self.meta_file = self.directory / "meta.json"
+        with self._locks_guard:
+            self._lock = self._locks.setdefault(self.directory, threading.Lock())
+
+    def _column_file(self, name: str) -> Path:
+        return self.directory / f"{name}.{'i64' if name == 'timestamp' else 'f64'}"
+
+    def meta(self) -> dict:
+        try:
+            return json.loads(self.meta_file.read_text())
+        except (FileNotFoundError, ValueError):
+            return {"slug": self.slug, "interval": self.interval, "columns": list(self.columns),
+                    "count": 0, "first_ts": None, "last_ts": None}
+
+    @property
+    def last_ts(self) -> int | None:
+        """Epoch ms of the newest stored point, or None if empty."""
+        return self.meta()["last_ts"]
+
+    def read(self) -> dict[str, array]:
+        """All stored columns as `array`s: {"timestamp": array('q'), <column>: array('d')}."""
+        count = self.meta()["count"]
+        out = {}
+        for name in ("timestamp", *self.columns):
+            column = array("q" if name == "timestamp" else "d")
+            if count:
+                with open(self._column_file(name), "rb") as fh:
+                    column.fromfile(fh, count)
+            out[name] = column
+        return out
+
+    def merge(self, points: list[tuple]) -> int:
+        """
+        Append `(ts_ms, *values)` points newer than the stored tail.
+
+        Points older than the last stored timestamp are dropped; a point at
+        exactly the last timestamp replaces the stored one.
+
+        Returns:
+            Number of new points appended.
+        """
+        with self._lock:
+            meta = self.meta()
+            last_ts = meta["last_ts"]
+            count = meta["count"]
+
+            fresh: dict[int, tuple] = {}
+            for point in points:
+                if last_ts is None or point[0] >= last_ts:
+                    fresh[point[0]] = point  # later duplicates win
+            if not fresh:
+                return 0
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if last_ts is not None and last_ts in fresh:
+                count -= 1  # the last stored point gets rewritten
+            # Cut columns back to `count` records; this also drops any bytes a
+            # crash left behind after the last meta.json update
+            for name in ("timestamp", *self.columns):
+                path = self._column_file(name)
+                if path.exists():
+                    with open(path, "r+b") as fh:
+                        fh.truncate(count * 8)
+
+            ordered = [fresh[ts] for ts in sorted(fresh)]
+            with open(self._column_file("timestamp"), "ab") as fh:
+                array("q", (p[0] for p in ordered)).tofile(fh)
+            for index, name in enumerate(self.columns, start=1):
+                with open(self._column_file(name), "ab") as fh:
+                    array("d", (p[index] for p in ordered)).tofile(fh)
+
+            appended = len(ordered) - (1 if last_ts in fresh else 0)
+            meta.update(
+                count=count + len(ordered),
+                first_ts=meta["first_ts"] if meta["first_ts"] is not None else ordered[0][0],
+                last_ts=ordered[-1][0],
+                columns=list(self.columns),
+            )
+            atomic_write(self.meta_file, json.dumps(meta, indent=2))
+            return appended
+
+
+def plan_chunks(start: str, end: str, interval: str) -> list[tuple[str, str]]:
+    """
+    Split `[start, end]` into consecutive windows of at most the interval's
+    CHUNK_SPANS span, as LocalDateTime `(from, to)` pairs. Adjacent windows
+    share their boundary timestamp; the overlap is removed when stitching.
+    """
+    span = CHUNK_SPANS.get(interval, DEFAULT_CHUNK_SPAN)
+    lo, hi = _parse_local(start), _parse_local(end)
+    chunks = []
+    while lo < hi:
+        upper = min(lo + span, hi)
+        chunks.append((_format_local(lo), _format_local(upper)))
+        lo = upper
+    return chunks
+
+
+def _splittable(error: Exception) -> bool:
+    """Whether a failed window may succeed in smaller pieces: range rejected or timed out."""
+    if isinstance(error, HTTPStatusError):
+        # Only the server's message: str(error) also holds the URL, whose slug may say "range"
+        return error.status in (400, 413, 422) and bool(RANGE_ERROR_PATTERN.search(error.server_message))
+    from requests.exceptions import Timeout
+
+    return isinstance(error, Timeout)
+
+
+def _items_by_ts(data) -> dict[int, object]:
+    """
+    Raw chart items of a response keyed by timestamp. A dict of per-column
+    arrays has no per-point item, so its points become `[ts, *values]` rows.
+    """
+    rows = data
+    if isinstance(data, dict):
+        rows = data.get("content") or data.get("items") or data.get("data")
+        if not isinstance(rows, list):
+            return {point[0]: list(point) for point in parse_points(data, CHART_COLUMNS)}
+    items = {}
+    for row in rows or []:
+        point = parse_points([row], CHART_COLUMNS)
+        if point:
+            items[point[0][0]] = row
+    return items
+
+
+def _fetch_chunk(
+    slug: str, interval: str, start: str, end: str, params: dict, issued: list
+) -> dict[int, object]:
+    """
+    Fetch one window, splitting it in halves if the server rejects the range
+    as too large or the request times out. Other errors (bad slug, auth,
+    5xx after GET's own retries) are raised at once.
+
+    Every request issued is appended to `issued`.
+
+    Returns:
+        `{ts_ms: raw item}` of the window.
+    """
+    issued.append((start, end))
+    try:
+        resp = GET(
+            f"coins/history/chart-by-interval/{slug}",
+            params={**params, "from": start, "to": end, "interval": interval},
+        )
+    except (RuntimeError, OSError) as e:  # OSError covers requests' exceptions
+        if not _splittable(e):
+            raise
+        error = e
+    else:
+        data = resp.get("data", resp) if isinstance(resp, dict) else resp
+        return _items_by_ts(data)
+
+    lo, hi = _parse_local(start), _parse_local(end)
+    if hi - lo <= MIN_CHUNK_SPAN:
+        raise error
+    mid = _format_local(lo + (hi - lo) / 2)
+    print(f"[chart {slug}/{interval}] chunk {start}..{end} failed ({error!r}); splitting")
+    return {
+        **_fetch_chunk(slug, interval, start, mid, params, issued),
+        **_fetch_chunk(slug, interval, mid, end, params, issued),
+    }
+
+
+def fetch_chart_items(
+    slug: str,
+    start: str,
+    end: str,
+    interval: str = "hour",
+    params: dict | None = None,
+    max_workers: int = CHUNK_WORKERS,
+    stats: dict | None = None,
+) -> list:
+    """
+    Fetch a long chart-by-interval range as concurrent chunked sub-requests.
+
+    The range is split by `plan_chunks`, chunks are fetched in parallel
+    (through the shared rate limiter), and the results are stitched in time
+    order with overlapping boundary points de-duplicated.
+
+    Args:
+        stats: If given, `stats["requests"]` is increased by the requests
+            issued, split windows included, even if the fetch fails.
+
+    Returns:
+        The API's chart items, as sent, sorted by timestamp.
+    """
+    params = dict(params or {})
+    chunks = plan_chunks(start, end, interval)
+    issued: list = []
+
+    def fetch(chunk: tuple[str, str]) -> dict[int, object]:
+        return _fetch_chunk(slug, interval, chunk[0], chunk[1], params, issued)
+
+    items: dict[int, object] = {}
+    try:
+        with closing(map_ordered(fetch, chunks, max_workers)) as results:
+            for index, chunk_items in enumerate(results, start=1):
+                items.update(chunk_items)
+                print(f"[chart {slug}/{interval}] chunk {index}/{len(chunks)} with {len(chunk_items)} points")
+    finally:
+        if stats is not None:
+            stats["requests"] = stats.get("requests", 0) + len(issued)
+    return [items[ts] for ts in sorted(items)]
+
+
+def fetch_chart_range(
+    slug: str,
+    start: str,
+    end: str,
+    interval: str = "hour",
+    params: dict | None = None,
+    max_workers: int = CHUNK_WORKERS,
+    stats: dict | None = None,
+) -> list[tuple]:
+    """
+    Like `fetch_chart_items`, normalized by `parse_points`.
+
+    Returns:
+        `(ts_ms, price, volume, mcap)` tuples sorted by timestamp.
+    """
+    items = fetch_chart_items(slug, start, end, interval, params, max_workers, stats)
+    return parse_points(items, CHART_COLUMNS)
+
+
+def merge_chart(slug: str, interval: str, points: list[tuple]) -> int:
+    """Merge `(ts_ms, price, volume, mcap)` points into the chart's store. Returns points appended."""
+    series = TimeSeries(slug, interval, CHART_COLUMNS)
+    appended = series.merge(points)
+    print(f"[timeseries {slug}/{interval}] +{appended} points (total {series.meta()['count']})")
+    return appended
+
+
+def sync_chart(slug: str, interval: str = "hour", start: str = CHART_DEFAULT_START) -> int:
+    """
+    Fetch the missing tail of a coin chart and merge it into its store.
+
+    Requests `coins/history/chart-by-interval/{slug}` from the last stored
+    timestamp (or `start` for a new series) up to now, chunked via
+    `fetch_chart_range` so long backfills run as parallel sub-requests.
+
+    Returns:
+        Number of new points appended.
+    """
+    last = TimeSeries(slug, interval, CHART_COLUMNS).last_ts
+    points = fetch_chart_range(
+        slug,
+        _local_datetime(last) if last is not None else start,
+        datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S"),
+        interval,
+    )
+    return merge_chart(slug, interval, points)
+
+
+def fetch_fear_index(start: str) -> object:
+    """Fear-index history from `start` until now, as the API returns it (unwrapped `data`)."""
+    params = {"from": start, "to": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S")}
+    resp = GET("coins/history/fear-index", params=params)
+    return resp.get("data", resp) if isinstance(resp, dict) else resp
+
+
+def _merge_fear_index(data) -> int:
+    series = TimeSeries("fear-index", "day", FEAR_INDEX_COLUMNS)
+    appended = series.merge(parse_points(data, FEAR_INDEX_COLUMNS))
+    print(f"[timeseries fear-index] +{appended} points (total {series.meta()['count']})")
+    return appended
+
+
+def sync_fear_index(start: str = FEAR_INDEX_START) -> int:
+    """Fetch the missing tail of the fear index history and merge it into its store."""
+    last = TimeSeries("fear-index", "day", FEAR_INDEX_COLUMNS).last_ts
+    return _merge_fear_index(fetch_fear_index(_local_datetime(last) if last is not None else start))
+
+
+def update_fear_index_items(items: list, start: str = FEAR_INDEX_START) -> object:
+    """
+    Bring raw fear-index items (e.g. a previous snapshot's) up to date.
+
+    Only the tail after the newest item is requested (everything from
+    `start` if there is none). It is merged in, the newer item winning per
+    timestamp, and also merged into the time-series store. Items keep every
+    field the API sent.
+
+    Returns:
+        The merged items in time order. A response that is not a list of
+        points is returned as fetched for the whole range from `start`.
+    """
+    by_ts = {}
+    for item in items:
+        point = parse_points([item], FEAR_INDEX_COLUMNS)
+        if point:
+            by_ts[point[0][0]] = item
+
+    tail = fetch_fear_index(_local_datetime(max(by_ts)) if by_ts else start)
+    if not isinstance(tail, list):
+        data = tail if not by_ts else fetch_fear_index(start)
+        _merge_fear_index(data)
+        return data
+
+    _merge_fear_index(tail)
+    for item in tail:
+        point = parse_points([item], FEAR_INDEX_COLUMNS)
+        if point:
+            by_ts[point[0][0]] = item
+    return [by_ts[ts] for ts in sorted(by_ts)]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sync local DropsTab time-series stores.")
+    sub = parser.add_subparsers(dest="kind", required=True)
+    chart = sub.add_parser("chart", help="Coin chart by interval.")
+    chart.add_argument("slugs", nargs="+")
+    chart.add_argument("--interval", default="hour")
+    chart.add_argument("--start", default=CHART_DEFAULT_START, help="LocalDateTime for new series.")
+    sub.add_parser("fear-index", help="Fear index history.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.kind == "fear-index":
+        sync_fear_index()
+        return
+    start = args.start if "T" in args.start else f"{args.start}T00:00:00"
+    for slug in args.slugs:
+        sync_chart(slug, args.interval, start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Normalized SQLite warehouse loaded from the latest snapshots.
+
+Upserts the items of every list snapshot (plus per-exchange pair files)
+into relational tables, splitting out the entities the API nests inside
+other records:
+
+    coins           <- coins_all, and coins nested in rounds/unlocks/activities
+    investors       <- investors_list_all, and investors nested in funding rounds
+    funding_rounds  <- fundingRounds_all
+    round_investors <- investors of each funding round (round_id, investor_slug)
+    unlock_events   <- tokenUnlocks_all (one row per coin and unlock date)
+    exchanges       <- exchanges_all
+    pairs           <- exchange_pairs_<exchangeSlug>_YYYYMMDD.json
+    activities      <- cryptoActivities_all
+
+Every table keeps the full item as JSON in `data` next to the extracted,
+indexed columns. Loads use `executemany` inside one transaction per
+snapshot on a WAL-mode database, so readers are never blocked. Records
+from list snapshots overwrite existing rows; entities only seen nested in
+other records are inserted but never overwrite a full record. A round's
+`round_investors` rows are replaced by its current investor list.
+
+Usage examples:
+
+    # Load the latest snapshots
+    python dropstab_warehouse.py
+
+    # Query it
+    python dropstab_warehouse.py --query "SELECT i.slug, count(*) FROM round_investors ri
+        JOIN investors i ON i.slug = ri.investor_slug GROUP BY 1 ORDER BY 2 DESC LIMIT 10"
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dropstab_base import DATA_DIR, latest_snapshot, latest_snapshots, read_json, utc_now_iso
+from dropstab_models import entities, pick, to_slug
+
+# Warehouse database file
+WAREHOUSE_FILE = DATA_DIR / "warehouse.sqlite"
+
+
+@dataclass(frozen=True)
+class Table:
+    """A warehouse table: its columns and the primary key used for upserts."""
+
+    name: str
+    columns: tuple
+    key: tuple
+
+    def ddl(self) -> str:
+        cols = ", ".join(self.columns)
+        return f"CREATE TABLE IF NOT EXISTS {self.name} ({cols}, PRIMARY KEY ({', '.join(self.key)}))"
+
+    def upsert_sql(self, overwrite: bool = True) -> str:
+        placeholders = ", ".join("?" * len(self.columns))
+        sql = f"INSERT INTO {self.name} ({', '.join(self.columns)}) VALUES ({placeholders})"
+        updates = [c for c in self.columns if c not in self.key]
+        if overwrite and updates:
+            assignments = ", ".join(f"{c} = excluded.{c}" for c in updates)
+            return f"{sql} ON CONFLICT ({', '.join(self.key)}) DO UPDATE SET {assignments}"
+        return f"{sql} ON CONFLICT DO NOTHING"
+
+
+TABLES = {
+    t.name: t
+    for t in [
+        Table("coins", ("slug", "id", "symbol", "name", "rank", "price", "market_cap", "data"), ("slug",)),
+        Table("investors", ("slug", "id", "name", "tier", "data"), ("slug",)),
+        Table(
+            "funding_rounds",
+            ("id", "coin_slug", "date", "stage", "amount", "data"),
+            ("id",),
+        ),
+        Table("round_investors", ("round_id", "investor_slug", "lead"), ("round_id", "investor_slug")),
+        Table(
+            "unlock_events",
+            ("coin_slug", "date", "label", "amount", "value", "data"),
+            ("coin_slug", "date", "label"),
+        ),
+        Table("exchanges", ("slug", "id", "name", "data"), ("slug",)),
+        Table("pairs", ("exchange_slug", "symbol", "base", "quote", "data"), ("exchange_slug", "symbol")),
+        Table("activities", ("id", "coin_slug", "date", "type", "title", "data"), ("id",)),
+        Table("loads", ("name", "snapshot", "data_ts_utc", "rows", "loaded_utc"), ("name",)),
+    ]
+}
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS coins_symbol ON coins (symbol)",
+    "CREATE INDEX IF NOT EXISTS funding_rounds_coin ON funding_rounds (coin_slug, date)",
+    "CREATE INDEX IF NOT EXISTS funding_rounds_date ON funding_rounds (date)",
+    "CREATE INDEX IF NOT EXISTS round_investors_investor ON round_investors (investor_slug)",
+    "CREATE INDEX IF NOT EXISTS unlock_events_date ON unlock_events (date)",
+    "CREATE INDEX IF NOT EXISTS activities_coin ON activities (coin_slug, date)",
+]
+
+
+# Field extraction
+
+
+def _json(item) -> str:
+    return json.dumps(item, separators=(",", ":"))
+
+
+@dataclass
+class Batch:
+    """Rows collected from one snapshot, written in a single transaction."""
+
+    upserts: dict = field(default_factory=dict)
+    inserts: dict = field(default_factory=dict)  # nested entities: never overwrite
+    clears: dict = field(default_factory=dict)  # {(table, column): [(value,), ...]} to delete first
+
+    def upsert(self, table: str, row: tuple) -> None:
+        self.upserts.setdefault(table, []).append(row)
+
+    def insert(self, table: str, row: tuple) -> None:
+        self.inserts.setdefault(table, []).append(row)
+
+    def clear(self, table: str, column: str, value) -> None:
+        """Delete the rows of `table` whose `column` is `value` before writing this batch."""
+        self.clears.setdefault((table, column), []).append((value,))
+
+    def rows(self) -> int:
+        return sum(len(r) for r in self.upserts.values())
+
+
+def _coin_row(item: dict) -> tuple | None:
+    slug = to_slug(item.get("slug"))
+    if slug is None:
+        return None
+    return (
+        slug,
+        pick(item, "id"),
+        pick(item, "symbol"),
+        pick(item, "name"),
+        pick(item, "rank"),
+        pick(item, "price"),
+        pick(item, "marketCap", "mcap"),
+        _json(item),
+    )
+
+
+def _nested_coins(item: dict, batch: Batch) -> str | None:
+    """Insert coins nested in `item`; returns the first coin's slug."""
+    first = None
+    for coin in entities(item, "coin", "coins"):
+        row = _coin_row(coin) if isinstance(coin, dict) else None
+        if row:
+            batch.insert("coins", row)
+        first = first or to_slug(coin)
+    return first or to_slug(item.get("coinSlug"))
+
+
+# Per-snapshot loaders
+
+
+def _load_coins(items: list[dict], batch: Batch) -> None:
+    for item in items:
+        row = _coin_row(item)
+        if row:
+            batch.upsert("coins", row)
+
+
+def _investor_row(item: dict) -> tuple | None:
+    slug = to_slug(item.get("slug"))
+    if slug is None:
+        return None
+    return slug, pick(item, "id"), pick(item, "name"), pick(item, "tier"), _json(item)
+
+
+def _load_investors(items: list[dict], batch: Batch) -> None:
+    for item in items:
+        row = _investor_row(item)
+        if row:
+            batch.upsert("investors", row)
+
+
+def _load_funding_rounds(items: list[dict], batch: Batch) -> None:
+    for item in items:
+        round_id = pick(item, "id", "slug")
+        if round_id is None:
+            continue
+        coin_slug = _nested_coins(item, batch)
+        batch.upsert("funding_rounds", (
+            round_id,
+            coin_slug,
+            pick(item, "date", "announceDate"),
+            pick(item, "stage", "round"),
+            pick(item, "fundsRaised", "amount", "raised"),
+            _json(item),
+        ))
+        # The snapshot's investor list replaces the stored one, dropping removed investors
+        batch.clear("round_investors", "round_id", round_id)
+        leads = {to_slug(i) for i in entities(item, "leadInvestors")}
+        for investor in entities(item, "investors", "leadInvestors", "funds"):
+            slug = to_slug(investor)
+            if slug is None:
+                continue
+            batch.insert("investors", _investor_row(investor if isinstance(investor, dict) else {"slug": slug}))
+            lead = int(slug in leads or bool(isinstance(investor, dict) and investor.get("lead")))
+            batch.upsert("round_investors", (round_id, slug, lead))
+
+
+def _load_token_unlocks(items: list[dict], batch: Batch) -> None:
+    for item in items:
+        coin_slug = _nested_coins(item, batch) or to_slug(item.get("slug"))
+        if coin_slug is None:
+            continue
+        events = entities(item, "events", "unlocks", "vestingEvents") or [item]
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+            date = pick(event, "date", "unlockDate", "nextUnlockDate")
+            if date is None:
+                continue
+            batch.upsert("unlock_events", (
+                coin_slug,
+                date,
+                pick(event, "allocation", "name", "label") or "",
+                pick(event, "amount", "tokens", "nextUnlockAmount"),
+                pick(event, "value", "valueUsd", "nextUnlockValue"),
+                _json(event),
+            ))
+
+
+def _load_exchanges(items: list[dict], batch: Batch) -> None:
+    for item in items:
+        slug = to_slug(item.get("slug"))
+        if slug:
+            batch.upsert("exchanges", (slug, pick(item, "id"), pick(item, "name"), _json(item)))
+
+
+def _load_activities(items: list[dict], batch: Batch) -> None:
+    for item in items:
+        activity_id = pick(item, "id")
+        if activity_id is None:
+            continue
+        batch.upsert("activities", (
+            activity_id,
+            _nested_coins(item, batch),
+            pick(item, "date", "startDate"),
+            pick(item, "type", "category"),
+            pick(item, "title", "name"),
+            _json(item),
+        ))
+
+
+def _pairs_loader(exchange_slug: str) -> Callable[[list[dict], Batch], None]:
+    def load(items: list[dict], batch: Batch) -> None:
+        for item in items:
+            base, quote = pick(item, "base", "baseSymbol"), pick(item, "quote", "quoteSymbol")
+            symbol = pick(item, "symbol", "pair") or (f"{base}/{quote}" if base and quote else None)
+            if symbol:
+                batch.upsert("pairs", (exchange_slug, symbol, base, quote, _json(item)))
+
+    return load
+
+
+LOADERS = {
+    "coins_all": _load_coins,
+    "investors_list_all": _load_investors,
+    "fundingRounds_all": _load_funding_rounds,
+    "tokenUnlocks_all": _load_token_unlocks,
+    "cryptoActivities_all": _load_activities,
+    "exchanges_all": _load_exchanges,
+}
+
+
+# Database
+
+
+def connect(path: Path = WAREHOUSE_FILE) -> sqlite3.Connection:
+    """Open (and if needed create) the warehouse in WAL mode."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    with conn:
+        for table in TABLES.values():
+            conn.execute(table.ddl())
+        for sql in INDEXES:
+            conn.execute(sql)
+    return conn
+
+
+def load_snapshot(conn: sqlite3.Connection, name: str, snapshot: Path, loader) -> int:
+    """Load one snapshot in a single transaction. Returns rows upserted."""
+    payload = read_json(snapshot)
+    items = payload.get("items", [])
+    if isinstance(items, dict):
+        items = items.get("content") or items.get("pairs") or [items]
+
+    batch = Batch()
+    loader([i for i in items if isinstance(i, dict)], batch)
+    with conn:
+        for (table, column), values in batch.clears.items():
+            conn.executemany(f"DELETE FROM {table} WHERE {column} = ?", values)
+        # Nested entities first, so full records from this snapshot win
+        for table, rows in batch.inserts.items():
+            conn.executemany(TABLES[table].upsert_sql(overwrite=False), [r for r in rows if r])
+        for table, rows in batch.upserts.items():
+            conn.executemany(TABLES[table].upsert_sql(), rows)
+        conn.execute(TABLES["loads"].upsert_sql(), (
+            name, Path(snapshot).name, payload.get("data_ts_utc"), batch.rows(), utc_now_iso(),
+        ))
+    print(f"[warehouse] {Path(snapshot).name}: {batch.rows()} rows")
+    return batch.rows()
+
+
+def load_warehouse(path: Path = WAREHOUSE_FILE) -> dict:
+    """
+    Upsert the latest snapshot of every supported endpoint into the warehouse.
+
+    Returns:
+        `{snapshot name: rows upserted}`.
+    """
+    sources = [(name, latest_snapshot(name), loader) for name, loader in LOADERS.items()]
+    sources += [
+        (f"exchange_pairs_{slug}", pairs_file, _pairs_loader(slug))
+        for slug, pairs_file in (
+            (key.lower(), path) for key, path in latest_snapshots("exchange_pairs").items()
+        )
+    ]
+
+    counts = {}
+    conn = connect(path)
+    try:
+        for name, snapshot, loader in sources:
+            if snapshot is not None:
+                counts[name] = load_snapshot(conn, name, snapshot, loader)
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+    return counts
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load snapshots into the SQLite warehouse.")
+    parser.add_argument("--db", type=Path, default=WAREHOUSE_FILE, help="Warehouse file.")
+    parser.add_argument("--query", help="Run a SQL query against the warehouse instead of loading.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.query:
+        load_warehouse(args.db)
+        return
+    conn = connect(args.db)
+    try:
+        cursor = conn.execute(args.query)
+        if cursor.description:
+            print("\t".join(c[0] for c in cursor.description))
+        for row in cursor:
+            print("\t".join("" if v is None else str(v) for v in row))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
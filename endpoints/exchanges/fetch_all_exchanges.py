@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 # Fetch all exchanges from DropsTab and write one JSON snapshot to data/raw/
 
-import json
-import time
 from pathlib import Path
 import sys
 
@@ -11,50 +9,11 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from dropstab_base import RAW_DIR, PAGE_SIZE, SLEEP_SEC, GET, utc_now_iso, today_tag
+from dropstab_endpoints import fetch_endpoint
 
 
 def main():
-    all_exchanges = []
-    page = 0  # currentPage is 0-indexed per docs
-
-    while True:
-        params = {"page": page, "pageSize": PAGE_SIZE}
-        resp = GET("exchanges", params=params)
-        data = resp.get("data", {}) if isinstance(resp, dict) else {}
-        content = data.get("content", [])
-
-        all_exchanges.extend(content)
-
-        total_pages = data.get("totalPages")
-        current_page = data.get("currentPage")
-
-        print(
-            f"[exchanges] page {current_page}/"
-            f"{(total_pages - 1) if total_pages is not None else '?'} "
-            f"with {len(content)} items"
-        )
-
-        if (
-            not content
-            or total_pages is None
-            or current_page is None
-            or current_page >= total_pages - 1
-        ):
-            break
-
-        page += 1
-        time.sleep(SLEEP_SEC)
-
-    filename = RAW_DIR / f"exchanges_all_{today_tag()}.json"
-    payload = {
-        "data_ts_utc": utc_now_iso(),
-        "status": "ok",
-        "endpoint": "exchanges",
-        "items": all_exchanges,
-    }
-    filename.write_text(json.dumps(payload, indent=2))
-    print(f"Finished writing {filename} (items: {len(all_exchanges)})")
+    fetch_endpoint("exchanges")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # Fetch historical chart data for a coin within a date range (interval) and write to data/raw/
+# Long ranges are split into chunks fetched in parallel (see dropstab_timeseries.plan_chunks)
 
-import json
 from pathlib import Path
 import sys
 
@@ -9,7 +9,7 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from dropstab_base import RAW_DIR, GET, utc_now_iso, today_tag
+from dropstab_endpoints import fetch_endpoint
 
 COIN_SLUG = "COIN-SLUG-TO-SEARCH"  # e.g. "bitcoin"
 
@@ -29,20 +29,7 @@ PARAMS = {
 
 
 def main():
-    resp = GET(f"coins/history/chart-by-interval/{COIN_SLUG}", params=PARAMS)
-    data = resp.get("data", resp) if isinstance(resp, dict) else resp
-
-    filename = RAW_DIR / f"coin_chart_interval_{COIN_SLUG}_{today_tag()}.json"
-    payload = {
-        "data_ts_utc": utc_now_iso(),
-        "status": "ok",
-        "endpoint": "coins/history/chart-by-interval/{slug}",
-        "slug": COIN_SLUG,
-        "query_params": PARAMS,
-        "items": data,
-    }
-    filename.write_text(json.dumps(payload, indent=2))
-    print(f"Finished writing {filename}")
+    fetch_endpoint("coin_chart_interval", params=PARAMS, slug=COIN_SLUG)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,18 @@
 #!/usr/bin/env python3
 """
-Run all DropsTab fetch scripts in sequence.
+Run all DropsTab fetch scripts in one process, concurrently where possible.
+
+Each job imports an endpoint script and calls its `main()`. Independent jobs
+run in parallel (up to --jobs at a time); all of them share the one rate
+limiter behind `dropstab_base.GET`, so parallelism never exceeds the global
+request budget. Jobs may declare dependencies on other jobs and only start
+once those succeeded. A failing job does not stop the run: its dependents
+are skipped, everything else continues, and a summary report is printed
+and written to data/reports/. A job that did only part of its work (e.g.
+bulk details where some slugs failed) is reported as partial; its
+dependents still run. Ctrl-C stops the run at once: jobs that have not
+started are cancelled and running crawls resume from their checkpoints on
+the next run.
 
 Usage examples:
 
@@ -13,6 +25,30 @@ Usage examples:
     # Skip multiple scripts
     python run_all_dropstab.py --skip exchanges crypto_activities
 
+    # Delta-sync the endpoints supported by dropstab_delta.py instead of
+    # re-downloading them in full
+    python run_all_dropstab.py --delta
+
+    # Old behaviour: one job at a time
+    python run_all_dropstab.py --jobs 1
+
+    # Also refresh per-slug details once the coins/investors lists are written
+    python run_all_dropstab.py --details coins investors
+
+    # Do not rebuild the local lookup index (dropstab_index.py) at the end
+    python run_all_dropstab.py --no-index
+
+    # Finally move older snapshots into the compressed, deduplicated store
+    python run_all_dropstab.py --archive
+
+    # Also write request metrics in Prometheus text format (e.g. for the
+    # node_exporter textfile collector)
+    python run_all_dropstab.py --prometheus /var/lib/node_exporter/dropstab.prom
+
+    # Page through list endpoints with learned per-endpoint page sizes
+    # (dropstab_pagesize.py) instead of the fixed PAGE_SIZE
+    python run_all_dropstab.py --adaptive-pages
+
 Available script keys (for --skip):
     funding_rounds
     investors
@@ -28,11 +64,40 @@ Available script keys (for --skip):
 from __future__ import annotations
 
 import argparse
-import subprocess
+import importlib.util
+import json
+import os
 import sys
+import time
+import traceback
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, UTC
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from dropstab_base import DATA_DIR, atomic_write, request_metrics, retry_metrics, utc_now_iso
+
+# Run reports (one JSON file per run)
+REPORTS_DIR = DATA_DIR / "reports"
+
+# Script keys that --delta runs through dropstab_delta.py
+DELTA_KEYS = {"funding_rounds", "investors", "coins", "crypto_activities"}
+
+# Max jobs running at the same time (the shared rate limiter still applies)
+DEFAULT_JOBS = 4
+
+# --details kinds (see dropstab_bulk.DETAIL_SPECS) -> list job that feeds their slugs
+DETAIL_DEPS = {
+    "coins": "coins",
+    "investors": "investors",
+    "exchanges": "exchanges",
+    "token_unlocks": "token_unlocks_supported",
+}
 
 SCRIPTS = [
     ("funding_rounds", "Funding rounds", "endpoints/funding_rounds/fetch_all_funding_rounds.py"),
@@ -43,7 +108,7 @@ SCRIPTS = [
     (
         "token_unlocks_supported",
         "Token unlocks supported coins",
-        "endpoints/token_unlocks/fetch_all_token_unlocks_supported_coins.py",
+        "endpoints/token_unlocks/fetch_all_token_unlocks_supported.py",
     ),
     ("fear_index", "Fear index history", "endpoints/history/fetch_fear_index_history.py"),
     ("crypto_activities", "Crypto activities", "endpoints/crypto_activities/fetch_all_crypto_activities.py"),
@@ -51,17 +116,224 @@ SCRIPTS = [
 ]
 
 
-def run_script(rel_path: str, label: str) -> None:
+class PartialFailure(Exception):
+    """Raised by a job that finished but could not do all of its work."""
+
+
+@dataclass
+class Job:
+    """One unit of work: `run()` is called once all `deps` succeeded."""
+
+    key: str
+    label: str
+    run: Callable[[], object]
+    deps: tuple = ()
+
+
+@dataclass
+class JobResult:
+    key: str
+    label: str
+    status: str  # "ok" | "partial" | "failed" | "skipped"
+    seconds: float = 0.0
+    error: str | None = None
+    deps: list = field(default_factory=list)
+
+
+def load_main(rel_path: str) -> Callable[[], object]:
+    """Import an endpoint script by path and return its `main` function."""
     script_path = ROOT / rel_path
-    print(f"\n=== Running [{label}] -> {script_path} ===")
+    module_name = "dropstab_job_" + script_path.stem
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.main
+
+
+def _script_job(key: str, label: str, rel_path: str) -> Job:
+    return Job(key, label, lambda: load_main(rel_path)())
+
+
+def _delta_job(key: str, label: str) -> Job:
+    def run():
+        from dropstab_delta import DELTA_SPECS, delta_sync
+
+        return delta_sync(DELTA_SPECS[key])
+
+    return Job(key, f"{label} (delta)", run)
+
+
+def _details_job(kind: str) -> Job:
+    def run():
+        from dropstab_bulk import DETAIL_SPECS, bulk_fetch, slugs_from_snapshot
+
+        spec = DETAIL_SPECS[kind]
+        summary = bulk_fetch(spec, slugs_from_snapshot(spec))
+        if summary["failed"] and not summary["ok"]:
+            raise RuntimeError(f"all {summary['failed']} slugs failed")
+        if summary["failed"]:
+            raise PartialFailure(f"{summary['failed']} of {summary['slugs']} slugs failed")
+        return summary
+
+    return Job(f"{kind}_details", f"{kind} details (bulk)", run, deps=(DETAIL_DEPS[kind],))
+
+
+def _index_job(deps: tuple) -> Job:
+    def run():
+        from dropstab_index import build_index
+
+        return build_index()
+
+    return Job("index", "Lookup index", run, deps=deps)
+
+
+def _archive_job(deps: tuple) -> Job:
+    def run():
+        from dropstab_store import archive
+
+        return archive()
+
+    return Job("archive", "Archive snapshots", run, deps=deps)
+
+
+def build_jobs(
+    skip: set[str],
+    delta: bool,
+    details: list[str] = (),
+    index: bool = True,
+    archive: bool = False,
+) -> list[Job]:
+    jobs = []
+    for key, label, rel_path in SCRIPTS:
+        if key in skip:
+            print(f"=== Skipping [{label}] ({key}) ===")
+            continue
+        if delta and key in DELTA_KEYS:
+            jobs.append(_delta_job(key, label))
+        else:
+            jobs.append(_script_job(key, label, rel_path))
+    jobs.extend(_details_job(kind) for kind in details)
+    if index:
+        jobs.append(_index_job(tuple(job.key for job in jobs)))
+    if archive:
+        jobs.append(_archive_job(tuple(job.key for job in jobs)))
+    return jobs
+
+
+def _run_one(job: Job) -> JobResult:
+    print(f"\n=== Running [{job.label}] ===")
+    start = time.perf_counter()
+    try:
+        job.run()
+    except PartialFailure as e:
+        print(f"!!! Job incomplete: {job.label}: {e}")
+        return JobResult(job.key, job.label, "partial", time.perf_counter() - start, str(e))
+    except Exception as e:  # keep going past failures
+        traceback.print_exc()
+        print(f"!!! Job failed: {job.label}: {e!r}")
+        return JobResult(job.key, job.label, "failed", time.perf_counter() - start, repr(e))
+    print(f"=== Done [{job.label}] in {time.perf_counter() - start:.1f}s ===")
+    return JobResult(job.key, job.label, "ok", time.perf_counter() - start)
+
+
+def run_jobs(jobs: list[Job], max_parallel: int = DEFAULT_JOBS) -> list[JobResult]:
+    """
+    Run `jobs` respecting their dependencies, at most `max_parallel` at once.
+
+    Dependencies on keys that are not part of this run are treated as
+    satisfied, and so are partial ones. Jobs whose dependencies failed (or
+    form a cycle) are skipped. On KeyboardInterrupt (or any other error
+    escaping a job) jobs not yet started are cancelled and the exception is
+    re-raised at once, without waiting for the running ones.
+
+    Returns:
+        One JobResult per job, in the order of `jobs`.
+    """
+    keys = {job.key for job in jobs}
+    pending = {job.key: job for job in jobs}
+    results: dict[str, JobResult] = {}
+    running: dict = {}
+
+    pool = ThreadPoolExecutor(max_workers=max(1, max_parallel))
     try:
-        subprocess.run(
-            [sys.executable, str(script_path)],
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"!!! Script failed: {script_path} (exit code {e.returncode})")
-        sys.exit(e.returncode)
+        while pending or running:
+            for key, job in list(pending.items()):
+                deps = [d for d in job.deps if d in keys]
+                if any(d in results and results[d].status not in ("ok", "partial") for d in deps):
+                    results[key] = JobResult(
+                        key, job.label, "skipped", error="dependency failed", deps=deps
+                    )
+                    del pending[key]
+                elif all(d in results for d in deps):
+                    running[pool.submit(_run_one, job)] = job
+                    del pending[key]
+
+            if not running:
+                # Nothing runnable is left: the remaining jobs depend on each other
+                for key, job in pending.items():
+                    results[key] = JobResult(key, job.label, "skipped", error="dependency cycle")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                results[job.key] = future.result()
+                results[job.key].deps = [d for d in job.deps if d in keys]
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+    return [results[job.key] for job in jobs]
+
+
+def write_report(
+    results: list[JobResult],
+    started_utc: str,
+    seconds: float,
+    prometheus: Path | None = None,
+    page_sizes: dict | None = None,
+) -> Path:
+    """
+    Print the run summary and write it as JSON under REPORTS_DIR, plus the
+    request metrics as Prometheus text to `prometheus` if given. Learned
+    `page_sizes` (see dropstab_pagesize) are added to the report if given.
+    """
+    print("\n=== Summary ===")
+    for r in results:
+        line = f"{r.status.upper():<8} {r.seconds:8.1f}s  {r.label}"
+        print(line + (f"  ({r.error})" if r.error else ""))
+    print(f"Total wall time: {seconds:.1f}s")
+
+    endpoints = request_metrics().as_dict()
+    if endpoints:
+        print("\nSlowest endpoints (total request time):")
+        for endpoint, m in list(endpoints.items())[:5]:
+            print(
+                f"  {m['seconds_total']:8.1f}s  {m['requests']:6d} req  "
+                f"{m['ratelimit_wait_sec']:7.1f}s throttled  {endpoint}"
+            )
+
+    report = {
+        "started_utc": started_utc,
+        "finished_utc": utc_now_iso(),
+        "wall_seconds": round(seconds, 3),
+        "jobs": [asdict(r) for r in results],
+        "retries": retry_metrics(),
+        "endpoints": endpoints,
+    }
+    if page_sizes is not None:
+        report["page_sizes"] = page_sizes
+    if prometheus is not None:
+        prometheus.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(prometheus, request_metrics().to_prometheus())
+        print(f"Prometheus metrics written to {prometheus}")
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    path = REPORTS_DIR / f"run_all_{stamp}.json"
+    path.write_text(json.dumps(report, indent=2))
+    print(f"Report written to {path}")
+    return path
 
 
 def parse_args() -> argparse.Namespace:
@@ -75,6 +347,47 @@ def parse_args() -> argparse.Namespace:
         default=[],
         help="One or more script keys to skip (see module docstring for list).",
     )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Delta-sync funding_rounds, investors, coins and crypto_activities.",
+    )
+    parser.add_argument(
+        "--details",
+        nargs="+",
+        choices=list(DETAIL_DEPS),
+        default=[],
+        help="Bulk-fetch per-slug details after the list they depend on.",
+    )
+    parser.add_argument(
+        "--no-index",
+        dest="index",
+        action="store_false",
+        help="Do not rebuild the local lookup index after the sync.",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Move older snapshots into the deduplicated store (dropstab_store.py) at the end.",
+    )
+    parser.add_argument(
+        "--prometheus",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Also write request metrics in Prometheus text format to PATH.",
+    )
+    parser.add_argument(
+        "--adaptive-pages",
+        action="store_true",
+        help="Use and refine learned per-endpoint page sizes (dropstab_pagesize.py).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Max jobs running concurrently (default: {DEFAULT_JOBS}).",
+    )
     return parser.parse_args()
 
 
@@ -85,13 +398,37 @@ def main() -> None:
     if skip_set:
         print(f"Skipping: {', '.join(sorted(skip_set))}")
 
+    sizer = None
+    if args.adaptive_pages:
+        from dropstab_pagesize import install_page_sizer
+
+        sizer = install_page_sizer()
+
     print("Starting DropsTab full data fetch...")
-    for key, label, rel_path in SCRIPTS:
-        if key in skip_set:
-            print(f"\n=== Skipping [{label}] ({key}) ===")
-            continue
-        run_script(rel_path, label)
+    started_utc = utc_now_iso()
+    start = time.perf_counter()
+    jobs = build_jobs(skip_set, args.delta, args.details, args.index, args.archive)
+    try:
+        results = run_jobs(jobs, max_parallel=args.jobs)
+    except KeyboardInterrupt:
+        # Exit without joining the worker threads still inside a job; paginated
+        # crawls are checkpointed per page, so a rerun resumes them
+        print("\nInterrupted: pending jobs cancelled.", flush=True)
+        os._exit(130)
+    if sizer is not None:
+        sizer.save()  # also keeps measurements of crawls that stopped early (delta)
+    write_report(
+        results,
+        started_utc,
+        time.perf_counter() - start,
+        args.prometheus,
+        sizer.as_dict() if sizer is not None else None,
+    )
 
+    failed = [r for r in results if r.status != "ok"]
+    if failed:
+        print(f"\n{len(failed)} job(s) did not complete.")
+        sys.exit(1)
     print("\nAll selected scripts completed.")
 
 
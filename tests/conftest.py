@@ -0,0 +1,74 @@
+# Shared fixtures: a local mock DropsTab server (benchmarks/mock_dropstab.py),
+# a client pointed at it, and a temporary data directory for every module
+# that writes under data/.
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "benchmarks"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import dropstab_base
+from dropstab_base import DropsTabClient, RateLimiter, RetryPolicy, set_client
+from mock_dropstab import MockDropsTab
+
+# Module-level paths redirected into the temporary data directory
+DATA_PATHS = {
+    "dropstab_base": {"RAW_DIR": "raw", "CHECKPOINT_DIR": "raw/checkpoints"},
+    "dropstab_endpoints": {"RAW_DIR": "raw"},
+    "dropstab_bulk": {"RAW_DIR": "raw"},
+    "dropstab_delta": {"RAW_DIR": "raw", "STATE_DIR": "state"},
+    "dropstab_cache": {"CACHE_DIR": "cache"},
+    "dropstab_store": {"RAW_DIR": "raw", "STORE_DIR": "store"},
+    "dropstab_timeseries": {"TIMESERIES_DIR": "timeseries"},
+    "dropstab_warehouse": {"WAREHOUSE_FILE": "warehouse.sqlite"},
+    "dropstab_export": {"COLUMNAR_DIR": "columnar", "SCHEMA_DIR": "columnar/schemas"},
+    "run_all_dropstab": {"REPORTS_DIR": "reports"},
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Temporary data/ directory used by every module for the test."""
+    for module_name, attrs in DATA_PATHS.items():
+        module = importlib.import_module(module_name)
+        for attr, rel in attrs.items():
+            monkeypatch.setattr(module, attr, tmp_path / rel)
+    return tmp_path
+
+
+@pytest.fixture
+def serve(data_dir, monkeypatch):
+    """
+    Start a mock server (MockDropsTab keyword arguments) and point the shared
+    client at it: no rate limit, fast retries.
+    """
+    monkeypatch.setenv(dropstab_base.API_KEY_ENV, "test-key")
+    mocks = []
+
+    def start(**kwargs) -> MockDropsTab:
+        mock = MockDropsTab(**kwargs).start()
+        mocks.append(mock)
+        set_client(DropsTabClient(
+            base_url=mock.base_url,
+            limiter=RateLimiter(rate=0),
+            retry=RetryPolicy(backoff_base=0.0),
+        ))
+        return mock
+
+    yield start
+    set_client(None)
+    for mock in mocks:
+        mock.stop()
+
+
+@pytest.fixture
+def mock(serve) -> MockDropsTab:
+    """Default mock server with 250 items per list endpoint."""
+    return serve(items=250)
+
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from dropstab_async import AsyncDropsTabClient
+from dropstab_base import RateLimiter, RequestMetrics, RetryPolicy
+
+
+def _client(mock, limiter, metrics) -> AsyncDropsTabClient:
+    return AsyncDropsTabClient(
+        base_url=mock.base_url,
+        headers={},
+        limiter=limiter,
+        retry=RetryPolicy(backoff_base=0.0),
+        metrics=metrics,
+    )
+
+
+def test_requests_are_recorded_in_metrics(mock):
+    metrics = RequestMetrics()
+
+    async def run():
+        async with _client(mock, RateLimiter(rate=0), metrics) as client:
+            details = await client.get_many([f"exchanges/ex-{i}" for i in range(10)], max_concurrency=5)
+            items = await client.fetch_all_pages("coins", page_size=100)
+        return details, items
+
+    details, items = asyncio.run(run())
+
+    assert len(details) == 10 and len(items) == 250
+    endpoints = metrics.as_dict()
+    assert endpoints["exchanges/{}"]["requests"] == 10
+    assert endpoints["exchanges/{}"]["statuses"] == {"200": 10}
+    assert endpoints["coins"]["requests"] == 3
+    assert endpoints["coins"]["bytes"] > 0
+
+
+def test_file_backed_limiter_runs_off_the_event_loop(mock, tmp_path):
+    limiter = RateLimiter(rate=0, state_file=tmp_path / "ratelimit.json")
+    if limiter.state_file is None:
+        pytest.skip("file-backed limiter needs fcntl")
+    threads = set()
+    for name in ("try_acquire", "observe"):
+        method = getattr(limiter, name)
+        setattr(limiter, name, lambda *args, method=method: threads.add(threading.get_ident()) or method(*args))
+
+    async def run():
+        async with _client(mock, limiter, RequestMetrics()) as client:
+            await client.get_many([f"exchanges/ex-{i}" for i in range(5)])
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+
+    assert threads and loop_thread not in threads
@@ -0,0 +1,35 @@
+import pytest
+
+from dropstab_base import read_json
+from dropstab_bulk import DETAIL_SPECS, bulk_fetch, slugs_from_snapshot
+from dropstab_endpoints import ENDPOINTS, fetch_endpoint
+
+
+@pytest.mark.parametrize(
+    "kind, detail_key, list_key",
+    [
+        ("coins", "coin_details", "coins"),
+        ("investors", "investor_details", "investors"),
+        ("exchanges", "exchange_details", "exchanges"),
+        ("token_unlocks", "token_unlocks_by_coin", "token_unlocks_supported"),
+    ],
+)
+def test_detail_specs_follow_the_endpoint_registry(kind, detail_key, list_key):
+    spec, detail = DETAIL_SPECS[kind], ENDPOINTS[detail_key]
+    (placeholder,) = detail.placeholders
+
+    assert spec.path.format(slug="x") == detail.path.format(**{placeholder: "x"})
+    assert f"{spec.name}_x" == detail.name.format(**{placeholder: "x"})
+    assert spec.list_snapshot == ENDPOINTS[list_key].name
+
+
+def test_bulk_fetch_from_list_snapshot(mock):
+    spec = DETAIL_SPECS["exchanges"]
+    fetch_endpoint("exchanges")
+
+    slugs = slugs_from_snapshot(spec)
+    summary = bulk_fetch(spec, slugs)
+
+    assert (summary["ok"], summary["failed"]) == (250, 0)
+    (snapshot,) = summary["files"]
+    assert [item["slug"] for item in read_json(snapshot)["items"]] == slugs
@@ -0,0 +1,59 @@
+import pytest
+
+from dropstab_base import GET, fetch_all_pages, request_metrics
+from dropstab_cache import FOREVER, DiskResponseCache, install_cache
+
+BASE = "https://api.example/api/v1"
+
+
+@pytest.mark.parametrize(
+    "path, params, ttl",
+    [
+        ("tokenUnlocks/bitcoin", {}, 6 * 60 * 60),
+        ("tokenUnlocks/supportedCoins", {"page": 0, "pageSize": 100}, 0),
+        ("tokenUnlocks/chart/bitcoin", {}, 0),
+        ("tokenUnlocks", {"page": 0, "pageSize": 100}, 0),
+        ("coins", {"page": 0, "pageSize": 100}, 0),
+        ("exchanges/binance/pairs", {"page": 1, "pageSize": 100}, 0),
+        ("exchanges/binance", {}, 6 * 60 * 60),
+        ("fundingRounds/123", {}, 6 * 60 * 60),
+        ("coins/history/price/bitcoin", {"date": "2020-01-01"}, FOREVER),
+        ("coins/history/price/bitcoin", {"date": "2999-01-01"}, 15 * 60),
+    ],
+)
+def test_ttl_rules(tmp_path, path, params, ttl):
+    cache = DiskResponseCache(directory=tmp_path)
+    assert cache.ttl_for(f"{BASE}/{path}", params) == ttl
+
+
+def test_details_are_served_from_cache_but_list_pages_are_not(mock, data_dir):
+    cache = install_cache(directory=data_dir / "cache")
+
+    for _ in range(2):
+        GET("exchanges/binance")
+    assert mock.reset_counts() == {200: 1}
+
+    for _ in range(2):
+        fetch_all_pages("coins", page_size=100)
+    assert mock.reset_counts() == {200: 6}
+    assert cache.stats()["stores"] == 1
+
+
+def test_size_is_counted_in_bytes(tmp_path):
+    cache = DiskResponseCache(directory=tmp_path)
+    cache.store(f"{BASE}/exchanges/münchen", {}, {"name": "Börse München"}, {})
+
+    (path,) = tmp_path.glob("*/*.json")
+    assert cache.stats()["bytes"] == path.stat().st_size
+
+
+def test_uncacheable_requests_are_not_counted_as_misses(mock, data_dir):
+    install_cache(directory=data_dir / "cache")
+
+    fetch_all_pages("coins", page_size=100)
+    GET("exchanges/binance")
+    GET("exchanges/binance")
+
+    endpoints = request_metrics().as_dict()
+    assert endpoints["coins"]["cache"] == {}
+    assert endpoints["exchanges/{}"]["cache"] == {"miss": 1, "hit": 1}
@@ -0,0 +1,84 @@
+import pytest
+
+from dropstab_base import HTTPStatusError, fetch_all_pages
+
+
+def _fail_from_page(mock, failing: int) -> None:
+    page = mock._page
+
+    def broken(kind, params):
+        if int(params.get("page", 0)) >= failing:
+            raise ValueError("page unavailable")
+        return page(kind, params)
+
+    mock._page = broken
+
+
+def test_interrupted_crawl_resumes_after_last_page_in_order(mock):
+    page = mock._page
+    _fail_from_page(mock, 3)
+    with pytest.raises(HTTPStatusError):
+        fetch_all_pages("coins", page_size=50, max_workers=1, checkpoint="coins_all")
+    mock.reset_counts()
+
+    mock._page = page
+    items = fetch_all_pages("coins", page_size=50, max_workers=1, checkpoint="coins_all")
+
+    assert mock.reset_counts() == {200: 2}  # only pages 3 and 4
+    assert [item["id"] for item in items] == list(range(250))
+
+
+def test_checkpoint_of_another_page_size_is_discarded(mock):
+    page = mock._page
+    _fail_from_page(mock, 2)
+    with pytest.raises(HTTPStatusError):
+        fetch_all_pages("coins", page_size=50, max_workers=1, checkpoint="coins_all")
+    mock.reset_counts()
+
+    mock._page = page
+    items = fetch_all_pages("coins", page_size=100, max_workers=1, checkpoint="coins_all")
+
+    assert mock.reset_counts() == {200: 3}  # started over at pageSize=100
+    assert [item["id"] for item in items] == list(range(250))
+
+
+def test_checkpoint_at_a_failing_page_size_is_discarded(mock, data_dir):
+    from dropstab_base import get_client
+    from dropstab_pagesize import PageSizeTuner
+
+    tuner = PageSizeTuner(state_file=data_dir / "page_sizes.json", default=50).attach(get_client())
+    page = mock._page
+    # Page 3 is rejected at pageSize=50: the tuner records 50 as the limit
+    _fail_from_page(mock, 3)
+    with pytest.raises(HTTPStatusError):
+        fetch_all_pages("coins", max_workers=1, checkpoint="coins_all")
+    assert tuner.limit("coins") == 50
+    mock.reset_counts()
+
+    mock._page = page
+    items = fetch_all_pages("coins", max_workers=1, checkpoint="coins_all")
+
+    assert mock.reset_counts() == {200: 10}  # started over at pageSize=25
+    assert [item["id"] for item in items] == list(range(250))
+
+
+def test_endpoint_crawl_resumes_on_the_next_day_and_cleans_up(mock, monkeypatch):
+    import dropstab_base
+    import dropstab_endpoints
+    from dropstab_base import read_json
+    from dropstab_endpoints import fetch_endpoint
+
+    page = mock._page
+    _fail_from_page(mock, 2)
+    monkeypatch.setattr(dropstab_endpoints, "today_tag", lambda: "20250101")
+    with pytest.raises(HTTPStatusError):
+        fetch_endpoint("coins")
+    mock.reset_counts()
+
+    mock._page = page
+    monkeypatch.setattr(dropstab_endpoints, "today_tag", lambda: "20250102")
+    snapshot = fetch_endpoint("coins")
+
+    assert mock.reset_counts() == {200: 1}  # only the last page
+    assert [item["id"] for item in read_json(snapshot)["items"]] == list(range(250))
+    assert not any(dropstab_base.CHECKPOINT_DIR.iterdir())
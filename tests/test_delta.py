@@ -0,0 +1,49 @@
+import pytest
+
+from dropstab_delta import DELTA_SPECS, _as_timestamp, delta_sync, load_state, save_state
+
+
+def test_dated_endpoint_stops_at_old_records_and_keeps_newest_first(mock):
+    spec = DELTA_SPECS["funding_rounds"]
+    assert delta_sync(spec)["total"] == 250
+    mock.reset_counts()
+
+    # Pretend the five newest rounds appeared after the last sync
+    state = load_state(spec.name)
+    records = state["records"]
+    for rid in ("0", "1", "2", "3", "4"):
+        del records[rid]
+    state["watermark"] = _as_timestamp(records["5"]["date"])
+    save_state(spec.name, state)
+
+    summary = delta_sync(spec)
+
+    assert mock.reset_counts() == {200: 1}  # stopped after page 0, nothing fetched ahead
+    assert (summary["added"], summary["removed"], summary["total"]) == (5, 0, 250)
+    assert list(load_state(spec.name)["records"]) == [str(i) for i in range(250)]
+
+
+def test_full_scan_reports_removed_records(serve):
+    spec = DELTA_SPECS["coins"]
+    serve(items=250)
+    delta_sync(spec)
+
+    serve(items=200)
+    summary = delta_sync(spec)
+
+    assert (summary["removed"], summary["total"]) == (50, 200)
+
+
+def test_empty_page_mid_crawl_is_an_error(mock):
+    spec = DELTA_SPECS["coins"]
+    delta_sync(spec)
+    before = load_state(spec.name)
+
+    page = mock._page
+    mock._page = lambda kind, params: (
+        {**page(kind, params), "content": []} if params.get("page") == "1" else page(kind, params)
+    )
+
+    with pytest.raises(RuntimeError, match="unexpectedly empty"):
+        delta_sync(spec)
+    assert load_state(spec.name) == before
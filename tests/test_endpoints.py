@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+import dropstab_timeseries
+from dropstab_endpoints import fetch_endpoint
+
+
+def _strict_json(path):
+    def reject(constant):
+        raise ValueError(f"invalid JSON constant {constant}")
+
+    return json.loads(path.read_text(encoding="utf-8"), parse_constant=reject)
+
+
+def test_fear_index_snapshot_keeps_raw_items_and_fetches_only_the_tail(mock, monkeypatch):
+    starts = []
+    fetch = dropstab_timeseries.fetch_fear_index
+    monkeypatch.setattr(dropstab_timeseries, "fetch_fear_index", lambda start: starts.append(start) or fetch(start))
+
+    first = _strict_json(fetch_endpoint("fear_index"))
+    items = first["items"]
+    assert set(items[0]) == {"timestamp", "value", "label"}  # every API field is kept
+    timestamps = [item["timestamp"] for item in items]
+    assert timestamps == sorted(set(timestamps))
+
+    second = _strict_json(fetch_endpoint("fear_index"))
+    assert starts[0] == "2010-01-01T00:00:00"
+    assert starts[1] > "2024"  # only the tail after the newest snapshot item
+    assert second["items"][: len(items)] == items
+
+
+def test_chart_snapshot_keeps_raw_items_and_fills_the_store(mock):
+    route = mock.route
+
+    def dict_points(path, params):
+        status, data = route(path, params)
+        if "chart-by-interval" in path:
+            data = [{"timestamp": p[0], "price": p[1], "totalVolume": p[2], "marketCap": p[3], "source": "mock"}
+                    for p in data]
+        return status, data
+
+    mock.route = dict_points
+    params = {"from": "2024-01-01T00:00:00", "to": "2024-03-01T00:00:00", "interval": "hour"}
+
+    items = _strict_json(fetch_endpoint("coin_chart_interval", params=params, slug="bitcoin"))["items"]
+
+    assert set(items[0]) == {"timestamp", "price", "totalVolume", "marketCap", "source"}
+    timestamps = [item["timestamp"] for item in items]
+    assert timestamps == sorted(set(timestamps)) and len(items) == 60 * 24 + 1
+    series = dropstab_timeseries.TimeSeries("bitcoin", "hour", dropstab_timeseries.CHART_COLUMNS)
+    assert series.meta()["count"] == len(items)
+
+
+def test_chart_without_range_params_is_a_clear_error(mock):
+    with pytest.raises(ValueError, match="needs the from and to query param"):
+        fetch_endpoint("coin_chart_interval", slug="bitcoin")
+    assert mock.reset_counts() == {}
@@ -0,0 +1,59 @@
+import pytest
+
+import dropstab_base
+from dropstab_export import default_snapshots, endpoint_name, load_schema, update_schema
+
+
+def _touch(name: str) -> None:
+    dropstab_base.RAW_DIR.mkdir(parents=True, exist_ok=True)
+    (dropstab_base.RAW_DIR / name).write_text('{"items": []}')
+
+
+def test_entity_snapshots_share_one_schema():
+    assert endpoint_name("data/raw/coins_all_20250101.json") == "coins_all"
+    assert endpoint_name("data/raw/exchange_pairs_binance_20250101.json") == "exchange_pairs"
+    assert endpoint_name("data/raw/coin_chart_interval_bitcoin_20250101.json") == "coin_chart_interval"
+    assert endpoint_name("data/raw/tokenUnlocks_chart_arbitrum_20250101.json") == "tokenUnlocks_chart"
+    assert endpoint_name("data/raw/tokenUnlocks_all_20250101.json") == "tokenUnlocks_all"
+
+
+def test_default_snapshots_include_pairs_and_charts(data_dir):
+    for name in (
+        "coins_all_20250101.json",
+        "coins_all_20250102.json",
+        "exchange_pairs_binance_20250101.json",
+        "exchange_pairs_binance_20250102.json",
+        "exchange_pairs_kraken_20250101.json",
+        "coin_chart_timeframe_bitcoin_20250102.json",
+        "fear_index_history_20250102.json",
+    ):
+        _touch(name)
+
+    names = sorted(path.name for path in default_snapshots())
+
+    assert names == [
+        "coin_chart_timeframe_bitcoin_20250102.json",
+        "coins_all_20250102.json",
+        "exchange_pairs_binance_20250102.json",
+        "exchange_pairs_kraken_20250101.json",
+        "fear_index_history_20250102.json",
+    ]
+
+
+def test_types_only_widen_from_null(data_dir):
+    update_schema("coins_all", [{"slug": "a", "tag": None}])
+    assert load_schema("coins_all") == {"slug": "string", "tag": "null"}
+
+    update_schema("coins_all", [{"slug": "b", "tag": 1}, {"slug": "c", "tag": 1.5}])
+    update_schema("coins_all", [{"slug": "d", "tag": None}])
+    assert load_schema("coins_all") == {"slug": "string", "tag": "float64"}
+
+
+def test_all_null_column_is_written_as_null_type(data_dir):
+    pa = pytest.importorskip("pyarrow")
+    from dropstab_export import to_table
+
+    table = to_table("coins_all", [{"slug": "a", "tag": None}, {"slug": "b", "tag": None}])
+
+    assert table.schema.field("tag").type == pa.null()
+    assert table.schema.field("slug").type == pa.string()
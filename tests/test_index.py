@@ -0,0 +1,19 @@
+import dropstab_base
+from dropstab_base import SnapshotWriter
+from dropstab_index import LocalIndex, build_index
+
+
+def test_links_follow_nested_slugs_case_insensitively(data_dir):
+    path = dropstab_base.RAW_DIR / "fundingRounds_all_20250101.json"
+    with SnapshotWriter(path, {"endpoint": "fundingRounds"}) as writer:
+        writer.write_items([
+            {"id": 1, "coin": {"slug": "Bitcoin"}, "investors": [{"slug": "A16Z"}, "paradigm", None]},
+            {"id": 2, "coinSlug": "ethereum", "leadInvestors": [{"name": "no slug"}], "funds": "a16z"},
+        ])
+    db = data_dir / "index.sqlite"
+
+    assert build_index(db) == {"funding_rounds": 2}
+    with LocalIndex(db) as index:
+        assert [r["id"] for r in index.linked("investor_rounds", "a16z")] == [1, 2]
+        assert [r["id"] for r in index.linked("investor_rounds", "paradigm")] == [1]
+        assert [r["id"] for r in index.linked("coin_rounds", "bitcoin")] == [1]
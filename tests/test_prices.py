@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+import dropstab_timeseries
+from dropstab_prices import lookup_prices
+
+
+def test_summary_counts_every_chart_request(mock, monkeypatch, capsys):
+    # One window of 16 years: above the mock's 5000-point limit, so it is split once
+    monkeypatch.setitem(dropstab_timeseries.CHUNK_SPANS, "day", timedelta(days=20 * 365))
+    pairs = [("bitcoin", f"{year}-06-01") for year in range(2008, 2025)]
+
+    rows = lookup_prices(pairs)
+
+    assert {source for *_, source in rows} == {"chart"}
+    assert mock.reset_counts() == {400: 1, 200: 2}
+    assert "1 chart ranges in 3 requests + 0 price calls (3 requests)" in capsys.readouterr().out
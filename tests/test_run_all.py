@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+import run_all_dropstab
+from run_all_dropstab import Job, PartialFailure, run_jobs
+
+
+def _statuses(results) -> dict:
+    return {r.key: r.status for r in results}
+
+
+def _interrupt():
+    raise KeyboardInterrupt
+
+
+def test_failed_dependency_skips_dependents_but_partial_does_not():
+    def fail():
+        raise ValueError("boom")
+
+    def partial():
+        raise PartialFailure("3 of 10 slugs failed")
+
+    ran = []
+    jobs = [
+        Job("a", "A", fail),
+        Job("b", "B", partial),
+        Job("after_a", "After A", lambda: ran.append("after_a"), deps=("a",)),
+        Job("after_b", "After B", lambda: ran.append("after_b"), deps=("b",)),
+    ]
+
+    results = run_jobs(jobs, max_parallel=2)
+
+    assert _statuses(results) == {"a": "failed", "b": "partial", "after_a": "skipped", "after_b": "ok"}
+    assert ran == ["after_b"]
+
+
+def test_interrupt_propagates_and_cancels_pending_jobs():
+    ran = []
+    jobs = [Job("stop", "Stop", _interrupt)] + [
+        Job(f"job{i}", f"Job {i}", lambda i=i: ran.append(i) or time.sleep(0.05)) for i in range(20)
+    ]
+
+    with pytest.raises(KeyboardInterrupt):
+        run_jobs(jobs, max_parallel=1)
+    assert len(ran) <= 2
+
+
+def test_interrupt_does_not_wait_for_running_jobs():
+    started, release = threading.Event(), threading.Event()
+    workers = []
+
+    def slow():
+        workers.append(threading.current_thread())
+        started.set()
+        release.wait(5)
+
+    def stop():
+        started.wait(5)
+        _interrupt()
+
+    jobs = [Job("slow", "Slow", slow), Job("stop", "Stop", stop)]
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            run_jobs(jobs, max_parallel=2)
+        assert not release.is_set()  # returned while "slow" was still running
+    finally:
+        release.set()
+        # Let the abandoned worker finish here, not during a later test
+        for worker in workers:
+            worker.join(5)
+
+
+def test_bulk_details_job_reports_failed_slugs(monkeypatch):
+    import dropstab_bulk
+
+    summaries = iter([
+        {"slugs": 10, "ok": 7, "failed": 3, "files": []},
+        {"slugs": 10, "ok": 0, "failed": 10, "files": []},
+    ])
+    monkeypatch.setattr(dropstab_bulk, "slugs_from_snapshot", lambda spec: ["x"])
+    monkeypatch.setattr(dropstab_bulk, "bulk_fetch", lambda spec, slugs: next(summaries))
+
+    partial = run_jobs([run_all_dropstab._details_job("coins")])[0]
+    failed = run_jobs([run_all_dropstab._details_job("coins")])[0]
+
+    assert (partial.status, partial.error) == ("partial", "3 of 10 slugs failed")
+    assert failed.status == "failed"
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+import dropstab_base
+from dropstab_base import JSON_BACKENDS, SnapshotWriter, _json_backend, atomic_write, read_json
+
+INSTALLED = [name for name in JSON_BACKENDS if _json_backend(name) is not None]
+
+ITEMS = [{"slug": "zürich-coin", "name": "Zürich Coin €", "investors": ["Ørsted", "東京"]}, {"id": 2}]
+
+
+@pytest.fixture(params=INSTALLED)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(dropstab_base, "_serializer", None)
+    return dropstab_base.set_serializer(request.param)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_snapshot_writer_writes_utf8(tmp_path, backend, compact):
+    path = tmp_path / "coins_all_20250101.json"
+    with SnapshotWriter(path, {"endpoint": "coins"}, compact=compact) as writer:
+        writer.write_items(ITEMS[:1])
+        writer.write_items(ITEMS[1:])
+
+    assert json.loads(path.read_bytes().decode("utf-8")) == {"endpoint": "coins", "items": ITEMS}
+    assert read_json(path)["items"] == ITEMS
+
+
+def test_indented_snapshot_matches_serializer(tmp_path, backend):
+    path = tmp_path / "coins_all_20250101.json"
+    with SnapshotWriter(path, {"endpoint": "coins"}, compact=False) as writer:
+        writer.write_items(ITEMS)
+
+    assert path.read_text(encoding="utf-8") == backend.dumps({"endpoint": "coins", "items": ITEMS}, indent=True)
+
+
+def test_atomic_write_writes_utf8(tmp_path, backend):
+    path = tmp_path / "nested" / "detail.json"
+    atomic_write(path, backend.dumps({"items": ITEMS}, indent=True))
+
+    assert json.loads(path.read_bytes().decode("utf-8")) == {"items": ITEMS}
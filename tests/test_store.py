@@ -0,0 +1,70 @@
+import dropstab_store
+from dropstab_base import SnapshotWriter, read_json
+from dropstab_store import SnapshotStore, archive, read_snapshot
+
+ITEMS = [{"slug": "bitcoin", "id": 1, "price": 1.5}, {"id": 2, "slug": "ether", "tags": ["l1"]}]
+
+
+def _write_raw(name: str, tag: str, items: list) -> None:
+    with SnapshotWriter(dropstab_store.RAW_DIR / f"{name}_{tag}.json", {"endpoint": "coins"}) as writer:
+        writer.write_items(items)
+
+
+def _store(data_dir) -> SnapshotStore:
+    # SnapshotStore's default directory is bound at import time, so pass it
+    return SnapshotStore(data_dir / "store")
+
+
+def _ordered(payload: dict) -> list:
+    return [list(item.items()) for item in payload["items"]]
+
+
+def test_round_trip_keeps_records_and_key_order(data_dir):
+    _write_raw("coins_all", "20250101", ITEMS)
+    # Same content, different key order: stored separately, read back as written
+    reordered = [dict(reversed(list(item.items()))) for item in ITEMS]
+    _write_raw("coins_all", "20250102", reordered)
+
+    store = _store(data_dir)
+    summary = archive(keep_raw=1, store=store)
+
+    assert summary["ingested"] == 2 and summary["removed"] == 1
+    assert _ordered(read_snapshot("coins_all", "20250101", store)) == _ordered({"items": ITEMS})
+    assert _ordered(store.read("coins_all", "20250102")) == _ordered({"items": reordered})
+
+
+def test_unchanged_records_are_stored_once(data_dir):
+    _write_raw("coins_all", "20250101", ITEMS)
+    _write_raw("coins_all", "20250102", ITEMS + [{"id": 3, "slug": "sol"}])
+
+    summary = archive(store=_store(data_dir))
+
+    assert (summary["records"], summary["new_records"]) == (5, 3)
+
+
+def test_keep_raw_zero_archives_and_removes_every_plain_file(data_dir):
+    for tag in ("20250101", "20250102"):
+        _write_raw("coins_all", tag, ITEMS)
+
+    store = _store(data_dir)
+    summary = archive(keep_raw=0, store=store)
+
+    assert summary["removed"] == 2
+    assert not list(dropstab_store.RAW_DIR.glob("*.json"))
+    assert read_snapshot("coins_all", store=store)["items"] == ITEMS
+    assert read_json(store.restore("coins_all", "20250102", data_dir / "out.json"))["items"] == ITEMS
+
+
+def test_snapshot_refetched_after_archive_is_stored_before_deletion(data_dir):
+    store = _store(data_dir)
+    _write_raw("coins_all", "20250101", [{"id": 1}])
+    archive(store=store)
+    # Same-day rerun rewrites the snapshot, then a newer day arrives
+    _write_raw("coins_all", "20250101", [{"id": 1}, {"id": 2}])
+    _write_raw("coins_all", "20250102", ITEMS)
+
+    summary = archive(store=store)
+
+    assert summary["ingested"] == 2 and summary["removed"] == 1
+    assert store.read("coins_all", "20250101")["items"] == [{"id": 1}, {"id": 2}]
+    assert archive(store=store)["ingested"] == 0  # unchanged files are not re-ingested
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+import pytest
+
+import dropstab_timeseries
+from dropstab_base import HTTPStatusError, get_client
+from dropstab_timeseries import fetch_chart_range
+
+
+def test_chunks_are_stitched_in_order_without_duplicates(mock):
+    points = fetch_chart_range("bitcoin", "2024-01-01T00:00:00", "2024-03-01T00:00:00", "hour")
+
+    timestamps = [p[0] for p in points]
+    assert timestamps == sorted(set(timestamps))
+    assert len(points) == 60 * 24 + 1
+
+
+def test_range_too_large_is_split(mock, monkeypatch):
+    # One window of a year: 8760 hourly points, above the mock's 5000-point limit
+    monkeypatch.setitem(dropstab_timeseries.CHUNK_SPANS, "hour", timedelta(days=365))
+
+    points = fetch_chart_range("bitcoin", "2024-01-01T00:00:00", "2024-12-31T00:00:00", "hour")
+
+    assert len(points) == 365 * 24 + 1  # 2024 is a leap year: Jan 1 to Dec 31 is 365 days
+    statuses = mock.reset_counts()
+    assert statuses == {400: 1, 200: 2}  # rejected once, then two halves
+
+
+def test_permanent_error_is_raised_without_splitting(mock):
+    with pytest.raises(HTTPStatusError) as excinfo:
+        fetch_chart_range("bitcoin", "2024-01-01T00:00:00", "2024-01-10T00:00:00", "fortnight")
+
+    assert excinfo.value.status == 400
+    assert mock.reset_counts() == {400: 1}
+
+
+def test_server_errors_are_not_split(serve):
+    mock = serve(error_rate=1.0)
+
+    with pytest.raises(HTTPStatusError) as excinfo:
+        fetch_chart_range("bitcoin", "2024-01-01T00:00:00", "2024-01-10T00:00:00", "hour")
+
+    assert excinfo.value.status == 503
+    # Only GET's own retries, no per-chunk retries or splitting on top
+    assert mock.reset_counts() == {503: get_client().retry.max_attempts}
+
+
+def test_slug_in_the_url_does_not_count_as_a_range_error(mock):
+    route = mock.route
+
+    def unknown_coin(path, params):
+        if path.endswith("/orange-token"):
+            raise ValueError("Coin not found")
+        return route(path, params)
+
+    mock.route = unknown_coin
+
+    with pytest.raises(HTTPStatusError) as excinfo:
+        fetch_chart_range("orange-token", "2024-01-01T00:00:00", "2024-01-10T00:00:00", "hour")
+
+    assert excinfo.value.server_message == "Coin not found"
+    assert mock.reset_counts() == {400: 1}
@@ -0,0 +1,37 @@
+import sqlite3
+
+import dropstab_base
+from dropstab_base import SnapshotWriter
+from dropstab_warehouse import load_warehouse
+
+
+def _write_rounds(tag: str, rounds: list) -> None:
+    path = dropstab_base.RAW_DIR / f"fundingRounds_all_{tag}.json"
+    with SnapshotWriter(path, {"endpoint": "fundingRounds"}) as writer:
+        writer.write_items(rounds)
+
+
+def _round_investors(db) -> list:
+    with sqlite3.connect(db) as conn:
+        return conn.execute(
+            "SELECT round_id, investor_slug, lead FROM round_investors ORDER BY 1, 2"
+        ).fetchall()
+
+
+def test_round_investors_are_replaced_by_the_current_list(data_dir):
+    db = data_dir / "warehouse.sqlite"
+    _write_rounds("20250101", [
+        {"id": 1, "date": "2025-01-01", "investors": [{"slug": "a16z"}, {"slug": "Paradigm"}],
+         "leadInvestors": [{"slug": "a16z"}]},
+        {"id": 2, "date": "2025-01-01", "investors": [{"slug": "a16z"}]},
+    ])
+    load_warehouse(db)
+    assert _round_investors(db) == [(1, "a16z", 1), (1, "paradigm", 0), (2, "a16z", 0)]
+
+    # Paradigm dropped from round 1 and a16z no longer leads it; round 2 untouched
+    _write_rounds("20250102", [
+        {"id": 1, "date": "2025-01-01", "investors": [{"slug": "a16z"}, {"slug": "sequoia"}]},
+    ])
+    load_warehouse(db)
+
+    assert _round_investors(db) == [(1, "a16z", 0), (1, "sequoia", 0), (2, "a16z", 0)]